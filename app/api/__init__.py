@@ -1,8 +1,14 @@
 from fastapi import APIRouter
-from app.api.v1 import resumes, jobs, applications
+from app.api.v1 import resumes, jobs, applications, skills, admin
+from app.services.profiler import profiling_active
 
 api_router = APIRouter()
 
 api_router.include_router(resumes.router, prefix="/resumes", tags=["Resumes"])
 api_router.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
 api_router.include_router(applications.router, prefix="/applications", tags=["Applications"])
+api_router.include_router(skills.router, prefix="/skills", tags=["Skills"])
+
+# Profile listing and downloads exist only while token-protected profiling is on
+if profiling_active():
+    api_router.include_router(admin.router, prefix="/admin", tags=["Admin"])
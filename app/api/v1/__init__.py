@@ -1,3 +1,3 @@
-from app.api.v1 import resumes, jobs, applications
+from app.api.v1 import resumes, jobs, applications, skills, admin
 
-__all__ = ["resumes", "jobs", "applications"]
+__all__ = ["resumes", "jobs", "applications", "skills", "admin"]
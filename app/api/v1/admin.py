@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import FileResponse
+from typing import List, Optional
+
+from app.schemas.admin import ProfileInfo
+from app.services.profiler import PROFILE_TOKEN_HEADER, list_profiles, profile_path, token_matches
+
+router = APIRouter()
+
+
+def require_profiling_token(
+    token: Optional[str] = Header(default=None, alias=PROFILE_TOKEN_HEADER)
+) -> None:
+    """Reject the request unless it carries settings.profiling_token."""
+    if not token_matches(token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+@router.get("/profiles", response_model=List[ProfileInfo], dependencies=[Depends(require_profiling_token)])
+async def get_profiles():
+    """List saved request profiles, newest first."""
+    return list_profiles()
+
+
+@router.get("/profiles/{name}", dependencies=[Depends(require_profiling_token)])
+async def download_profile(name: str):
+    """
+    Download a saved profile.
+
+    - `.speedscope.json` files open in https://www.speedscope.app
+    - `.collapsed.txt` files work with flamegraph.pl and speedscope
+    """
+    path = profile_path(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    media_type = "application/json" if name.endswith(".json") else "text/plain"
+    return FileResponse(path, media_type=media_type, filename=name)
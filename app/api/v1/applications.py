@@ -1,17 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, exists, literal, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional
 from uuid import UUID
+from datetime import datetime
+import uuid
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, get_read_db, read_session_for
 from app.models import Application, Resume, Job
 from app.schemas.match import ApplicationCreate, ApplicationResponse, ApplicationWithDetails
 from app.services.matching_service import get_matching_service
+from app.utils.export import export_response
+from app.utils.pagination import paginate, set_next_cursor
 
 router = APIRouter()
 
 
+def _details_query(include_candidate: bool = False):
+    """
+    Select applications joined with the job columns ApplicationWithDetails needs.
+
+    Everything comes back in one query instead of a Job lookup per row.
+
+    Args:
+        include_candidate: Also select the resume's name and email
+
+    Returns:
+        Select of rows whose keys match ApplicationWithDetails fields
+    """
+    columns = [
+        Application.id,
+        Application.resume_id,
+        Application.job_id,
+        func.coalesce(Job.title, "Unknown").label("job_title"),
+        func.coalesce(Job.company, "Unknown").label("company"),
+        Application.match_score,
+        Application.status,
+        Application.created_at,
+    ]
+    if include_candidate:
+        columns += [Resume.name.label("candidate_name"), Resume.email.label("candidate_email")]
+
+    query = select(*columns).select_from(Application).outerjoin(Job, Job.id == Application.job_id)
+    if include_candidate:
+        query = query.outerjoin(Resume, Resume.id == Application.resume_id)
+    return query
+
+
 @router.post("/", response_model=ApplicationResponse)
 async def create_application(
     application_data: ApplicationCreate,
@@ -21,63 +58,91 @@ async def create_application(
     Submit a job application.
 
     - Links resume to job posting
-    - Calculates and stores match score
+    - Calculates and stores match score from the stored embeddings
+    - Inserted with a single INSERT ... SELECT ... ON CONFLICT DO NOTHING,
+      so concurrent duplicate submissions cannot both succeed
     """
-    # Verify resume exists
-    resume = await db.get(Resume, application_data.resume_id)
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
-
-    # Verify job exists and is active
-    job = await db.get(Job, application_data.job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    if not job.is_active:
-        raise HTTPException(status_code=400, detail="Job is no longer accepting applications")
-
-    # Check if already applied
-    existing = await db.execute(
-        select(Application).where(
-            and_(
-                Application.resume_id == application_data.resume_id,
-                Application.job_id == application_data.job_id
-            )
-        )
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=400, detail="Already applied to this job")
-
-    # Calculate match score
+    # Score from the in-memory vector store (no DB fallback on this path)
     matching_service = get_matching_service()
-    match_score = await matching_service.calculate_match_score(
-        db=db,
+    match_score = matching_service.score_from_store(
         resume_id=application_data.resume_id,
         job_id=application_data.job_id
     )
 
-    # Create application
-    application = Application(
-        resume_id=application_data.resume_id,
-        job_id=application_data.job_id,
-        match_score=round(match_score, 4),
-        status="applied"
+    now = datetime.utcnow()
+    source = (
+        select(
+            literal(uuid.uuid4(), Application.id.type),
+            Resume.id,
+            Job.id,
+            literal(round(match_score, 4) if match_score is not None else None, Application.match_score.type),
+            literal("applied", Application.status.type),
+            literal(now, Application.created_at.type),
+            literal(now, Application.updated_at.type)
+        )
+        .select_from(Resume)
+        .join(Job, Job.id == application_data.job_id)
+        .where(
+            Resume.id == application_data.resume_id,
+            Job.is_active.is_(True)
+        )
+    )
+    statement = (
+        pg_insert(Application)
+        .from_select(
+            ["id", "resume_id", "job_id", "match_score", "status", "created_at", "updated_at"],
+            source
+        )
+        .on_conflict_do_nothing(constraint="uq_applications_resume_job")
+        .returning(
+            Application.id,
+            Application.resume_id,
+            Application.job_id,
+            Application.match_score,
+            Application.status,
+            Application.created_at
+        )
     )
 
-    db.add(application)
+    result = await db.execute(statement)
+    created = result.mappings().first()
+
+    if created is None:
+        # Nothing inserted: work out why in one query
+        reason = await db.execute(
+            select(
+                exists().where(Resume.id == application_data.resume_id).label("resume_exists"),
+                select(Job.is_active)
+                .where(Job.id == application_data.job_id)
+                .scalar_subquery()
+                .label("job_active")
+            )
+        )
+        row = reason.one()
+        if not row.resume_exists:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        if row.job_active is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if not row.job_active:
+            raise HTTPException(status_code=400, detail="Job is no longer accepting applications")
+        raise HTTPException(status_code=400, detail="Already applied to this job")
+
     await db.commit()
-    await db.refresh(application)
 
-    return application
+    return dict(created)
 
 
 @router.get("/", response_model=List[ApplicationWithDetails])
 async def list_applications(
+    response: Response,
     resume_id: Optional[UUID] = None,
     job_id: Optional[UUID] = None,
     status: Optional[str] = None,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
+    include_candidate: bool = Query(default=False, description="Include candidate name and email"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     List applications with optional filters.
@@ -85,8 +150,10 @@ async def list_applications(
     - Filter by resume_id to see all applications for a person
     - Filter by job_id to see all applicants for a job
     - Filter by status to see applications in specific stage
+    - Pass the `X-Next-Cursor` response header back as `cursor` to get the next page
+    - Set include_candidate for recruiter views that show who applied
     """
-    query = select(Application)
+    query = _details_query(include_candidate)
 
     if resume_id:
         query = query.where(Application.resume_id == resume_id)
@@ -95,51 +162,74 @@ async def list_applications(
     if status:
         query = query.where(Application.status == status)
 
-    query = query.order_by(Application.created_at.desc()).offset(skip).limit(limit)
+    query = paginate(query, Application, cursor, skip, limit)
 
     result = await db.execute(query)
-    applications = result.scalars().all()
-
-    # Enrich with job details
-    enriched = []
-    for app in applications:
-        job = await db.get(Job, app.job_id)
-        enriched.append(ApplicationWithDetails(
-            id=app.id,
-            resume_id=app.resume_id,
-            job_id=app.job_id,
-            job_title=job.title if job else "Unknown",
-            company=job.company if job else "Unknown",
-            match_score=app.match_score,
-            status=app.status,
-            created_at=app.created_at
-        ))
-
-    return enriched
+    rows = result.all()
+    set_next_cursor(response, rows, limit)
+
+    # Row mappings, so response_model validates each row once
+    return [row._mapping for row in rows]
+
+
+EXPORT_COLUMNS = [
+    "id", "resume_id", "candidate_name", "candidate_email", "job_id", "job_title",
+    "company", "match_score", "status", "created_at"
+]
+
+
+@router.get("/export")
+async def export_applications(
+    request: Request,
+    resume_id: Optional[UUID] = None,
+    job_id: Optional[UUID] = None,
+    status: Optional[str] = None,
+    fmt: str = Query(default="csv", alias="format", pattern="^(csv|ndjson)$")
+):
+    """
+    Export applications with job and candidate details as CSV or NDJSON.
+
+    - Same filters as the list endpoint, without paging
+    - Rows are read through a server-side cursor and streamed as they arrive
+    """
+    query = _details_query(include_candidate=True)
+    if resume_id:
+        query = query.where(Application.resume_id == resume_id)
+    if job_id:
+        query = query.where(Application.job_id == job_id)
+    if status:
+        query = query.where(Application.status == status)
+    query = query.order_by(Application.created_at, Application.id)
+
+    # The session has to outlive the handler, so it is opened inside the stream
+    session_factory = read_session_for(request)
+
+    async def batches():
+        async with session_factory() as session:
+            result = await session.stream(
+                query.execution_options(yield_per=settings.export_batch_size)
+            )
+            async for partition in result.mappings().partitions():
+                yield partition
+
+    return export_response(batches(), EXPORT_COLUMNS, fmt, "applications")
 
 
 @router.get("/{application_id}", response_model=ApplicationWithDetails)
 async def get_application(
     application_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    include_candidate: bool = Query(default=False, description="Include candidate name and email"),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get application details by ID."""
-    application = await db.get(Application, application_id)
-    if not application:
+    result = await db.execute(
+        _details_query(include_candidate).where(Application.id == application_id)
+    )
+    row = result.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    job = await db.get(Job, application.job_id)
-
-    return ApplicationWithDetails(
-        id=application.id,
-        resume_id=application.resume_id,
-        job_id=application.job_id,
-        job_title=job.title if job else "Unknown",
-        company=job.company if job else "Unknown",
-        match_score=application.match_score,
-        status=application.status,
-        created_at=application.created_at
-    )
+    return ApplicationWithDetails(**row._mapping)
 
 
 @router.patch("/{application_id}/status")
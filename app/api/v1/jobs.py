@@ -1,16 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List, Optional
 from uuid import UUID
 
-from app.database import get_db
-from app.models import Job
-from app.schemas.job import JobCreate, JobUpdate, JobResponse
+from app.database import get_db, get_read_db, read_session_for
+from app.models import Job, Resume
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobBulkResponse
 from app.schemas.match import CandidateMatchResponse
-from app.services.embedding_service import get_embedding_service
+from app.services.embedding_service import EmbeddingService, get_embedding_service
 from app.services.vector_store import get_vector_store
 from app.services.matching_service import get_matching_service
+from app.services.job_import import import_jobs
+from app.utils.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.utils.export import export_response
+from app.utils.pagination import paginate, set_next_cursor
 from app.config import settings
 
 router = APIRouter()
@@ -69,35 +73,87 @@ async def create_job(
     return job
 
 
+@router.post("/bulk", response_model=JobBulkResponse)
+async def bulk_create_jobs(
+    jobs_data: List[JobCreate],
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many job postings in one request (e.g. an employer's CSV export).
+
+    - Embeds all postings in batched encoder calls
+    - Inserts rows with a single bulk INSERT and writes the vector store once
+    """
+    if len(jobs_data) > settings.bulk_max_jobs:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many jobs. Maximum per request: {settings.bulk_max_jobs}"
+        )
+
+    return await import_jobs(db, jobs_data)
+
+
 @router.get("/", response_model=List[JobResponse])
 async def list_jobs(
+    request: Request,
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
     location: Optional[str] = None,
     is_active: bool = True,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List all job postings with optional filters."""
-    query = select(Job).where(Job.is_active == is_active)
+    """
+    List all job postings with optional filters.
 
+    - Pass the `X-Next-Cursor` response header back as `cursor` to get the next page
+    - Supports `If-None-Match`; the ETag covers the ids and updated_at of the page
+    """
+    filters = [Job.is_active == is_active]
     if location:
-        query = query.where(Job.location.ilike(f"%{location}%"))
+        filters.append(Job.location.ilike(f"%{location}%"))
 
-    query = query.order_by(Job.created_at.desc()).offset(skip).limit(limit)
+    # Page keys first: cheap, and enough to answer a conditional request
+    keys_result = await db.execute(
+        paginate(select(Job.id, Job.created_at, Job.updated_at).where(*filters), Job, cursor, skip, limit)
+    )
+    keys = keys_result.all()
+    etag = make_etag("jobs", [(row.id, row.updated_at) for row in keys], skip, limit, cursor, location, is_active)
+    if etag_matches(request, etag):
+        not_modified_response = not_modified(etag)
+        set_next_cursor(not_modified_response, keys, limit)
+        return not_modified_response
 
-    result = await db.execute(query)
-    return result.scalars().all()
+    result = await db.execute(paginate(select(Job).where(*filters), Job, cursor, skip, limit))
+    jobs = result.scalars().all()
+    set_next_cursor(response, jobs, limit)
+    set_cache_headers(response, etag)
+    return jobs
 
 
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
+    request: Request,
+    response: Response,
     job_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get job details by ID."""
+    """
+    Get job details by ID.
+
+    - Supports `If-None-Match`; the ETag changes whenever the job is updated
+    """
+    updated = await db.execute(select(Job.updated_at).where(Job.id == job_id))
+    updated_at = updated.scalar_one_or_none()
+    etag = make_etag("job", job_id, updated_at)
+    if updated_at is not None and etag_matches(request, etag):
+        return not_modified(etag)
+
     job = await db.get(Job, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
+    set_cache_headers(response, etag)
     return job
 
 
@@ -169,7 +225,7 @@ async def get_job_candidates(
     job_id: UUID,
     limit: int = Query(default=10, ge=1, le=50),
     min_score: float = Query(default=None, ge=0, le=1),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get matching candidates/resumes for a job.
@@ -188,3 +244,58 @@ async def get_job_candidates(
         return matches
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/{job_id}/candidates/export")
+async def export_job_candidates(
+    request: Request,
+    job_id: UUID,
+    min_score: float = Query(default=None, ge=0, le=1),
+    fmt: str = Query(default="csv", alias="format", pattern="^(csv|ndjson)$"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Export every candidate's match score for a job as CSV or NDJSON.
+
+    - Resumes are read through a server-side cursor and scored against the
+      stored job embedding batch by batch, so memory stays flat
+    - Rows come in upload order, not sorted by score
+    """
+    job = await db.get(Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    vector_store = get_vector_store()
+    job_embedding = vector_store.get_job_embedding(str(job_id))
+    if not job_embedding:
+        raise HTTPException(status_code=409, detail="Job has no stored embedding")
+
+    min_score = min_score if min_score is not None else settings.match_threshold
+    session_factory = read_session_for(request)
+    query = (
+        select(Resume.id.label("resume_id"), Resume.name, Resume.email, Resume.skills)
+        .order_by(Resume.created_at, Resume.id)
+        .execution_options(yield_per=settings.export_batch_size)
+    )
+
+    async def batches():
+        async with session_factory() as session:
+            result = await session.stream(query)
+            async for partition in result.mappings().partitions():
+                scored = []
+                for row in partition:
+                    embedding = vector_store.get_resume_embedding(str(row["resume_id"]))
+                    if not embedding:
+                        continue
+                    score = EmbeddingService.cosine_similarity(job_embedding, embedding)
+                    if score >= min_score:
+                        scored.append({**row, "job_id": job_id, "match_score": round(score, 4)})
+                if scored:
+                    yield scored
+
+    return export_response(
+        batches(),
+        ["job_id", "resume_id", "name", "email", "skills", "match_score"],
+        fmt,
+        f"job-{job_id}-candidates"
+    )
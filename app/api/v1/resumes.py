@@ -1,118 +1,249 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import load_only, undefer
 from typing import List, Optional
 from uuid import UUID
+import time
+from datetime import datetime, timedelta
 
-from app.database import get_db
-from app.models import Resume
-from app.schemas.resume import ResumeResponse, ResumeExtractedData
+from app.database import get_db, get_read_db
+from app.models import Resume, IngestJob, Job
+from app.schemas.resume import ResumeResponse, IngestStatusResponse
 from app.schemas.match import MatchResponse
 from app.utils.file_handler import file_handler
-from app.services.resume_parser import resume_parser
-from app.services.nlp_extractor import nlp_extractor
-from app.services.embedding_service import get_embedding_service
+from app.utils.etag import etag_matches, make_etag, not_modified, set_cache_headers
+from app.utils.pagination import paginate, set_next_cursor
+from app.utils.serialization import dumps_line
+from app.services.ingest_pipeline import FINISHED_STATUSES, IngestItem, IngestQueueFull, get_ingest_pipeline
+from app.services.bulk_import import import_resumes
 from app.services.vector_store import get_vector_store
 from app.services.matching_service import get_matching_service
 from app.config import settings
 
 router = APIRouter()
 
+# Only the columns ResumeResponse serializes
+RESPONSE_COLUMNS = load_only(
+    Resume.id, Resume.filename, Resume.name, Resume.email, Resume.phone,
+    Resume.skills, Resume.education, Resume.experience, Resume.created_at
+)
 
-@router.post("/upload", response_model=dict)
+
+async def _link_to_existing(
+    db: AsyncSession,
+    existing: Resume,
+    filename: str
+) -> Optional[Resume]:
+    """
+    Create a new resume record that reuses an existing upload's artifacts.
+
+    Copies the parsed text, extracted fields and stored embedding of a
+    resume with the same content hash. Returns None when the existing
+    embedding is missing, in which case the upload goes through the
+    pipeline as usual.
+    """
+    vector_store = get_vector_store()
+    embedding = vector_store.get_resume_embedding(str(existing.id))
+    if not embedding:
+        return None
+
+    resume = Resume(
+        filename=filename,
+        file_path=existing.file_path,
+        content_hash=existing.content_hash,
+        raw_text=existing.raw_text,
+        name=existing.name,
+        email=existing.email,
+        phone=existing.phone,
+        skills=existing.skills,
+        education=existing.education,
+        experience=existing.experience,
+        extractor_version=existing.extractor_version
+    )
+    db.add(resume)
+    await db.flush()
+
+    vector_store.add_resume(
+        resume_id=str(resume.id),
+        embedding=embedding,
+        metadata={
+            "name": resume.name,
+            "skills": ", ".join(resume.skills) if resume.skills else ""
+        }
+    )
+    resume.embedding_id = str(resume.id)
+    return resume
+
+
+async def _in_flight_job(db: AsyncSession, content_hash: str) -> Optional[IngestJob]:
+    """
+    Unfinished ingest job for this content that is still making progress.
+
+    Live jobs are touched by the pipeline regularly; one that went quiet
+    was lost (crash, restart) and must not block this content forever.
+    """
+    stale_cutoff = datetime.utcnow() - timedelta(seconds=settings.ingest_stale_after)
+    result = await db.execute(
+        select(IngestJob)
+        .where(
+            IngestJob.content_hash == content_hash,
+            IngestJob.status.notin_(FINISHED_STATUSES),
+            IngestJob.updated_at >= stale_cutoff
+        )
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+@router.post("/upload", response_model=IngestStatusResponse, status_code=202)
 async def upload_resume(
+    response: Response,
     file: UploadFile = File(...),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Upload a resume PDF file.
 
-    - Extracts text from PDF
-    - Uses NLP to extract skills, education, experience
-    - Generates embeddings for matching
-    - Stores in database and vector store
+    - Saves the file and returns 202 with an ingest id right away
+    - Parsing, NLP extraction, embedding and indexing run in the background
+    - Poll `GET /resumes/ingest/{ingest_id}` for status and the resulting resume_id
+    - Re-uploads of an identical file skip processing and return 200 with a
+      completed ingest job (see `DUPLICATE_UPLOAD_POLICY`)
     """
     # Validate file
     is_valid, error = file_handler.validate_file(file)
     if not is_valid:
         raise HTTPException(status_code=400, detail=error)
 
+    start = time.perf_counter()
     try:
-        # Save file
-        saved_filename, file_path = await file_handler.save_file(file)
+        saved_filename, file_path, content_hash = await file_handler.save_file(file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    save_time = round(time.perf_counter() - start, 4)
+
+    # Same content already being processed: hand back that ingest job
+    in_flight_job = await _in_flight_job(db, content_hash)
+    if in_flight_job:
+        return in_flight_job
 
-        # Parse PDF
-        raw_text = resume_parser.parse(file_path)
+    # Stale ones would block the new job through uq_ingest_jobs_unfinished_hash
+    stale_cutoff = datetime.utcnow() - timedelta(seconds=settings.ingest_stale_after)
+    await db.execute(
+        update(IngestJob)
+        .where(
+            IngestJob.content_hash == content_hash,
+            IngestJob.status.notin_(FINISHED_STATUSES),
+            IngestJob.updated_at < stale_cutoff
+        )
+        .values(status="failed", error="Stopped making progress; superseded by a new upload")
+    )
+
+    # Same content already processed: reuse the stored artifacts
+    existing_result = await db.execute(
+        select(Resume)
+        .options(undefer(Resume.raw_text))
+        .where(Resume.content_hash == content_hash)
+        .order_by(Resume.created_at)
+        .limit(1)
+    )
+    existing = existing_result.scalar_one_or_none()
+    if existing:
+        resume = existing
+        if settings.duplicate_upload_policy == "link":
+            resume = await _link_to_existing(db, existing, file.filename)
 
-        # Extract information using NLP
-        extracted = nlp_extractor.extract(raw_text)
+        if resume:
+            ingest_job = IngestJob(
+                filename=file.filename,
+                file_path=file_path,
+                content_hash=content_hash,
+                status="completed",
+                timings={"save": save_time},
+                resume_id=resume.id
+            )
+            db.add(ingest_job)
+            await db.commit()
+            response.status_code = 200
+            return ingest_job
 
-        # Create resume record
-        resume = Resume(
+    ingest_job = IngestJob(
+        filename=file.filename,
+        file_path=file_path,
+        content_hash=content_hash,
+        status="queued",
+        timings={"save": save_time}
+    )
+    db.add(ingest_job)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # An identical upload queued its job between the check above and this insert
+        await db.rollback()
+        in_flight_job = await _in_flight_job(db, content_hash)
+        if in_flight_job:
+            return in_flight_job
+        raise
+
+    try:
+        get_ingest_pipeline().submit(IngestItem(
+            ingest_id=ingest_job.id,
             filename=file.filename,
             file_path=file_path,
-            raw_text=raw_text,
-            name=extracted.name,
-            email=extracted.email,
-            phone=extracted.phone,
-            skills=extracted.skills,
-            education=[vars(e) if hasattr(e, '__dict__') else e for e in extracted.education],
-            experience=[vars(e) if hasattr(e, '__dict__') else e for e in extracted.experience]
-        )
+            content_hash=content_hash,
+            timings={"save": save_time}
+        ))
+    except IngestQueueFull as e:
+        # The stored file is kept: it is content-addressed and a retry reuses it
+        ingest_job.status = "failed"
+        ingest_job.error = str(e)
+        await db.commit()
+        raise HTTPException(status_code=503, detail=str(e))
 
-        db.add(resume)
-        await db.flush()
+    return ingest_job
 
-        # Generate and store embedding
-        embedding_service = get_embedding_service()
-        embedding_text = embedding_service.create_resume_embedding_text(
-            skills=extracted.skills,
-            experience=extracted.experience,
-            education=extracted.education
-        )
-        embedding = embedding_service.generate_embedding(embedding_text)
-
-        # Store in vector database
-        vector_store = get_vector_store()
-        vector_store.add_resume(
-            resume_id=str(resume.id),
-            embedding=embedding,
-            metadata={
-                "name": extracted.name,
-                "skills": ", ".join(extracted.skills) if extracted.skills else ""
-            }
-        )
 
-        resume.embedding_id = str(resume.id)
-        await db.commit()
+@router.post("/bulk")
+async def bulk_upload_resumes(
+    files: List[UploadFile] = File(...)
+):
+    """
+    Import many resume PDFs at once (e.g. a job-fair batch).
 
-        return {
-            "id": resume.id,
-            "filename": file.filename,
-            "message": "Resume uploaded and processed successfully",
-            "extracted_data": {
-                "name": extracted.name,
-                "email": extracted.email,
-                "phone": extracted.phone,
-                "skills": extracted.skills,
-                "education": extracted.education,
-                "experience": extracted.experience
-            }
-        }
+    - Accepts several PDF files and/or zip archives of PDFs
+    - Parses and extracts in worker processes, embeds in large batches
+    - Inserts resumes with one bulk INSERT and one vector store write per batch
+    - Streams one NDJSON line per file as it finishes, then a summary line
+    """
+    async def results():
+        async for result in import_resumes(files):
+            yield dumps_line(result)
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+
+@router.get("/ingest/{ingest_id}", response_model=IngestStatusResponse)
+async def get_ingest_status(
+    ingest_id: UUID,
+    db: AsyncSession = Depends(get_db)
+):
+    """Get processing status and per-stage timings for an uploaded resume."""
+    ingest_job = await db.get(IngestJob, ingest_id)
+    if not ingest_job:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return ingest_job
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: UUID,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get resume details by ID."""
-    resume = await db.get(Resume, resume_id)
+    resume = await db.get(Resume, resume_id, options=[RESPONSE_COLUMNS])
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     return resume
@@ -120,25 +251,45 @@ async def get_resume(
 
 @router.get("/{resume_id}/matches", response_model=List[MatchResponse])
 async def get_resume_matches(
+    request: Request,
+    response: Response,
     resume_id: UUID,
     limit: int = Query(default=10, ge=1, le=50),
     min_score: float = Query(default=None, ge=0, le=1),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get matching jobs for a resume.
 
     - Uses vector similarity to find best matching jobs
     - Returns jobs sorted by match score
+    - Supports `If-None-Match`; the ETag covers the resume, the job rows and
+      the vector store version, so a match skips scoring entirely
     """
+    min_score = min_score or settings.match_threshold
+
+    state = await db.execute(select(
+        select(Resume.updated_at).where(Resume.id == resume_id).scalar_subquery(),
+        func.count(Job.id),
+        func.max(Job.updated_at)
+    ))
+    resume_updated_at, job_count, jobs_updated_at = state.one()
+    etag = make_etag(
+        "matches", resume_id, resume_updated_at, job_count, jobs_updated_at,
+        get_vector_store().version, limit, min_score
+    )
+    if resume_updated_at is not None and etag_matches(request, etag):
+        return not_modified(etag)
+
     try:
         matching_service = get_matching_service()
         matches = await matching_service.get_matching_jobs_for_resume(
             db=db,
             resume_id=resume_id,
             limit=limit,
-            min_score=min_score or settings.match_threshold
+            min_score=min_score
         )
+        set_cache_headers(response, etag)
         return matches
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -146,18 +297,22 @@ async def get_resume_matches(
 
 @router.get("/", response_model=List[ResumeResponse])
 async def list_resumes(
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(default=None, description="X-Next-Cursor from the previous page"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List all resumes with pagination."""
-    result = await db.execute(
-        select(Resume)
-        .order_by(Resume.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
-    return result.scalars().all()
+    """
+    List all resumes with pagination.
+
+    - Pass the `X-Next-Cursor` response header back as `cursor` to get the next page
+    """
+    query = select(Resume).options(RESPONSE_COLUMNS)
+    result = await db.execute(paginate(query, Resume, cursor, skip, limit))
+    resumes = result.scalars().all()
+    set_next_cursor(response, resumes, limit)
+    return resumes
 
 
 @router.delete("/{resume_id}")
@@ -174,8 +329,14 @@ async def delete_resume(
     vector_store = get_vector_store()
     vector_store.delete_resume(str(resume_id))
 
-    # Delete file
-    file_handler.delete_file(resume.file_path)
+    # Delete file unless another resume shares the same stored upload
+    shared = await db.scalar(
+        select(func.count())
+        .select_from(Resume)
+        .where(Resume.file_path == resume.file_path, Resume.id != resume_id)
+    )
+    if not shared:
+        file_handler.delete_file(resume.file_path)
 
     # Delete from database
     await db.delete(resume)
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, HTTPException
+from typing import List, Optional
+
+from app.schemas.skill import SkillResponse, SkillsTaxonomyInfo
+from app.services.skills_taxonomy import get_skills_taxonomy, reload_skills_taxonomy
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SkillResponse])
+async def list_skills(category: Optional[str] = None):
+    """List skills in the active taxonomy, optionally filtered by category."""
+    taxonomy = get_skills_taxonomy()
+    skills = taxonomy.skills.values()
+    if category:
+        skills = [s for s in skills if (s.category or "").lower() == category.lower()]
+    return [
+        SkillResponse(id=s.id, name=s.name, category=s.category, aliases=list(s.aliases))
+        for s in skills
+    ]
+
+
+@router.get("/taxonomy", response_model=SkillsTaxonomyInfo)
+async def get_taxonomy_info():
+    """Get version and size of the active skills taxonomy."""
+    taxonomy = get_skills_taxonomy()
+    return SkillsTaxonomyInfo(
+        version=taxonomy.version,
+        count=len(taxonomy),
+        categories=taxonomy.categories()
+    )
+
+
+@router.post("/reload", response_model=SkillsTaxonomyInfo)
+async def reload_taxonomy():
+    """
+    Reload the skills taxonomy from its data file.
+
+    - Swaps the compiled index atomically; in-flight extractions finish on the old one
+    - Other workers pick up the change through the file watcher
+    """
+    try:
+        taxonomy = reload_skills_taxonomy()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return SkillsTaxonomyInfo(
+        version=taxonomy.version,
+        count=len(taxonomy),
+        categories=taxonomy.categories()
+    )
@@ -1,13 +1,46 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from app.config import settings
 
+# Set on responses to write requests; while fresh, that client's reads go to the primary
+LAST_WRITE_COOKIE = "nagamatch_last_write"
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True
-)
+
+def _engine_options(database_url: str) -> dict:
+    """
+    Build engine keyword arguments from settings.
+
+    Args:
+        database_url: SQLAlchemy URL of the primary or the read replica
+    """
+    url = make_url(database_url)
+    options = {
+        "echo": settings.db_echo,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
+    if url.drivername.endswith("+asyncpg"):
+        # asyncpg's own statement cache plus SQLAlchemy's prepared statement cache.
+        # Set both to 0 when running behind pgbouncer in transaction mode.
+        url = url.update_query_dict({
+            "prepared_statement_cache_size": str(settings.db_statement_cache_size)
+        })
+        options["connect_args"] = {"statement_cache_size": settings.db_statement_cache_size}
+
+    return {"url": url, **options}
+
+
+engine = create_async_engine(**_engine_options(settings.database_url))
 
 async_session = async_sessionmaker(
     engine,
@@ -15,6 +48,133 @@ async_session = async_sessionmaker(
     expire_on_commit=False
 )
 
+# Optional read replica; falls back to the primary when not configured
+read_engine = (
+    create_async_engine(**_engine_options(settings.database_read_url))
+    if settings.database_read_url
+    else engine
+)
+
+read_session = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+
+# Pool usage counters per engine
+_pool_stats = {}
+
+
+def _track_pool(tracked: AsyncEngine) -> None:
+    stats = _pool_stats[tracked] = {"checkouts": 0, "peak_checked_out": 0}
+
+    @event.listens_for(tracked.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats["checkouts"] += 1
+        checked_out = tracked.sync_engine.pool.checkedout()
+        if checked_out > stats["peak_checked_out"]:
+            stats["peak_checked_out"] = checked_out
+
+
+_track_pool(engine)
+if read_engine is not engine:
+    _track_pool(read_engine)
+
+
+# Query count and DB time of the current request (None outside a request)
+_query_stats: ContextVar[Optional[Dict[str, Any]]] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats() -> Dict[str, Any]:
+    """Begin counting queries for the current request and return the live counters."""
+    stats = {"queries": 0, "seconds": 0.0}
+    _query_stats.set(stats)
+    return stats
+
+
+def _redact(parameters: Any) -> Any:
+    """Replace bound values with their type names so slow-query logs carry no user data."""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return [_redact(parameters[0]), f"... {len(parameters)} rows"]
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _track_queries(tracked: AsyncEngine) -> None:
+    @event.listens_for(tracked.sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(tracked.sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+
+        stats = _query_stats.get()
+        if stats is not None:
+            stats["queries"] += 1
+            stats["seconds"] += elapsed
+
+        if elapsed * 1000 >= settings.db_slow_query_ms:
+            from app.services.metrics import record_slow_query  # app.services imports this module
+            record_slow_query()
+            print(
+                f"Slow query ({elapsed * 1000:.1f} ms): {' '.join(statement.split())} "
+                f"params={_redact(parameters)}"
+            )
+
+    @event.listens_for(tracked.sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        # Failed statements never reach after_cursor_execute
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start"):
+            connection.info["query_start"].pop()
+
+
+_track_queries(engine)
+if read_engine is not engine:
+    _track_queries(read_engine)
+
+
+def get_pool_stats(tracked: Optional[AsyncEngine] = None) -> dict:
+    """
+    Snapshot of connection pool usage.
+
+    saturation is checked_out / (pool_size + max_overflow); values near 1.0
+    mean requests are waiting for connections and the pool (or the worker
+    count) needs resizing.
+
+    Args:
+        tracked: Engine to report on (default: the primary)
+    """
+    tracked = tracked or engine
+    pool = tracked.sync_engine.pool
+    stats = _pool_stats[tracked]
+    capacity = settings.db_pool_size + settings.db_max_overflow
+    checked_out = pool.checkedout()
+    return {
+        "pool_size": pool.size(),
+        "max_overflow": settings.db_max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": pool.overflow(),
+        "saturation": round(checked_out / capacity, 4) if capacity else None,
+        "peak_checked_out": stats["peak_checked_out"],
+        "checkouts": stats["checkouts"],
+    }
+
+
+def wrote_recently(request: Request) -> bool:
+    """Whether this client made a write within settings.read_your_writes_window."""
+    try:
+        last_write = float(request.cookies.get(LAST_WRITE_COOKIE, 0))
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.read_your_writes_window
+
 
 class Base(DeclarativeBase):
     pass
@@ -32,6 +192,26 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def read_session_for(request: Request) -> async_sessionmaker:
+    """Session factory for this client's reads: the primary if it wrote recently, else the replica."""
+    return async_session if wrote_recently(request) else read_session
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """
+    Session for read-only handlers.
+
+    Uses the read replica when one is configured, except for clients that
+    wrote recently: they read from the primary so they see their own
+    changes despite replication lag.
+    """
+    async with read_session_for(request)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -1,11 +1,22 @@
-from fastapi import FastAPI
+import time
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import os
 
 from app.config import settings
-from app.database import init_db
+from app.database import (
+    LAST_WRITE_COOKIE, init_db, get_pool_stats, engine, read_engine, start_query_stats
+)
 from app.api import api_router
+from app.services.ingest_pipeline import get_ingest_pipeline
+from app.services.metrics import (
+    REQUEST_DB_QUERIES, REQUEST_DB_SECONDS, REQUEST_SECONDS, render_metrics, route_template
+)
+from app.services.profiler import (
+    PROFILE_ID_HEADER, profiling_unavailable_reason, save_profile, should_profile, start_profiler
+)
+from app.utils.file_handler import UploadSizeLimit
 
 
 @asynccontextmanager
@@ -22,9 +33,14 @@ async def lifespan(app: FastAPI):
     await init_db()
     print("Database initialized")
 
+    # Start background resume ingest workers
+    ingest_pipeline = get_ingest_pipeline()
+    ingest_pipeline.start()
+
     yield
 
     # Shutdown
+    await ingest_pipeline.stop()
     print("Shutting down NagaMatch API...")
 
 
@@ -58,8 +74,78 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Profile-Id", "X-DB-Queries", "X-DB-Time-Ms", "ETag"],
 )
 
+@app.middleware("http")
+async def mark_writes(request: Request, call_next):
+    """Remember successful writes so the client's next reads skip the replica."""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            str(time.time()),
+            max_age=max(1, int(settings.read_your_writes_window)),
+            httponly=True
+        )
+    return response
+
+
+if settings.metrics_enabled:
+    @app.middleware("http")
+    async def record_request_latency(request: Request, call_next):
+        """Observe request latency labelled by route template (not raw path)."""
+        start = time.perf_counter()
+        response = await call_next(request)
+        REQUEST_SECONDS.labels(request.method, route_template(request), str(response.status_code)).observe(
+            time.perf_counter() - start
+        )
+        return response
+
+
+if settings.profiling_enabled and profiling_unavailable_reason():
+    print(f"WARNING: PROFILING_ENABLED is set but {profiling_unavailable_reason()}; profiling is off")
+elif settings.profiling_enabled:
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        """Profile requests selected by the X-Profile header or the sample rate."""
+        profiler = start_profiler() if should_profile(request) else None
+        if profiler is None:
+            return await call_next(request)
+
+        try:
+            response = await call_next(request)
+        finally:
+            name = save_profile(profiler, request)
+        response.headers[PROFILE_ID_HEADER] = name
+        return response
+
+
+@app.middleware("http")
+async def account_queries(request: Request, call_next):
+    """
+    Count SQL statements and DB time per request.
+
+    Reported as X-DB-Queries / X-DB-Time-Ms headers in debug mode and as
+    histograms when metrics are enabled. Statements issued while a
+    streaming response body is sent are not included.
+    """
+    stats = start_query_stats()
+    response = await call_next(request)
+
+    if settings.debug:
+        response.headers["X-DB-Queries"] = str(stats["queries"])
+        response.headers["X-DB-Time-Ms"] = f"{stats['seconds'] * 1000:.1f}"
+    if settings.metrics_enabled:
+        route = route_template(request)
+        REQUEST_DB_QUERIES.labels(route).observe(stats["queries"])
+        REQUEST_DB_SECONDS.labels(route).observe(stats["seconds"])
+    return response
+
+
+# Outermost, so oversized uploads are refused before anything reads the body
+app.add_middleware(UploadSizeLimit)
+
 # Include API routes
 app.include_router(api_router, prefix=settings.api_v1_prefix)
 
@@ -78,5 +164,15 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    """Health check endpoint with database pool usage."""
+    health = {"status": "healthy", "db_pool": get_pool_stats()}
+    if read_engine is not engine:
+        health["db_read_pool"] = get_pool_stats(read_engine)
+    return health
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus scrape endpoint."""
+        return Response(render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
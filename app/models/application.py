@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Float, ForeignKey
+from sqlalchemy import Column, String, DateTime, Float, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -8,6 +8,16 @@ from app.database import Base
 
 class Application(Base):
     __tablename__ = "applications"
+    __table_args__ = (
+        # One application per resume and job; also serves lookups by resume_id
+        UniqueConstraint("resume_id", "job_id", name="uq_applications_resume_job"),
+        # list_applications filters, newest first (id breaks ties for keyset pagination)
+        Index("ix_applications_resume_created", "resume_id", "created_at", "id"),
+        Index("ix_applications_job_created", "job_id", "created_at", "id"),
+        Index("ix_applications_job_status_created", "job_id", "status", "created_at", "id"),
+        Index("ix_applications_status_created", "status", "created_at", "id"),
+        Index("ix_applications_created", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id"), nullable=False)
@@ -0,0 +1,40 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, Text, DateTime, JSON, ForeignKey, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+FINISHED_STATUSES = ("completed", "failed")
+
+_UNFINISHED = text("status NOT IN (%s)" % ", ".join(f"'{status}'" for status in FINISHED_STATUSES))
+
+
+class IngestJob(Base):
+    __tablename__ = "ingest_jobs"
+    __table_args__ = (
+        # At most one unfinished job per content: concurrent identical
+        # uploads cannot both be queued
+        Index(
+            "uq_ingest_jobs_unfinished_hash",
+            "content_hash",
+            unique=True,
+            postgresql_where=_UNFINISHED,
+            sqlite_where=_UNFINISHED
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    filename = Column(String(255), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)
+
+    status = Column(String(50), default="queued")  # queued, parsing, extracting, embedding, indexing, completed, failed
+    error = Column(Text, nullable=True)
+    timings = Column(JSON, default=dict)  # Seconds spent in each stage
+    truncated = Column(Boolean, default=False)  # PDF parse stopped at a page, size or time budget
+    truncated_reason = Column(String(50), nullable=True)
+
+    resume_id = Column(UUID(as_uuid=True), ForeignKey("resumes.id", ondelete="SET NULL"), nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, JSON, Boolean, Integer
+from sqlalchemy import Column, String, Text, DateTime, JSON, Boolean, Integer, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -8,6 +8,17 @@ from app.database import Base
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        # list_jobs: WHERE is_active = ? ORDER BY created_at DESC, id DESC
+        Index("ix_jobs_active_created", "is_active", "created_at", "id"),
+        # location ILIKE '%...%' search
+        Index(
+            "ix_jobs_location_trgm",
+            "location",
+            postgresql_using="gin",
+            postgresql_ops={"location": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
@@ -28,3 +39,11 @@ class Job(Base):
 
     # Relationships
     applications = relationship("Application", back_populates="job")
+
+
+# The trigram index needs pg_trgm; create it before the tables
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
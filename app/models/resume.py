@@ -1,18 +1,26 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, DateTime, JSON
+from sqlalchemy import Column, String, Text, DateTime, JSON, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
+from app.config import settings
 from app.database import Base
 
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # list_resumes: ORDER BY created_at DESC, id DESC
+        Index("ix_resumes_created", "created_at", "id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     filename = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
-    raw_text = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # SHA-256 of the uploaded file
+    # Full parsed text is large and never returned by the API; load it
+    # explicitly with undefer(Resume.raw_text) where it is needed
+    raw_text = deferred(Column(Text, nullable=True), raiseload=True)
 
     # Extracted information
     name = Column(String(255), nullable=True)
@@ -21,6 +29,7 @@ class Resume(Base):
     skills = Column(JSON, default=list)
     education = Column(JSON, default=list)
     experience = Column(JSON, default=list)
+    extractor_version = Column(String(50), nullable=True)  # NLPExtractor.version used for the fields above
 
     # Vector store reference
     embedding_id = Column(String(255), nullable=True)
@@ -30,3 +39,14 @@ class Resume(Base):
 
     # Relationships
     applications = relationship("Application", back_populates="resume")
+
+
+# Compress raw_text with a specific TOAST method (PostgreSQL 14+)
+if settings.db_text_compression:
+    event.listen(
+        Resume.__table__,
+        "after_create",
+        DDL(
+            f"ALTER TABLE resumes ALTER COLUMN raw_text SET COMPRESSION {settings.db_text_compression}"
+        ).execute_if(dialect="postgresql")
+    )
@@ -3,10 +3,13 @@ from app.schemas.resume import (
     ResumeResponse,
     ResumeExtractedData,
     EducationItem,
-    ExperienceItem
+    ExperienceItem,
+    IngestStatusResponse
 )
-from app.schemas.job import JobCreate, JobUpdate, JobResponse
+from app.schemas.job import JobCreate, JobUpdate, JobResponse, JobBulkResponse
 from app.schemas.match import MatchResponse, ApplicationCreate, ApplicationResponse
+from app.schemas.skill import SkillResponse, SkillsTaxonomyInfo
+from app.schemas.admin import ProfileInfo
 
 __all__ = [
     "ResumeCreate",
@@ -14,10 +17,15 @@ __all__ = [
     "ResumeExtractedData",
     "EducationItem",
     "ExperienceItem",
+    "IngestStatusResponse",
     "JobCreate",
     "JobUpdate",
     "JobResponse",
+    "JobBulkResponse",
     "MatchResponse",
     "ApplicationCreate",
-    "ApplicationResponse"
+    "ApplicationResponse",
+    "SkillResponse",
+    "SkillsTaxonomyInfo",
+    "ProfileInfo"
 ]
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+from datetime import datetime
+
+
+class ProfileInfo(BaseModel):
+    name: str
+    size: int
+    created_at: datetime
@@ -42,3 +42,10 @@ class JobResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class JobBulkResponse(BaseModel):
+    created: int
+    job_ids: List[UUID] = []
+    seconds: float
+    jobs_per_sec: Optional[float] = None
@@ -48,3 +48,5 @@ class ApplicationWithDetails(BaseModel):
     match_score: Optional[float] = None
     status: str
     created_at: datetime
+    candidate_name: Optional[str] = None
+    candidate_email: Optional[str] = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional, List
+from typing import Optional, List, Dict
 from uuid import UUID
 from datetime import datetime
 
@@ -55,3 +55,19 @@ class ResumeUploadResponse(BaseModel):
     filename: str
     extracted_data: ResumeExtractedData
     message: str
+
+
+class IngestStatusResponse(BaseModel):
+    id: UUID
+    filename: str
+    status: str
+    error: Optional[str] = None
+    timings: Dict[str, float] = {}
+    truncated: bool = False
+    truncated_reason: Optional[str] = None
+    resume_id: Optional[UUID] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+
+
+class SkillResponse(BaseModel):
+    id: str
+    name: str
+    category: Optional[str] = None
+    aliases: List[str] = []
+
+
+class SkillsTaxonomyInfo(BaseModel):
+    version: Optional[str] = None
+    count: int
+    categories: Dict[str, int] = {}
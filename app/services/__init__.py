@@ -3,11 +3,13 @@ from app.services.nlp_extractor import NLPExtractor
 from app.services.embedding_service import EmbeddingService
 from app.services.vector_store import VectorStore
 from app.services.matching_service import MatchingService
+from app.services.skills_taxonomy import SkillsTaxonomy
 
 __all__ = [
     "ResumeParser",
     "NLPExtractor",
     "EmbeddingService",
     "VectorStore",
-    "MatchingService"
+    "MatchingService",
+    "SkillsTaxonomy"
 ]
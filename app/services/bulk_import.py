@@ -0,0 +1,314 @@
+import asyncio
+import os
+import time
+import uuid
+import zipfile
+import zlib
+from typing import Any, AsyncIterator, Dict, List
+from fastapi import UploadFile
+from sqlalchemy import insert, select
+from app.config import settings
+from app.database import async_session
+from app.models import Resume
+from app.utils.file_handler import file_handler
+from app.services.ingest_pipeline import get_ingest_pipeline, parse_and_extract
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.metrics import observe_stage
+from app.services.vector_store import get_vector_store
+
+
+# Raised while opening or reading a bad archive member: CRC mismatch or
+# truncated data, encrypted member, unsupported compression method
+ZIP_MEMBER_ERRORS = (zipfile.BadZipFile, EOFError, zlib.error, RuntimeError, NotImplementedError)
+
+
+class ZipEntryReader:
+    """Gives a zip archive member the read interface FileHandler.save_file expects."""
+
+    def __init__(self, archive: zipfile.ZipFile, info: zipfile.ZipInfo):
+        self.filename = os.path.basename(info.filename)
+        self.size = info.file_size
+        self._stream = archive.open(info)
+
+    async def read(self, size: int = -1) -> bytes:
+        # Decompression is CPU work; keep it off the event loop
+        return await asyncio.to_thread(self._stream.read, size)
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+def _is_pdf_name(name: str) -> bool:
+    return name.lower().endswith(".pdf")
+
+
+async def _save_sources(files: List[UploadFile]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Store every PDF in the request, expanding zip archives.
+
+    Yields one dict per file with either the saved path and content hash
+    or an error.
+    """
+    count = 0
+    for upload in files:
+        name = upload.filename or ""
+
+        if name.lower().endswith(".zip") or upload.content_type in ("application/zip", "application/x-zip-compressed"):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                yield {"filename": name, "status": "failed", "error": "Invalid zip archive"}
+                continue
+
+            with archive:
+                for info in archive.infolist():
+                    base = os.path.basename(info.filename)
+                    if info.is_dir() or info.filename.startswith("__MACOSX/") or base.startswith("."):
+                        continue
+                    if not _is_pdf_name(base):
+                        yield {"filename": info.filename, "status": "skipped", "error": "Not a PDF file"}
+                        continue
+
+                    count += 1
+                    if count > settings.bulk_max_files:
+                        yield {"filename": info.filename, "status": "skipped", "error": "Too many files in request"}
+                        continue
+
+                    reader = None
+                    try:
+                        reader = ZipEntryReader(archive, info)
+                        _, file_path, content_hash = await file_handler.save_file(reader)
+                    except ValueError as e:
+                        yield {"filename": base, "status": "failed", "error": str(e)}
+                        continue
+                    except ZIP_MEMBER_ERRORS as e:
+                        yield {"filename": base, "status": "failed", "error": f"Unreadable zip member: {e}"}
+                        continue
+                    finally:
+                        if reader is not None:
+                            reader.close()
+                    yield {"filename": base, "file_path": file_path, "content_hash": content_hash}
+            continue
+
+        is_valid, error = file_handler.validate_file(upload)
+        if not is_valid:
+            yield {"filename": name, "status": "failed", "error": error}
+            continue
+
+        count += 1
+        if count > settings.bulk_max_files:
+            yield {"filename": name, "status": "skipped", "error": "Too many files in request"}
+            continue
+
+        try:
+            _, file_path, content_hash = await file_handler.save_file(upload)
+            yield {"filename": name, "file_path": file_path, "content_hash": content_hash}
+        except ValueError as e:
+            yield {"filename": name, "status": "failed", "error": str(e)}
+
+
+async def _existing_resume_ids(content_hashes: List[str]) -> Dict[str, Any]:
+    """
+    Ids of stored resumes for the given content hashes.
+
+    Uses its own short-lived session, so no connection is held (idle in
+    transaction) for the length of the import.
+    """
+    async with async_session() as session:
+        result = await session.execute(
+            select(Resume.content_hash, Resume.id).where(Resume.content_hash.in_(content_hashes))
+        )
+        return {content_hash: resume_id for content_hash, resume_id in result.all()}
+
+
+def bulk_extract_concurrency() -> int:
+    """Ingest pool processes one bulk import may occupy, leaving at least one for uploads."""
+    return max(1, min(settings.bulk_cpu_workers, settings.ingest_cpu_workers - 1))
+
+
+async def _index_batch(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Embed a batch of extracted resumes and write them in one go.
+
+    Rows are inserted with a single bulk INSERT and vectors are added with a
+    single vector store write.
+    """
+    texts = [
+        EmbeddingService.create_resume_embedding_text(
+            skills=item["skills"],
+            experience=item["experience"],
+            education=item["education"]
+        )
+        for item in batch
+    ]
+    embeddings = await asyncio.to_thread(get_embedding_service().generate_embeddings, texts)
+
+    rows = []
+    for item in batch:
+        resume_id = uuid.uuid4()
+        item["resume_id"] = resume_id
+        rows.append({
+            "id": resume_id,
+            "filename": item["filename"],
+            "file_path": item["file_path"],
+            "content_hash": item["content_hash"],
+            "raw_text": item["raw_text"],
+            "name": item["name"],
+            "email": item["email"],
+            "phone": item["phone"],
+            "skills": item["skills"],
+            "education": item["education"],
+            "experience": item["experience"],
+            "extractor_version": item["extractor_version"],
+            "embedding_id": str(resume_id)
+        })
+
+    async with async_session() as session:
+        await session.execute(insert(Resume), rows)
+
+        get_vector_store().add_resumes([
+            {
+                "resume_id": str(item["resume_id"]),
+                "embedding": embedding,
+                "metadata": {
+                    "name": item["name"],
+                    "skills": ", ".join(item["skills"]) if item["skills"] else ""
+                }
+            }
+            for item, embedding in zip(batch, embeddings)
+        ])
+
+        await session.commit()
+
+    return [
+        {
+            "filename": item["filename"],
+            "status": "created",
+            "resume_id": str(item["resume_id"]),
+            "name": item["name"],
+            "skills": item["skills"],
+            "truncated": item["truncated"]
+        }
+        for item in batch
+    ]
+
+
+async def import_resumes(files: List[UploadFile]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Import many resumes, yielding one result per file as it is finished.
+
+    Files are stored content-addressed, parsed and extracted concurrently in
+    the ingest worker processes, then embedded and indexed in batches of
+    settings.bulk_batch_size. Files whose content hash matches an existing
+    resume (or an earlier file in the same request) are reported as
+    duplicates instead of being processed again; stored hashes are looked
+    up once per batch. At most bulk_extract_concurrency() files are in the
+    worker pool at a time, so interactive uploads keep a free worker. The
+    last item is a summary with counts and throughput.
+
+    Args:
+        files: Uploaded PDFs and/or zip archives of PDFs
+
+    Yields:
+        Per-file result dicts, then {"summary": {...}}
+    """
+    start = time.perf_counter()
+    pipeline = get_ingest_pipeline()
+    counts = {"created": 0, "duplicate": 0, "failed": 0, "skipped": 0}
+    seen_hashes: Dict[str, str] = {}  # content hash -> first filename in this request
+
+    unchecked: List[Dict[str, Any]] = []  # Saved, not yet checked against stored resumes
+    pending: List[asyncio.Task] = []
+    extracted: List[Dict[str, Any]] = []
+    pool_slots = asyncio.Semaphore(bulk_extract_concurrency())
+
+    async def extract(source: Dict[str, Any]) -> Dict[str, Any]:
+        async with pool_slots:
+            fields = await pipeline.run_in_pool(parse_and_extract, source["file_path"])
+        for stage, seconds in fields.pop("timings").items():
+            observe_stage(stage, seconds)
+        return {**source, **fields}
+
+    async def schedule() -> AsyncIterator[Dict[str, Any]]:
+        # One lookup for the whole batch of saved files
+        existing = await _existing_resume_ids([source["content_hash"] for source in unchecked])
+        for source in unchecked:
+            existing_id = existing.get(source["content_hash"])
+            if existing_id:
+                counts["duplicate"] += 1
+                yield {"filename": source["filename"], "status": "duplicate", "resume_id": str(existing_id)}
+            else:
+                pending.append(asyncio.create_task(extract(source), name=source["filename"]))
+        unchecked.clear()
+
+    async def drain(wait_all: bool) -> AsyncIterator[Dict[str, Any]]:
+        # Collect finished extractions, then index every full batch
+        nonlocal pending
+        if pending:
+            done, still_pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.ALL_COMPLETED if wait_all else asyncio.FIRST_COMPLETED
+            )
+            pending = list(still_pending)
+            for task in done:
+                try:
+                    extracted.append(task.result())
+                except Exception as e:
+                    counts["failed"] += 1
+                    yield {"filename": task.get_name(), "status": "failed", "error": str(e)}
+
+        while len(extracted) >= settings.bulk_batch_size or (wait_all and extracted):
+            batch = extracted[:settings.bulk_batch_size]
+            del extracted[:settings.bulk_batch_size]
+            try:
+                for result in await _index_batch(batch):
+                    counts["created"] += 1
+                    yield result
+            except Exception as e:
+                for item in batch:
+                    counts["failed"] += 1
+                    yield {"filename": item["filename"], "status": "failed", "error": str(e)}
+
+    async for source in _save_sources(files):
+        if "status" in source:
+            counts[source["status"]] += 1
+            yield source
+            continue
+
+        content_hash = source["content_hash"]
+        if content_hash in seen_hashes:
+            counts["duplicate"] += 1
+            yield {
+                "filename": source["filename"],
+                "status": "duplicate",
+                "duplicate_of": seen_hashes[content_hash]
+            }
+            continue
+
+        seen_hashes[content_hash] = source["filename"]
+        unchecked.append(source)
+        if len(unchecked) >= settings.bulk_batch_size:
+            async for result in schedule():
+                yield result
+
+        # Keep a bounded number of files in flight
+        if len(pending) >= settings.bulk_batch_size * 2:
+            async for result in drain(wait_all=False):
+                yield result
+
+    if unchecked:
+        async for result in schedule():
+            yield result
+    async for result in drain(wait_all=True):
+        yield result
+
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    yield {
+        "summary": {
+            **counts,
+            "total": total,
+            "seconds": round(elapsed, 3),
+            "files_per_sec": round(total / elapsed, 2) if elapsed else None
+        }
+    }
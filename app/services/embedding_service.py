@@ -2,6 +2,7 @@ from sentence_transformers import SentenceTransformer
 from typing import List, Union
 import numpy as np
 from app.config import settings
+from app.services.metrics import track_stage
 
 
 class EmbeddingService:
@@ -28,24 +29,33 @@ class EmbeddingService:
         Returns:
             Embedding as list of floats
         """
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        with track_stage("embed"):
+            embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings(self, texts: List[str], batch_size: int = None) -> List[List[float]]:
         """
         Generate embeddings for multiple texts.
 
         Args:
             texts: List of texts to embed
+            batch_size: Texts per model.encode batch (defaults to settings.embedding_batch_size)
 
         Returns:
             List of embeddings
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        if not texts:
+            return []
+        with track_stage("embed"):
+            embeddings = self.model.encode(
+                texts,
+                batch_size=batch_size or settings.embedding_batch_size,
+                convert_to_numpy=True
+            )
         return embeddings.tolist()
 
+    @staticmethod
     def create_resume_embedding_text(
-        self,
         skills: List[str],
         experience: List[dict],
         education: List[dict]
@@ -93,8 +103,8 @@ class EmbeddingService:
 
         return " | ".join(parts) if parts else ""
 
+    @staticmethod
     def create_job_embedding_text(
-        self,
         title: str,
         description: str,
         requirements: List[str]
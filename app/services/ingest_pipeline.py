@@ -0,0 +1,381 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+from sqlalchemy import select, update
+from app.config import settings
+from app.database import async_session
+from app.models import Resume, IngestJob
+from app.models.ingest_job import FINISHED_STATUSES
+from app.services.resume_parser import ParseResult, resume_parser
+from app.services.nlp_extractor import nlp_extractor
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.vector_store import get_vector_store
+from app.services.metrics import observe_stage
+
+
+class IngestQueueFull(Exception):
+    """Raised when the pipeline cannot accept more uploads."""
+
+
+@dataclass
+class IngestItem:
+    """A resume moving through the pipeline stages."""
+    ingest_id: UUID
+    filename: str
+    file_path: str
+    content_hash: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
+    raw_text: Optional[str] = None
+    extracted: Optional[Dict[str, Any]] = None
+    embedding_text: Optional[str] = None
+    embedding: Optional[List[float]] = None
+    extractor_version: Optional[str] = None
+
+
+def parse_file(file_path: str) -> ParseResult:
+    """Parse a PDF into cleaned text (runs in a worker process)."""
+    return resume_parser.parse_document(file_path)
+
+
+def extract_fields(raw_text: str) -> Dict[str, Any]:
+    """Extract structured fields from resume text (runs in a worker process)."""
+    extracted = nlp_extractor.extract(raw_text)
+    return {
+        "name": extracted.name,
+        "email": extracted.email,
+        "phone": extracted.phone,
+        "skills": extracted.skills,
+        "education": extracted.education,
+        "experience": extracted.experience,
+        "extractor_version": nlp_extractor.version
+    }
+
+
+def parse_and_extract(file_path: str) -> Dict[str, Any]:
+    """
+    Parse a PDF and extract its fields in one worker round-trip (bulk import).
+
+    Stage metrics live in the parent process, so the parse and extract
+    durations are returned under "timings" for the caller to record.
+    """
+    start = time.perf_counter()
+    parsed = parse_file(file_path)
+    parse_time = time.perf_counter() - start
+    fields = extract_fields(parsed.text)
+    fields["raw_text"] = parsed.text
+    fields["truncated"] = parsed.truncated
+    fields["timings"] = {
+        "parse": round(parse_time, 4),
+        "extract": round(time.perf_counter() - start - parse_time, 4)
+    }
+    return fields
+
+
+class IngestPipeline:
+    """
+    Staged resume ingest: parse -> extract -> embed -> index.
+
+    Each stage reads from a bounded asyncio queue and hands off to the next,
+    so a burst of uploads is absorbed by the queues instead of request
+    workers. Parsing and extraction run in a process pool; embedding runs
+    in batches on a thread so the event loop stays responsive. Progress and
+    per-stage timings are stored on the IngestJob row.
+
+    The queues only live in memory, so the IngestJob row and the saved file
+    are the durable record. Rows this process holds have their updated_at
+    refreshed regularly; rows left unfinished and untouched for
+    settings.ingest_stale_after (after a crash or restart, in any server
+    process) are claimed and requeued, or failed if their file is gone.
+    """
+
+    def __init__(self):
+        size = settings.ingest_queue_size
+        self.parse_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.extract_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.embed_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.index_queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self.tasks: List[asyncio.Task] = []
+        self.in_flight: Set[UUID] = set()
+
+    def start(self) -> None:
+        """Start the worker pool and stage tasks."""
+        workers = settings.ingest_cpu_workers
+        self.process_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        for _ in range(workers):
+            self.tasks.append(asyncio.create_task(self._parse_worker()))
+            self.tasks.append(asyncio.create_task(self._extract_worker()))
+        self.tasks.append(asyncio.create_task(self._embed_worker()))
+        self.tasks.append(asyncio.create_task(self._index_worker()))
+        self.tasks.append(asyncio.create_task(self._lease_worker()))
+
+    async def stop(self) -> None:
+        """Cancel stage tasks and shut down the worker pool."""
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        if self.process_pool:
+            self.process_pool.shutdown(wait=False, cancel_futures=True)
+            self.process_pool = None
+
+    def submit(self, item: IngestItem) -> None:
+        """
+        Queue a saved upload for processing.
+
+        Raises:
+            IngestQueueFull: If the parse queue is at capacity
+        """
+        try:
+            self.parse_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            raise IngestQueueFull("Ingest queue is full, try again later")
+        self.in_flight.add(item.ingest_id)
+
+    async def run_in_pool(self, func, *args):
+        """Run a CPU-bound function in the pipeline's worker processes."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.process_pool, func, *args)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Current number of items waiting at each stage."""
+        return {
+            "parse": self.parse_queue.qsize(),
+            "extract": self.extract_queue.qsize(),
+            "embed": self.embed_queue.qsize(),
+            "index": self.index_queue.qsize()
+        }
+
+    async def _set_status(self, item: IngestItem, status: str, **fields) -> None:
+        async with async_session() as session:
+            await session.execute(
+                update(IngestJob)
+                .where(IngestJob.id == item.ingest_id)
+                .values(status=status, timings=dict(item.timings), **fields)
+            )
+            await session.commit()
+        if status in FINISHED_STATUSES:
+            self.in_flight.discard(item.ingest_id)
+
+    async def _touch_in_flight(self) -> None:
+        """Refresh updated_at of held rows so other processes don't reclaim them."""
+        if not self.in_flight:
+            return
+        async with async_session() as session:
+            await session.execute(
+                update(IngestJob)
+                .where(IngestJob.id.in_(list(self.in_flight)), IngestJob.status.notin_(FINISHED_STATUSES))
+                .values(updated_at=datetime.utcnow())
+            )
+            await session.commit()
+
+    async def recover_stale(self) -> int:
+        """
+        Claim unfinished ingest jobs nobody has touched recently.
+
+        Jobs whose file is still on disk are requeued from the parse stage,
+        jobs whose resume was already committed are marked completed, and
+        the rest are failed. Rows are locked with SKIP LOCKED, so several
+        server processes can recover concurrently without double claims.
+
+        Returns:
+            Number of jobs requeued
+        """
+        free = self.parse_queue.maxsize - self.parse_queue.qsize()
+        if free <= 0:
+            return 0
+
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.ingest_stale_after)
+        requeue = []
+        async with async_session() as session:
+            result = await session.execute(
+                select(IngestJob)
+                .where(IngestJob.status.notin_(FINISHED_STATUSES), IngestJob.updated_at < cutoff)
+                .order_by(IngestJob.created_at)
+                .limit(free)
+                .with_for_update(skip_locked=True)
+            )
+            for job in result.scalars().all():
+                if job.id in self.in_flight:
+                    continue
+
+                indexed = None
+                if job.content_hash:
+                    indexed = (await session.execute(
+                        select(Resume.id).where(Resume.content_hash == job.content_hash).limit(1)
+                    )).scalar_one_or_none()
+
+                if indexed:
+                    job.status, job.resume_id = "completed", indexed
+                elif not os.path.exists(job.file_path):
+                    job.status, job.error = "failed", "Upload was interrupted and its file is gone"
+                else:
+                    job.status, job.error = "queued", None
+                    job.updated_at = datetime.utcnow()
+                    requeue.append(IngestItem(
+                        ingest_id=job.id,
+                        filename=job.filename,
+                        file_path=job.file_path,
+                        content_hash=job.content_hash,
+                        timings={"save": (job.timings or {}).get("save", 0.0)}
+                    ))
+            await session.commit()
+
+        for item in requeue:
+            self.submit(item)
+        if requeue:
+            print(f"Requeued {len(requeue)} interrupted resume uploads")
+        return len(requeue)
+
+    async def _lease_worker(self) -> None:
+        # First pass right at startup picks up uploads interrupted by a restart
+        while True:
+            try:
+                await self._touch_in_flight()
+                await self.recover_stale()
+            except Exception as e:
+                print(f"Ingest recovery failed: {e}")
+            await asyncio.sleep(settings.ingest_stale_after / 3)
+
+    async def _fail(self, item: IngestItem, error: Exception) -> None:
+        try:
+            await self._set_status(item, "failed", error=str(error))
+        except Exception as e:
+            print(f"Ingest {item.ingest_id} failed ({error}) and status update failed: {e}")
+
+    async def _parse_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.parse_queue.get()
+            try:
+                await self._set_status(item, "parsing")
+                start = time.perf_counter()
+                parsed = await loop.run_in_executor(self.process_pool, parse_file, item.file_path)
+                item.raw_text = parsed.text
+                item.timings["parse"] = round(time.perf_counter() - start, 4)
+                observe_stage("parse", item.timings["parse"])
+                if parsed.truncated:
+                    await self._set_status(
+                        item, "parsing",
+                        truncated=True,
+                        truncated_reason=parsed.truncated_reason
+                    )
+                await self.extract_queue.put(item)
+            except Exception as e:
+                await self._fail(item, e)
+            finally:
+                self.parse_queue.task_done()
+
+    async def _extract_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.extract_queue.get()
+            try:
+                await self._set_status(item, "extracting")
+                start = time.perf_counter()
+                item.extracted = await loop.run_in_executor(self.process_pool, extract_fields, item.raw_text)
+                item.extractor_version = item.extracted.pop("extractor_version")
+                item.embedding_text = EmbeddingService.create_resume_embedding_text(
+                    skills=item.extracted["skills"],
+                    experience=item.extracted["experience"],
+                    education=item.extracted["education"]
+                )
+                item.timings["extract"] = round(time.perf_counter() - start, 4)
+                observe_stage("extract", item.timings["extract"])
+                await self.embed_queue.put(item)
+            except Exception as e:
+                await self._fail(item, e)
+            finally:
+                self.extract_queue.task_done()
+
+    async def _embed_worker(self) -> None:
+        while True:
+            # Take whatever is waiting (up to the batch size) and encode it together
+            batch = [await self.embed_queue.get()]
+            while len(batch) < settings.ingest_embed_batch_size and not self.embed_queue.empty():
+                batch.append(self.embed_queue.get_nowait())
+
+            try:
+                for item in batch:
+                    await self._set_status(item, "embedding")
+                start = time.perf_counter()
+                embeddings = await asyncio.to_thread(
+                    get_embedding_service().generate_embeddings,
+                    [item.embedding_text for item in batch]
+                )
+                elapsed = round(time.perf_counter() - start, 4)
+                for item, embedding in zip(batch, embeddings):
+                    item.embedding = embedding
+                    item.timings["embed"] = elapsed
+                    await self.index_queue.put(item)
+            except Exception as e:
+                for item in batch:
+                    await self._fail(item, e)
+            finally:
+                for _ in batch:
+                    self.embed_queue.task_done()
+
+    async def _index_worker(self) -> None:
+        while True:
+            item = await self.index_queue.get()
+            try:
+                await self._set_status(item, "indexing")
+                start = time.perf_counter()
+                extracted = item.extracted
+
+                async with async_session() as session:
+                    resume = Resume(
+                        filename=item.filename,
+                        file_path=item.file_path,
+                        content_hash=item.content_hash,
+                        raw_text=item.raw_text,
+                        name=extracted["name"],
+                        email=extracted["email"],
+                        phone=extracted["phone"],
+                        skills=extracted["skills"],
+                        education=extracted["education"],
+                        experience=extracted["experience"],
+                        extractor_version=item.extractor_version
+                    )
+                    session.add(resume)
+                    await session.flush()
+
+                    get_vector_store().add_resume(
+                        resume_id=str(resume.id),
+                        embedding=item.embedding,
+                        metadata={
+                            "name": extracted["name"],
+                            "skills": ", ".join(extracted["skills"]) if extracted["skills"] else ""
+                        }
+                    )
+
+                    resume.embedding_id = str(resume.id)
+                    await session.commit()
+
+                item.timings["index"] = round(time.perf_counter() - start, 4)
+                observe_stage("index", item.timings["index"])
+                await self._set_status(item, "completed", resume_id=resume.id)
+            except Exception as e:
+                await self._fail(item, e)
+            finally:
+                self.index_queue.task_done()
+
+
+# Singleton instance (created on startup)
+_ingest_pipeline = None
+
+
+def get_ingest_pipeline() -> IngestPipeline:
+    global _ingest_pipeline
+    if _ingest_pipeline is None:
+        _ingest_pipeline = IngestPipeline()
+    return _ingest_pipeline
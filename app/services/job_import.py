@@ -0,0 +1,108 @@
+import asyncio
+import csv
+import time
+import uuid
+from typing import Any, Dict, IO, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Job
+from app.schemas.job import JobCreate
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.vector_store import get_vector_store
+
+
+def parse_jobs_csv(fileobj: IO[str]) -> Tuple[List[JobCreate], List[Dict[str, Any]]]:
+    """
+    Read job postings from a CSV file and validate them with JobCreate.
+
+    Expected columns: title, company, description, requirements, location,
+    salary_min, salary_max, job_type. Requirements are separated by ";"
+    (or "," when no ";" is present). Empty cells are treated as missing.
+
+    Args:
+        fileobj: Open text file
+
+    Returns:
+        Tuple of (valid jobs, [{"row": n, "error": ...}, ...])
+    """
+    jobs = []
+    errors = []
+
+    for row_number, row in enumerate(csv.DictReader(fileobj), start=2):
+        data = {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+
+        requirements = data.pop("requirements", "")
+        separator = ";" if ";" in requirements else ","
+        data["requirements"] = [r.strip() for r in requirements.split(separator) if r.strip()]
+
+        try:
+            jobs.append(JobCreate(**data))
+        except ValidationError as e:
+            errors.append({"row": row_number, "error": str(e)})
+
+    return jobs, errors
+
+
+async def import_jobs(db: AsyncSession, jobs: List[JobCreate]) -> Dict[str, Any]:
+    """
+    Create many job postings at once.
+
+    Embedding texts are encoded in batched model.encode calls, rows are
+    written with one bulk INSERT, and all vectors are added with a single
+    vector store write.
+
+    Args:
+        db: Database session
+        jobs: Validated job postings
+
+    Returns:
+        Dict with created count, job_ids, seconds and jobs_per_sec
+    """
+    start = time.perf_counter()
+
+    texts = [
+        EmbeddingService.create_job_embedding_text(
+            title=job.title,
+            description=job.description,
+            requirements=job.requirements
+        )
+        for job in jobs
+    ]
+    embeddings = await asyncio.to_thread(get_embedding_service().generate_embeddings, texts)
+
+    job_ids = [uuid.uuid4() for _ in jobs]
+    rows = [
+        {
+            "id": job_id,
+            **job.model_dump(),
+            "embedding_id": str(job_id)
+        }
+        for job_id, job in zip(job_ids, jobs)
+    ]
+
+    if rows:
+        await db.execute(insert(Job), rows)
+
+        get_vector_store().add_jobs([
+            {
+                "job_id": str(job_id),
+                "embedding": embedding,
+                "metadata": {
+                    "title": job.title,
+                    "company": job.company,
+                    "requirements": ", ".join(job.requirements) if job.requirements else ""
+                }
+            }
+            for job_id, job, embedding in zip(job_ids, jobs, embeddings)
+        ])
+
+        await db.commit()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "created": len(rows),
+        "job_ids": job_ids,
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": round(len(rows) / elapsed, 2) if elapsed and rows else None
+    }
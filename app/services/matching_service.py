@@ -1,10 +1,11 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models import Resume, Job
 from app.services.embedding_service import get_embedding_service
 from app.services.vector_store import get_vector_store
+from app.services.metrics import record_embedding_lookup, track_stage
 from app.config import settings
 
 
@@ -44,6 +45,7 @@ class MatchingService:
 
         # Get resume embedding from vector store
         embedding = self.vector_store.get_resume_embedding(str(resume_id))
+        record_embedding_lookup("resume", embedding is not None)
         if not embedding:
             # Generate embedding if not stored
             embedding_text = self.embedding_service.create_resume_embedding_text(
@@ -62,19 +64,20 @@ class MatchingService:
 
         # Enrich with job details from database
         enriched_matches = []
-        for match in matches:
-            job_id = UUID(match["job_id"])
-            job = await db.get(Job, job_id)
-            if job and job.is_active:
-                enriched_matches.append({
-                    "job_id": job_id,
-                    "job_title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "match_score": round(match["score"], 4)
-                })
+        with track_stage("db_enrichment"):
+            for match in matches:
+                job_id = UUID(match["job_id"])
+                job = await db.get(Job, job_id)
+                if job and job.is_active:
+                    enriched_matches.append({
+                        "job_id": job_id,
+                        "job_title": job.title,
+                        "company": job.company,
+                        "location": job.location,
+                        "salary_min": job.salary_min,
+                        "salary_max": job.salary_max,
+                        "match_score": round(match["score"], 4)
+                    })
 
         # Sort by score descending
         enriched_matches.sort(key=lambda x: x["match_score"], reverse=True)
@@ -110,6 +113,7 @@ class MatchingService:
 
         # Get job embedding from vector store
         embedding = self.vector_store.get_job_embedding(str(job_id))
+        record_embedding_lookup("job", embedding is not None)
         if not embedding:
             # Generate embedding if not stored
             embedding_text = self.embedding_service.create_job_embedding_text(
@@ -128,23 +132,46 @@ class MatchingService:
 
         # Enrich with resume details from database
         enriched_matches = []
-        for match in matches:
-            resume_id = UUID(match["resume_id"])
-            resume = await db.get(Resume, resume_id)
-            if resume:
-                enriched_matches.append({
-                    "resume_id": resume_id,
-                    "name": resume.name,
-                    "email": resume.email,
-                    "skills": resume.skills or [],
-                    "match_score": round(match["score"], 4)
-                })
+        with track_stage("db_enrichment"):
+            for match in matches:
+                resume_id = UUID(match["resume_id"])
+                resume = await db.get(Resume, resume_id)
+                if resume:
+                    enriched_matches.append({
+                        "resume_id": resume_id,
+                        "name": resume.name,
+                        "email": resume.email,
+                        "skills": resume.skills or [],
+                        "match_score": round(match["score"], 4)
+                    })
 
         # Sort by score descending
         enriched_matches.sort(key=lambda x: x["match_score"], reverse=True)
 
         return enriched_matches
 
+    def score_from_store(self, resume_id: UUID, job_id: UUID) -> Optional[float]:
+        """
+        Match score from the stored embeddings only.
+
+        Unlike calculate_match_score this never queries the database or
+        regenerates embeddings.
+
+        Args:
+            resume_id: Resume UUID
+            job_id: Job UUID
+
+        Returns:
+            Match score (0-1), or None if either embedding is missing
+        """
+        resume_embedding = self.vector_store.get_resume_embedding(str(resume_id))
+        job_embedding = self.vector_store.get_job_embedding(str(job_id))
+
+        if not resume_embedding or not job_embedding:
+            return None
+
+        return self.embedding_service.cosine_similarity(resume_embedding, job_embedding)
+
     async def calculate_match_score(
         self,
         db: AsyncSession,
@@ -164,6 +191,8 @@ class MatchingService:
         """
         resume_embedding = self.vector_store.get_resume_embedding(str(resume_id))
         job_embedding = self.vector_store.get_job_embedding(str(job_id))
+        record_embedding_lookup("resume", resume_embedding is not None)
+        record_embedding_lookup("job", job_embedding is not None)
 
         if not resume_embedding or not job_embedding:
             # Fallback: regenerate embeddings
@@ -0,0 +1,166 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from prometheus_client import CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from app.config import settings
+
+# Own registry so only NagaMatch metrics are exported
+REGISTRY = CollectorRegistry()
+
+STAGE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+STAGE_SECONDS = Histogram(
+    "nagamatch_stage_seconds",
+    "Time spent in each processing stage",
+    ["stage"],
+    buckets=STAGE_BUCKETS,
+    registry=REGISTRY
+)
+
+REQUEST_SECONDS = Histogram(
+    "nagamatch_request_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=STAGE_BUCKETS,
+    registry=REGISTRY
+)
+
+REQUEST_DB_QUERIES = Histogram(
+    "nagamatch_request_db_queries",
+    "SQL statements executed per request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200),
+    registry=REGISTRY
+)
+
+REQUEST_DB_SECONDS = Histogram(
+    "nagamatch_request_db_seconds",
+    "Time spent in SQL statements per request",
+    ["route"],
+    buckets=STAGE_BUCKETS,
+    registry=REGISTRY
+)
+
+SLOW_QUERIES = Counter(
+    "nagamatch_slow_queries",
+    "Statements slower than DB_SLOW_QUERY_MS",
+    registry=REGISTRY
+)
+
+EMBEDDING_LOOKUPS = Counter(
+    "nagamatch_embedding_lookups",
+    "Stored embedding lookups; misses fall back to running the model",
+    ["kind", "result"],
+    registry=REGISTRY
+)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record an already measured stage duration."""
+    if settings.metrics_enabled:
+        STAGE_SECONDS.labels(stage).observe(seconds)
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """
+    Time the enclosed block as one observation of a stage.
+
+    Does nothing when metrics are disabled.
+
+    Args:
+        stage: Stage label (file_save, parse, extract, embed, index,
+            vector_search, db_enrichment)
+    """
+    if not settings.metrics_enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.labels(stage).observe(time.perf_counter() - start)
+
+
+def record_slow_query() -> None:
+    """Count a statement over the slow-query threshold."""
+    if settings.metrics_enabled:
+        SLOW_QUERIES.inc()
+
+
+def route_template(request) -> str:
+    """
+    Route of a handled request with path parameters as placeholders.
+
+    Keeps metric label cardinality bounded (/jobs/{job_id}, not one label
+    per job). Returns "unmatched" when no route handled the request.
+    """
+    if "endpoint" not in request.scope:
+        return "unmatched"
+    route = request.url.path
+    for name, value in request.path_params.items():
+        route = route.replace(str(value), f"{{{name}}}", 1)
+    return route
+
+
+def record_embedding_lookup(kind: str, hit: bool) -> None:
+    """
+    Count a stored embedding lookup.
+
+    Args:
+        kind: "resume" or "job"
+        hit: Whether the vector store had the embedding
+    """
+    if settings.metrics_enabled:
+        EMBEDDING_LOOKUPS.labels(kind, "hit" if hit else "miss").inc()
+
+
+class StateCollector:
+    """Reads vector store size, ingest queue depths and DB pool usage at scrape time."""
+
+    def collect(self):
+        # Imported here: these modules record metrics themselves
+        from app.database import engine, read_engine, get_pool_stats
+        from app.services.ingest_pipeline import get_ingest_pipeline
+        from app.services.vector_store import get_vector_store
+
+        store = get_vector_store()
+        items = GaugeMetricFamily(
+            "nagamatch_vector_store_items", "Vectors held in the store", labels=["collection"]
+        )
+        items.add_metric(["resumes"], len(store.resumes))
+        items.add_metric(["jobs"], len(store.jobs))
+        yield items
+
+        depths = GaugeMetricFamily(
+            "nagamatch_ingest_queue_depth", "Items waiting in each ingest queue", labels=["queue"]
+        )
+        for queue, depth in get_ingest_pipeline().queue_depths().items():
+            depths.add_metric([queue], depth)
+        yield depths
+
+        engines = {"primary": engine}
+        if read_engine is not engine:
+            engines["replica"] = read_engine
+
+        checked_out = GaugeMetricFamily(
+            "nagamatch_db_pool_checked_out", "Connections in use", labels=["engine"]
+        )
+        saturation = GaugeMetricFamily(
+            "nagamatch_db_pool_saturation", "Checked out / (pool_size + max_overflow)", labels=["engine"]
+        )
+        for name, tracked in engines.items():
+            stats = get_pool_stats(tracked)
+            checked_out.add_metric([name], stats["checked_out"])
+            saturation.add_metric([name], stats["saturation"] or 0.0)
+        yield checked_out
+        yield saturation
+
+
+REGISTRY.register(StateCollector())
+
+
+def render_metrics() -> bytes:
+    """Current metrics in Prometheus text exposition format."""
+    return generate_latest(REGISTRY)
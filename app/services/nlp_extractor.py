@@ -1,131 +1,11 @@
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field
+from app.services.skills_taxonomy import get_skills_taxonomy
 
 
-# Comprehensive skills database for all types of jobs
-SKILLS_DATABASE = {
-    # Food & Culinary
-    "cooking", "baking", "grilling", "food preparation", "food handling",
-    "kitchen management", "menu planning", "catering", "bartending", "barista",
-    "food safety", "culinary arts", "pastry", "butchering", "sushi making",
-    "food plating", "recipe development", "inventory management",
-
-    # Restaurant & Hospitality
-    "customer service", "cashier", "point of sale", "pos system", "waitstaff",
-    "table service", "hosting", "reservation management", "hotel management",
-    "front desk", "housekeeping", "room service", "concierge", "event planning",
-    "banquet service", "food service", "fast food", "fine dining",
-
-    # Retail & Sales
-    "sales", "retail", "merchandising", "stock management", "inventory",
-    "visual merchandising", "product display", "cash handling", "upselling",
-    "customer relations", "store management", "loss prevention", "pricing",
-
-    # Construction & Trades
-    "carpentry", "plumbing", "electrical", "welding", "masonry", "roofing",
-    "painting", "plastering", "tiling", "flooring", "concrete work",
-    "blueprint reading", "construction", "renovation", "demolition",
-    "scaffolding", "heavy equipment", "forklift", "crane operation",
-    "hvac", "air conditioning", "refrigeration",
-
-    # Automotive & Mechanical
-    "auto repair", "mechanic", "automotive", "engine repair", "brake repair",
-    "oil change", "tire service", "vehicle maintenance", "diesel mechanic",
-    "motorcycle repair", "auto body", "auto painting", "car wash",
-
-    # Beauty & Personal Care
-    "hairstyling", "hair cutting", "hair coloring", "barbering", "makeup",
-    "nail art", "manicure", "pedicure", "facial", "skin care", "massage",
-    "spa services", "waxing", "threading", "beauty consultation",
-
-    # Healthcare & Medical
-    "nursing", "patient care", "first aid", "cpr", "vital signs",
-    "medication administration", "phlebotomy", "caregiving", "elderly care",
-    "childcare", "midwifery", "physical therapy", "dental assistant",
-    "medical records", "healthcare", "home care", "rehabilitation",
-
-    # Cleaning & Maintenance
-    "cleaning", "janitorial", "sanitation", "disinfection", "laundry",
-    "ironing", "housekeeping", "window cleaning", "carpet cleaning",
-    "pressure washing", "grounds maintenance", "landscaping", "gardening",
-    "lawn care", "tree trimming", "pest control",
-
-    # Security & Safety
-    "security", "guard", "surveillance", "cctv monitoring", "access control",
-    "patrol", "emergency response", "crowd control", "loss prevention",
-    "fire safety", "safety inspection", "security clearance",
-
-    # Transportation & Delivery
-    "driving", "delivery", "motorcycle delivery", "truck driving",
-    "forklift operation", "logistics", "route planning", "dispatching",
-    "warehouse", "shipping", "receiving", "packing", "loading",
-    "courier", "freight handling", "supply chain",
-
-    # Office & Administrative
-    "typing", "data entry", "filing", "scheduling", "receptionist",
-    "phone handling", "email management", "calendar management",
-    "office management", "administrative support", "bookkeeping",
-    "accounting", "payroll", "invoicing", "microsoft office", "excel",
-    "word processing", "spreadsheets", "presentations",
-
-    # Writing & Communication
-    "writing", "editing", "proofreading", "journalism", "reporting",
-    "content writing", "copywriting", "blogging", "social media",
-    "public relations", "press release", "creative writing", "translation",
-    "transcription", "technical writing", "documentation",
-
-    # Arts & Creative
-    "drawing", "illustration", "graphic design", "photography",
-    "videography", "video editing", "photo editing", "animation",
-    "crafts", "sewing", "embroidery", "pottery", "sculpture", "calligraphy",
-    "interior design", "fashion design", "jewelry making", "woodworking",
-
-    # Education & Training
-    "teaching", "tutoring", "lesson planning", "classroom management",
-    "curriculum development", "student assessment", "special education",
-    "early childhood education", "adult education", "training", "coaching",
-    "mentoring", "public speaking", "presentation skills",
-
-    # Agriculture & Farming
-    "farming", "planting", "harvesting", "irrigation", "crop management",
-    "livestock", "poultry", "fishing", "aquaculture", "organic farming",
-    "pesticide application", "farm equipment", "agricultural",
-
-    # Manufacturing & Production
-    "assembly", "machine operation", "quality control", "quality assurance",
-    "production line", "packaging", "labeling", "inspection", "soldering",
-    "sewing machine", "printing", "binding", "laminating",
-
-    # Technology & IT
-    "computer", "internet", "troubleshooting", "technical support", "networking",
-    "computer repair", "software installation", "hardware installation",
-    "python", "java", "javascript", "programming", "coding", "web development",
-    "mobile development", "database", "sql", "excel", "powerpoint",
-    "react", "node.js", "django", "flask", "docker", "aws", "git",
-    "html", "css", "typescript", "mongodb", "postgresql", "api",
-
-    # Finance & Accounting
-    "accounting", "bookkeeping", "budgeting", "financial reporting",
-    "tax preparation", "auditing", "billing", "collections", "credit analysis",
-    "cash management", "payroll processing", "accounts payable",
-    "accounts receivable", "quickbooks", "financial analysis",
-
-    # Legal & Government
-    "legal research", "document preparation", "notary", "court filing",
-    "legal transcription", "paralegal", "compliance", "regulatory",
-
-    # Soft Skills
-    "communication", "teamwork", "leadership", "problem solving",
-    "time management", "organization", "multitasking", "attention to detail",
-    "critical thinking", "decision making", "adaptability", "flexibility",
-    "work ethic", "reliability", "punctuality", "initiative", "creativity",
-    "negotiation", "conflict resolution", "stress management", "agile",
-
-    # Languages
-    "english", "filipino", "tagalog", "bicol", "cebuano", "ilocano",
-    "mandarin", "japanese", "korean", "spanish", "bilingual", "multilingual"
-}
+# Bump when extraction logic changes so stored resumes are re-extracted
+EXTRACTOR_VERSION = "2"
 
 # Education keywords - expanded
 EDUCATION_KEYWORDS = [
@@ -147,6 +27,55 @@ SECTION_MARKERS = [
 ]
 
 
+# Compiled patterns (built once at import instead of on every extraction)
+SECTION_SPLIT_PATTERNS = [
+    re.compile(r'\s+(' + re.escape(marker) + r')\s+', re.IGNORECASE)
+    for marker in SECTION_MARKERS
+]
+CONTACT_SPLIT_PATTERN = re.compile(
+    r'\s+(Phone|Email|Location|Address|LinkedIn|Mobile)\s*', re.IGNORECASE
+)
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERNS = [
+    re.compile(r'09\d{9}'),  # Philippines mobile: 09XXXXXXXXX
+    re.compile(r'\+63\s*\d{10}'),  # Philippines with country code
+    re.compile(r'\+63\s*\d{3}\s*\d{3}\s*\d{4}'),  # +63 XXX XXX XXXX
+    re.compile(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}'),  # XXX-XXX-XXXX or XXX.XXX.XXXX
+    re.compile(r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}'),  # (XXX) XXX-XXXX
+]
+NAME_BEFORE_CONTACT_PATTERN = re.compile(
+    r'^([A-Z][A-Za-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][A-Za-z]+)+)\s*(?:Phone|Email|Mobile|Contact|Address|\|)',
+    re.MULTILINE
+)
+ALL_CAPS_NAME_PATTERN = re.compile(r'^([A-Z][A-Z\s.]+[A-Z])\s')
+DIGITS_PATTERN = re.compile(r'\d{3,}')
+YEAR_PATTERN = re.compile(r'(19|20)\d{2}')
+DATE_RANGE_PATTERN = re.compile(
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(?:19|20)\d{2})\s*[-–—to]+\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(?:19|20)\d{2}|[Pp]resent|[Cc]urrent)'
+)
+NAME_SKIP_WORDS = [
+    'resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact',
+    'phone', 'address', 'summary', 'objective', 'experience',
+    'education', 'skills', 'reference', 'personal', 'information',
+    'email', 'mobile', 'linkedin', 'github'
+]
+
+# Section headers: (keywords that open the section, markers that close it)
+SECTION_RULES = {
+    "education": (
+        ['education'],
+        ['experience', 'skills', 'projects', 'references', 'certifications']
+    ),
+    "experience": (
+        ['experience', 'employment', 'work history'],
+        ['education', 'skills', 'projects', 'references']
+    ),
+}
+
+# Lines shorter than this are treated as section headers rather than content
+HEADER_MAX_LENGTH = 50
+
+
 @dataclass
 class ExtractedData:
     name: Optional[str] = None
@@ -157,72 +86,142 @@ class ExtractedData:
     experience: List[Dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass
+class ParsedDocument:
+    """Resume text tokenized once and shared by every extractor."""
+    text: str
+    text_lower: str
+    lines: List[str]
+    lines_lower: List[str]
+    sections: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_text(cls, text: str) -> "ParsedDocument":
+        """
+        Build a parsed document from raw resume text.
+
+        Args:
+            text: Raw resume text
+
+        Returns:
+            ParsedDocument with lines and section boundaries precomputed
+        """
+        lines = split_into_lines(text)
+        lines_lower = [line.lower() for line in lines]
+        sections = {
+            name: _find_section(lines, lines_lower, enter_keywords, exit_markers)
+            for name, (enter_keywords, exit_markers) in SECTION_RULES.items()
+        }
+        return cls(
+            text=text,
+            text_lower=text.lower(),
+            lines=lines,
+            lines_lower=lines_lower,
+            sections=sections
+        )
+
+
+def split_into_lines(text: str) -> List[str]:
+    """Split text into lines, handling both newline-separated and continuous text."""
+    # First try normal newline split
+    lines = text.split('\n')
+
+    # If we only got 1-2 lines, the PDF might not have preserved newlines
+    # Try to split on common section headers
+    if len(lines) <= 2 and len(text) > 200:
+        # Insert newlines before common section headers
+        for pattern in SECTION_SPLIT_PATTERNS:
+            text = pattern.sub(r'\n\1\n', text)
+
+        # Also split on patterns like "Phone", "Email", "Location"
+        text = CONTACT_SPLIT_PATTERN.sub(r'\n\1 ', text)
+
+        lines = text.split('\n')
+
+    return [line.strip() for line in lines if line.strip()]
+
+
+def _find_section(
+    lines: List[str],
+    lines_lower: List[str],
+    enter_keywords: List[str],
+    exit_markers: List[str]
+) -> List[str]:
+    """Return the content lines between a section header and the next header."""
+    in_section = False
+    section_lines = []
+
+    for line, line_lower in zip(lines, lines_lower):
+        # Check if entering the section
+        if any(kw in line_lower for kw in enter_keywords):
+            if len(line) < HEADER_MAX_LENGTH:  # It's a header
+                in_section = True
+                continue
+
+        # Check if leaving the section
+        if in_section:
+            if any(marker in line_lower for marker in exit_markers):
+                if len(line) < HEADER_MAX_LENGTH:  # It's a header, not content
+                    break
+
+            section_lines.append(line)
+
+    return section_lines
+
+
 class NLPExtractor:
     """Service for extracting structured information from resume text using regex patterns."""
 
     def __init__(self):
         pass
 
-    def _split_into_lines(self, text: str) -> List[str]:
-        """Split text into lines, handling both newline-separated and continuous text."""
-        # First try normal newline split
-        lines = text.split('\n')
-
-        # If we only got 1-2 lines, the PDF might not have preserved newlines
-        # Try to split on common section headers
-        if len(lines) <= 2 and len(text) > 200:
-            # Insert newlines before common section headers
-            for marker in SECTION_MARKERS:
-                # Case insensitive replacement
-                pattern = re.compile(r'\s+(' + re.escape(marker) + r')\s+', re.IGNORECASE)
-                text = pattern.sub(r'\n\1\n', text)
-
-            # Also split on patterns like "Phone", "Email", "Location"
-            text = re.sub(r'\s+(Phone|Email|Location|Address|LinkedIn|Mobile)\s*', r'\n\1 ', text, flags=re.IGNORECASE)
+    @property
+    def version(self) -> str:
+        """Extractor logic version combined with the active skills taxonomy version."""
+        return f"{EXTRACTOR_VERSION}+skills.{get_skills_taxonomy().version}"
 
-            lines = text.split('\n')
+    @staticmethod
+    def _as_document(doc: Union[str, ParsedDocument]) -> ParsedDocument:
+        """Accept either raw text or an already parsed document."""
+        if isinstance(doc, ParsedDocument):
+            return doc
+        return ParsedDocument.from_text(doc)
 
-        return [line.strip() for line in lines if line.strip()]
+    def _split_into_lines(self, text: str) -> List[str]:
+        """Split text into lines, handling both newline-separated and continuous text."""
+        return split_into_lines(text)
 
-    def extract_email(self, text: str) -> Optional[str]:
+    def extract_email(self, doc: Union[str, ParsedDocument]) -> Optional[str]:
         """Extract email address from text."""
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else None
+        text = doc.text if isinstance(doc, ParsedDocument) else doc
+        match = EMAIL_PATTERN.search(text)
+        return match.group() if match else None
 
-    def extract_phone(self, text: str) -> Optional[str]:
+    def extract_phone(self, doc: Union[str, ParsedDocument]) -> Optional[str]:
         """Extract phone number from text."""
-        phone_patterns = [
-            r'09\d{9}',  # Philippines mobile: 09XXXXXXXXX
-            r'\+63\s*\d{10}',  # Philippines with country code
-            r'\+63\s*\d{3}\s*\d{3}\s*\d{4}',  # +63 XXX XXX XXXX
-            r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',  # XXX-XXX-XXXX or XXX.XXX.XXXX
-            r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (XXX) XXX-XXXX
-        ]
-
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[0].strip()
+        text = doc.text if isinstance(doc, ParsedDocument) else doc
+
+        for pattern in PHONE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group().strip()
         return None
 
-    def extract_name(self, text: str) -> Optional[str]:
+    def extract_name(self, doc: Union[str, ParsedDocument]) -> Optional[str]:
         """Extract person name from text using multiple strategies."""
+        doc = self._as_document(doc)
+        text = doc.text
 
         # Strategy 1: Look for name before "Phone" or "Email" keywords
         # Pattern like "ALEX R. DEVELOPER Phone..." or "John Doe Email:"
-        name_before_contact = re.search(
-            r'^([A-Z][A-Za-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][A-Za-z]+)+)\s*(?:Phone|Email|Mobile|Contact|Address|\|)',
-            text,
-            re.MULTILINE
-        )
+        name_before_contact = NAME_BEFORE_CONTACT_PATTERN.search(text)
         if name_before_contact:
             name = name_before_contact.group(1).strip()
             if 2 <= len(name.split()) <= 5:
                 return name
 
         # Strategy 2: Look for all-caps name at the start
-        all_caps_name = re.search(r'^([A-Z][A-Z\s.]+[A-Z])\s', text)
+        all_caps_name = ALL_CAPS_NAME_PATTERN.search(text)
         if all_caps_name:
             name = all_caps_name.group(1).strip()
             words = name.split()
@@ -230,26 +229,14 @@ class NLPExtractor:
                 return name
 
         # Strategy 3: Check first few lines
-        lines = self._split_into_lines(text)
-
-        skip_words = [
-            'resume', 'cv', 'curriculum', 'vitae', 'profile', 'contact',
-            'phone', 'address', 'summary', 'objective', 'experience',
-            'education', 'skills', 'reference', 'personal', 'information',
-            'email', 'mobile', 'linkedin', 'github'
-        ]
-
-        for line in lines[:10]:
-            line = line.strip()
-            if not line or len(line) < 3 or len(line) > 50:
+        for line, line_lower in zip(doc.lines[:10], doc.lines_lower[:10]):
+            if len(line) < 3 or len(line) > 50:
                 continue
 
-            line_lower = line.lower()
-
             # Skip if contains contact info or section headers
-            if any(kw in line_lower for kw in skip_words):
+            if any(kw in line_lower for kw in NAME_SKIP_WORDS):
                 continue
-            if '@' in line or re.search(r'\d{3,}', line):
+            if '@' in line or DIGITS_PATTERN.search(line):
                 continue
 
             # Check if it looks like a name
@@ -268,53 +255,19 @@ class NLPExtractor:
 
         return None
 
-    def extract_skills(self, text: str) -> List[str]:
-        """Extract skills from text using keyword matching."""
-        text_lower = text.lower()
-        found_skills = set()
-
-        for skill in SKILLS_DATABASE:
-            if ' ' in skill:
-                if skill in text_lower:
-                    found_skills.add(skill.title())
-            else:
-                pattern = r'\b' + re.escape(skill) + r'\b'
-                if re.search(pattern, text_lower):
-                    if len(skill) <= 3 and skill.isalpha():
-                        found_skills.add(skill.upper())
-                    else:
-                        found_skills.add(skill.title())
-
-        return sorted(list(found_skills))
-
-    def extract_education(self, text: str) -> List[Dict[str, Any]]:
+    def extract_skills(self, doc: Union[str, ParsedDocument]) -> List[str]:
+        """Extract skills from text using the skills taxonomy index."""
+        text_lower = doc.text_lower if isinstance(doc, ParsedDocument) else doc.lower()
+        taxonomy = get_skills_taxonomy()
+        return sorted(skill.name for skill in taxonomy.match(text_lower))
+
+    def extract_education(self, doc: Union[str, ParsedDocument]) -> List[Dict[str, Any]]:
         """Extract education information from text."""
+        doc = self._as_document(doc)
         education_list = []
-        lines = self._split_into_lines(text)
-
-        # Find education section
-        in_education = False
-        education_text = []
-
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-
-            # Check if entering education section
-            if 'education' in line_lower and len(line) < 50:
-                in_education = True
-                continue
-
-            # Check if leaving education section
-            if in_education:
-                if any(marker in line_lower for marker in ['experience', 'skills', 'projects', 'references', 'certifications']):
-                    if len(line) < 50:  # It's a header, not content
-                        break
-
-                education_text.append(line)
 
         # If no education section found, search whole text
-        if not education_text:
-            education_text = lines
+        education_text = doc.sections["education"] or doc.lines
 
         # Parse education entries
         for line in education_text:
@@ -325,7 +278,7 @@ class NLPExtractor:
 
             if has_edu_keyword:
                 # Extract year if present
-                year_match = re.search(r'(19|20)\d{2}', line)
+                year_match = YEAR_PATTERN.search(line)
                 entry = {"degree": line}
                 if year_match:
                     entry["year"] = year_match.group()
@@ -333,44 +286,20 @@ class NLPExtractor:
 
         return education_list
 
-    def extract_experience(self, text: str) -> List[Dict[str, Any]]:
+    def extract_experience(self, doc: Union[str, ParsedDocument]) -> List[Dict[str, Any]]:
         """Extract work experience information from text."""
+        doc = self._as_document(doc)
         experience_list = []
-        lines = self._split_into_lines(text)
-
-        # Find experience section
-        in_experience = False
-        experience_text = []
-
-        for line in lines:
-            line_lower = line.lower()
-
-            # Check if entering experience section
-            if any(kw in line_lower for kw in ['experience', 'employment', 'work history']):
-                if len(line) < 50:  # It's a header
-                    in_experience = True
-                    continue
-
-            # Check if leaving experience section
-            if in_experience:
-                if any(marker in line_lower for marker in ['education', 'skills', 'projects', 'references']):
-                    if len(line) < 50:
-                        break
-
-                experience_text.append(line)
 
         # If no experience section found, search for date patterns
-        if not experience_text:
-            experience_text = lines
+        experience_text = doc.sections["experience"] or doc.lines
 
         # Parse experience entries - look for date patterns
-        date_pattern = r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(?:19|20)\d{2})\s*[-–—to]+\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|(?:19|20)\d{2}|[Pp]resent|[Cc]urrent)'
-
         current_entry = None
 
         for line in experience_text:
             # Check if line contains date range
-            date_match = re.search(date_pattern, line)
+            date_match = DATE_RANGE_PATTERN.search(line)
 
             if date_match:
                 if current_entry:
@@ -390,23 +319,27 @@ class NLPExtractor:
 
         return experience_list
 
-    def extract(self, text: str) -> ExtractedData:
+    def extract(self, text: Union[str, ParsedDocument]) -> ExtractedData:
         """
         Extract all structured information from resume text.
 
+        The text is tokenized into a ParsedDocument once and every
+        extractor reads from it.
+
         Args:
-            text: Raw resume text
+            text: Raw resume text or a ParsedDocument
 
         Returns:
             ExtractedData with all extracted fields
         """
+        doc = self._as_document(text)
         return ExtractedData(
-            name=self.extract_name(text),
-            email=self.extract_email(text),
-            phone=self.extract_phone(text),
-            skills=self.extract_skills(text),
-            education=self.extract_education(text),
-            experience=self.extract_experience(text)
+            name=self.extract_name(doc),
+            email=self.extract_email(doc),
+            phone=self.extract_phone(doc),
+            skills=self.extract_skills(doc),
+            education=self.extract_education(doc),
+            experience=self.extract_experience(doc)
         )
 
 
@@ -0,0 +1,172 @@
+import importlib.util
+import os
+import random
+import re
+import secrets
+import time
+from typing import Any, Dict, List, Optional
+from fastapi import Request
+from app.config import settings
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+
+PROFILE_FORMATS = {
+    "speedscope": ".speedscope.json",
+    "collapsed": ".collapsed.txt",
+}
+
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9_.-]+")
+
+_active = False
+
+
+def profiler_available() -> bool:
+    """Whether the optional pyinstrument package is installed."""
+    return importlib.util.find_spec("pyinstrument") is not None
+
+
+def profiling_unavailable_reason() -> Optional[str]:
+    """
+    Why profiling stays off despite settings.profiling_enabled, if it does.
+
+    Profiling fails closed: without a token anyone could trigger profiles
+    and download them, so it is not enabled at all.
+    """
+    if not settings.profiling_enabled:
+        return "PROFILING_ENABLED is off"
+    if not settings.profiling_token:
+        return "PROFILING_TOKEN is not set"
+    if not profiler_available():
+        return "pyinstrument is not installed"
+    return None
+
+
+def profiling_active() -> bool:
+    """Whether the profiling middleware and admin endpoints are enabled."""
+    return profiling_unavailable_reason() is None
+
+
+def token_matches(value: Optional[str]) -> bool:
+    """Constant-time check of a presented token against settings.profiling_token."""
+    if not settings.profiling_token or value is None:
+        return False
+    return secrets.compare_digest(value.encode(), settings.profiling_token.encode())
+
+
+def should_profile(request: Request) -> bool:
+    """
+    Decide whether to profile this request.
+
+    A request is profiled when it sends the X-Profile header matching
+    settings.profiling_token, or is picked by settings.profiling_sample_rate.
+    """
+    header = request.headers.get(PROFILE_HEADER)
+    if header is not None:
+        return token_matches(header)
+    return settings.profiling_sample_rate > 0 and random.random() < settings.profiling_sample_rate
+
+
+def start_profiler() -> Optional[Any]:
+    """
+    Start a sampling profiler that follows the request across awaits.
+
+    Returns:
+        The running profiler, or None if another request is being profiled
+        (only one profiler can sample the event loop thread at a time)
+    """
+    global _active
+    if _active:
+        return None
+    from pyinstrument import Profiler
+
+    profiler = Profiler(interval=settings.profiling_interval, async_mode="enabled")
+    profiler.start()
+    _active = True
+    return profiler
+
+
+def _collapsed_stacks(session) -> str:
+    """Render a profile as collapsed stacks ("a;b;c <microseconds>" per line)."""
+    totals: Dict[str, int] = {}
+
+    def walk(frame, stack):
+        if not frame.is_synthetic_leaf:
+            stack = stack + [f"{frame.function} ({os.path.basename(frame.file_path or '')}:{frame.line_no})"]
+        if not frame.children:
+            # Self time appears as synthetic leaf frames, so leaves account for all samples
+            key = ";".join(stack)
+            totals[key] = totals.get(key, 0) + int(frame.time * 1_000_000)
+        for child in frame.children:
+            walk(child, stack)
+
+    root = session.root_frame()
+    if root:
+        walk(root, [])
+    return "".join(f"{stack} {micros}\n" for stack, micros in totals.items())
+
+
+def save_profile(profiler: Any, request: Request) -> str:
+    """
+    Stop the profiler and write its output to settings.profiling_dir.
+
+    Only the newest settings.profiling_max_files profiles are kept.
+
+    Returns:
+        File name of the saved profile
+    """
+    global _active
+    from pyinstrument.renderers import SpeedscopeRenderer
+
+    try:
+        session = profiler.stop()
+    finally:
+        _active = False
+
+    route = _SAFE_NAME.sub("_", request.url.path.strip("/")) or "root"
+    extension = PROFILE_FORMATS[settings.profiling_format]
+    name = f"{int(time.time() * 1000)}-{request.method}-{route[:80]}{extension}"
+
+    if settings.profiling_format == "speedscope":
+        content = SpeedscopeRenderer().render(session)
+    else:
+        content = _collapsed_stacks(session)
+
+    os.makedirs(settings.profiling_dir, exist_ok=True)
+    with open(os.path.join(settings.profiling_dir, name), "w") as f:
+        f.write(content)
+
+    _prune()
+    return name
+
+
+def _prune() -> None:
+    for profile in list_profiles()[settings.profiling_max_files:]:
+        try:
+            os.remove(os.path.join(settings.profiling_dir, profile["name"]))
+        except OSError:
+            pass
+
+
+def list_profiles() -> List[Dict[str, Any]]:
+    """Saved profiles, newest first."""
+    if not os.path.isdir(settings.profiling_dir):
+        return []
+
+    profiles = []
+    for entry in os.scandir(settings.profiling_dir):
+        if entry.is_file() and entry.name.endswith(tuple(PROFILE_FORMATS.values())):
+            stat = entry.stat()
+            profiles.append({"name": entry.name, "size": stat.st_size, "created_at": stat.st_mtime})
+
+    profiles.sort(key=lambda p: p["created_at"], reverse=True)
+    return profiles
+
+
+def profile_path(name: str) -> Optional[str]:
+    """Path of a saved profile, or None if the name is unknown or unsafe."""
+    if name != os.path.basename(name) or not name.endswith(tuple(PROFILE_FORMATS.values())):
+        return None
+    path = os.path.join(settings.profiling_dir, name)
+    return path if os.path.isfile(path) else None
@@ -1,39 +1,438 @@
+import multiprocessing
+import multiprocessing.connection
 import pdfplumber
-from typing import Optional
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence, Tuple
 import re
+from app.config import settings
+
+
+@dataclass
+class ParseResult:
+    text: str
+    page_count: int
+    pages_parsed: int
+    truncated: bool = False
+    truncated_reason: Optional[str] = None  # max_pages, max_chars, time_budget
+    backend: str = "pdfplumber"
+    fallback_reason: Optional[str] = None  # Why a fast backend's output was replaced
+
+
+# Signs of a broken text layer: unmapped glyph ids and replacement characters
+GARBLED_PATTERN = re.compile(r'\(cid:\d+\)|\ufffd')
+
+PDF_BACKENDS = ("pdfplumber", "pdfminer", "pypdfium2")
+
+
+def _pdfplumber_page_count(file_path: str) -> int:
+    with pdfplumber.open(file_path) as pdf:
+        return len(pdf.pages)
+
+
+def _pdfplumber_pages(file_path: str, page_numbers: List[int]):
+    with pdfplumber.open(file_path) as pdf:
+        for page_number in page_numbers:
+            page = pdf.pages[page_number]
+            # Extract text with layout preservation
+            page_text = page.extract_text(
+                x_tolerance=3,
+                y_tolerance=3,
+                layout=False
+            )
+            page.close()
+            yield page_number, page_text
+
+
+def _pdfminer_pages(file_path: str, page_numbers: List[int]):
+    """
+    pdfminer text with line grouping only.
+
+    Without LAParams pdfminer drops every line break; boxes_flow=None
+    groups characters into lines but skips the costly box ordering.
+    """
+    from io import StringIO
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+    from pdfminer.pdfpage import PDFPage
+
+    resource_manager = PDFResourceManager()
+    with open(file_path, 'rb') as fp:
+        pages = PDFPage.get_pages(fp, pagenos=set(page_numbers))
+        for page_number, page in zip(sorted(page_numbers), pages):
+            output = StringIO()
+            device = TextConverter(resource_manager, output, laparams=LAParams(boxes_flow=None))
+            PDFPageInterpreter(resource_manager, device).process_page(page)
+            device.close()
+            yield page_number, output.getvalue()
+
+
+def _pypdfium2_page_count(file_path: str) -> int:
+    import pypdfium2 as pdfium
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
+
+
+def _pypdfium2_pages(file_path: str, page_numbers: List[int]):
+    import pypdfium2 as pdfium
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        for page_number in page_numbers:
+            page = pdf[page_number]
+            text_page = page.get_textpage()
+            page_text = text_page.get_text_range()
+            text_page.close()
+            page.close()
+            yield page_number, page_text
+    finally:
+        pdf.close()
+
+
+_PAGE_COUNTERS = {
+    "pdfplumber": _pdfplumber_page_count,
+    "pdfminer": _pdfplumber_page_count,
+    "pypdfium2": _pypdfium2_page_count,
+}
+
+_PAGE_EXTRACTORS = {
+    "pdfplumber": _pdfplumber_pages,
+    "pdfminer": _pdfminer_pages,
+    "pypdfium2": _pypdfium2_pages,
+}
+
+
+def backend_available(backend: str) -> bool:
+    """Check that a PDF backend is known and its optional dependency is installed."""
+    if backend not in PDF_BACKENDS:
+        return False
+    if backend == "pypdfium2":
+        try:
+            import pypdfium2  # noqa: F401
+        except ImportError:
+            return False
+    return True
+
+
+def degraded_reason(text: str, pages_parsed: int) -> Optional[str]:
+    """
+    Judge whether text from a fast backend looks worse than pdfplumber would give.
+
+    Args:
+        text: Extracted text
+        pages_parsed: Number of pages the text came from
+
+    Returns:
+        Short reason string if the text looks degraded, None otherwise
+    """
+    stripped = text.strip()
+    if pages_parsed and len(stripped) / pages_parsed < settings.pdf_fast_min_chars_per_page:
+        return "too_little_text"
+    if not stripped:
+        return None
+
+    garbled = sum(len(m) for m in GARBLED_PATTERN.findall(stripped))
+    if garbled / len(stripped) > 0.01:
+        return "garbled_glyphs"
+
+    # Words run together when the backend drops inter-word spacing
+    spaces = stripped.count(' ') + stripped.count('\n')
+    if spaces / len(stripped) < 0.05:
+        return "missing_spaces"
+
+    # Lines run together when it drops line breaks; resume lines are short,
+    # so fewer than one break per 500 characters means headings and fields merged
+    if len(stripped) > 200 and stripped.count('\n') / len(stripped) < 0.002:
+        return "missing_line_breaks"
+
+    return None
+
+
+def extract_page_texts(
+    file_path: str,
+    page_numbers: List[int],
+    deadline: float,
+    max_chars: int,
+    backend: str = "pdfplumber"
+) -> Tuple[List[Tuple[int, str]], Optional[str]]:
+    """
+    Extract text from a range of pages, stopping at the char or time budget.
+
+    Runs in a page worker process (see _run_in_workers). The deadline is
+    checked between pages so partial text can be returned; a page that
+    runs past it is stopped by the parent killing the worker. Each page's
+    cached layout objects are released as soon as its text has been
+    extracted.
+
+    Args:
+        file_path: Path to the PDF file
+        page_numbers: Zero-based page indexes to extract, in order
+        deadline: Wall-clock time (time.time()) after which to stop
+        max_chars: Stop once this many characters have been collected
+        backend: One of PDF_BACKENDS
+
+    Returns:
+        Tuple of ([(page_number, text), ...], stop_reason or None)
+    """
+    results = []
+    chars = 0
+
+    pages = _PAGE_EXTRACTORS[backend](file_path, page_numbers)
+    try:
+        for page_number, page_text in pages:
+            if page_text:
+                results.append((page_number, page_text))
+                chars += len(page_text)
+                if chars >= max_chars:
+                    return results, "max_chars"
+
+            if time.time() > deadline and page_number != page_numbers[-1]:
+                return results, "time_budget"
+    finally:
+        # Close the document even when stopping early
+        pages.close()
+
+    return results, None
+
+
+# Seconds past the deadline a worker gets to return its partial text before it is killed
+KILL_GRACE = 1.0
+
+
+def _page_worker_main(conn) -> None:
+    """Run (func, args) requests from the parent until the pipe closes."""
+    while True:
+        try:
+            func, args = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, func(*args)))
+        except Exception as e:
+            # PDF library exceptions are not always picklable
+            conn.send((False, f"{type(e).__name__}: {e}"))
+
+
+class _PageWorker:
+    """A reusable extraction process that can be killed mid-page."""
+
+    def __init__(self):
+        self.conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(target=_page_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def close(self) -> None:
+        self.conn.close()
+        self.process.join(timeout=1)
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+
+# Idle workers kept between documents (at most settings.pdf_page_workers)
+_idle_workers: List[_PageWorker] = []
+_workers_lock = threading.Lock()
+
+
+def _acquire_worker() -> _PageWorker:
+    with _workers_lock:
+        while _idle_workers:
+            worker = _idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            worker.close()
+    return _PageWorker()
+
+
+def _release_worker(worker: _PageWorker) -> None:
+    with _workers_lock:
+        if len(_idle_workers) < settings.pdf_page_workers:
+            _idle_workers.append(worker)
+            return
+    worker.close()
+
+
+def _run_in_workers(calls: Sequence[Tuple[Callable, tuple]], deadline: float) -> List[Optional[Any]]:
+    """
+    Run calls in parallel page worker processes with a hard time limit.
+
+    Workers still busy KILL_GRACE seconds after the deadline are killed and
+    replaced, so a pathological page cannot pin a process.
+
+    Args:
+        calls: (function, args) pairs; functions must be importable module attributes
+        deadline: Wall-clock time (time.time()) the calls should finish by
+
+    Returns:
+        Each call's result, or None for calls that were killed
+
+    Raises:
+        ValueError: If a call raised or its worker died
+    """
+    workers = []
+    for func, args in calls:
+        worker = _acquire_worker()
+        workers.append(worker)
+        worker.conn.send((func, args))
+
+    results: List[Optional[Any]] = [None] * len(calls)
+    pending = {worker.conn: i for i, worker in enumerate(workers)}
+    error = None
+    try:
+        while pending:
+            timeout = max(deadline + KILL_GRACE - time.time(), 0)
+            ready = multiprocessing.connection.wait(list(pending), timeout=timeout)
+            if not ready:
+                break
+            for conn in ready:
+                i = pending.pop(conn)
+                try:
+                    ok, value = conn.recv()
+                except EOFError:
+                    # Crashed (e.g. a segfault in a native backend): don't reuse
+                    pending[conn] = i
+                    ok, value = False, "PDF worker process died"
+                if ok:
+                    results[i] = value
+                else:
+                    error = error or value
+            if error:
+                break
+    finally:
+        for worker in workers:
+            if worker.conn in pending:
+                worker.kill()
+            else:
+                _release_worker(worker)
+
+    if error:
+        raise ValueError(error)
+    return results
 
 
 class ResumeParser:
     """Service for extracting text from PDF resumes."""
 
     @staticmethod
-    def extract_text_from_pdf(file_path: str) -> str:
+    def extract_pages(file_path: str, backend: str = None, fallback: bool = True) -> ParseResult:
         """
-        Extract all text from a PDF file.
+        Extract text from a PDF within the configured page, size and time budgets.
+
+        Extraction runs in worker processes that are killed if they outlive
+        the time budget, so a malicious page cannot hang the caller.
+        Documents with more than settings.pdf_parallel_page_threshold pages
+        are split into page ranges extracted in parallel. When a budget is
+        hit, the text extracted so far is returned with truncated set. If a fast backend's output looks degraded, the
+        document is extracted again with pdfplumber; when that cannot finish
+        within the budget, the fast text is kept and marked time_budget.
 
         Args:
             file_path: Path to the PDF file
+            backend: PDF backend name (defaults to settings.pdf_backend)
+            fallback: Re-extract with pdfplumber when fast output looks degraded
 
         Returns:
-            Extracted text as a single string
+            ParseResult with the joined page text and truncation details
         """
-        text_content = []
+        backend = backend or settings.pdf_backend
+        if not backend_available(backend):
+            print(f"PDF backend '{backend}' is not available, using pdfplumber")
+            backend = "pdfplumber"
+
+        deadline = time.time() + settings.pdf_time_budget
+        result = ResumeParser._extract_with_backend(file_path, backend, deadline)
+
+        if fallback and backend != "pdfplumber":
+            reason = degraded_reason(result.text, result.pages_parsed)
+            if reason:
+                # Keep the fast pass's text if there is no budget left to replace it
+                fallback_result = None
+                if time.time() < deadline:
+                    try:
+                        fallback_result = ResumeParser._extract_with_backend(file_path, "pdfplumber", deadline)
+                    except ValueError:
+                        pass
+                if fallback_result is None:
+                    result.truncated = True
+                    result.truncated_reason = result.truncated_reason or "time_budget"
+                else:
+                    result = fallback_result
+                    result.fallback_reason = reason
+
+        return result
+
+    @staticmethod
+    def _extract_with_backend(file_path: str, backend: str, deadline: float) -> ParseResult:
+        max_chars = settings.pdf_max_chars
 
         try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    # Extract text with layout preservation
-                    page_text = page.extract_text(
-                        x_tolerance=3,
-                        y_tolerance=3,
-                        layout=False
-                    )
-                    if page_text:
-                        text_content.append(page_text)
+            (page_count,) = _run_in_workers([(_PAGE_COUNTERS[backend], (file_path,))], deadline)
+            if page_count is None:
+                raise ValueError("opening the document exceeded the time budget")
+
+            page_numbers = list(range(min(page_count, settings.pdf_max_pages)))
+            reason = "max_pages" if page_count > settings.pdf_max_pages else None
+
+            workers = settings.pdf_page_workers
+            chunks = [page_numbers]
+            if workers > 1 and len(page_numbers) > settings.pdf_parallel_page_threshold:
+                # Contiguous page ranges, one per worker
+                chunk_size = -(-len(page_numbers) // workers)
+                chunks = [
+                    page_numbers[i:i + chunk_size]
+                    for i in range(0, len(page_numbers), chunk_size)
+                ]
+
+            results = _run_in_workers(
+                [(extract_page_texts, (file_path, chunk, deadline, max_chars, backend)) for chunk in chunks],
+                deadline
+            )
+            page_texts = []
+            for result in results:
+                if result is None:
+                    # Killed while stuck on a page
+                    reason = reason or "time_budget"
+                    continue
+                chunk_texts, chunk_reason = result
+                page_texts.extend(chunk_texts)
+                reason = reason or chunk_reason
         except Exception as e:
             raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
-        return "\n\n".join(text_content)
+        page_texts.sort(key=lambda item: item[0])
+        text = "\n\n".join(page_text for _, page_text in page_texts)
+        if len(text) > max_chars:
+            text = text[:max_chars]
+            reason = reason or "max_chars"
+
+        return ParseResult(
+            text=text,
+            page_count=page_count,
+            pages_parsed=len(page_texts),
+            truncated=reason is not None,
+            truncated_reason=reason,
+            backend=backend
+        )
+
+    @staticmethod
+    def extract_text_from_pdf(file_path: str) -> str:
+        """
+        Extract all text from a PDF file.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            Extracted text as a single string
+        """
+        return ResumeParser.extract_pages(file_path).text
 
     @staticmethod
     def clean_text(text: str) -> str:
@@ -64,6 +463,20 @@ class ResumeParser:
 
         return text
 
+    def parse_document(self, file_path: str) -> ParseResult:
+        """
+        Parse a PDF resume and return cleaned text with truncation details.
+
+        Args:
+            file_path: Path to the PDF file
+
+        Returns:
+            ParseResult whose text has been cleaned
+        """
+        result = self.extract_pages(file_path)
+        result.text = self.clean_text(result.text)
+        return result
+
     def parse(self, file_path: str) -> str:
         """
         Parse a PDF resume and return cleaned text.
@@ -74,8 +487,7 @@ class ResumeParser:
         Returns:
             Cleaned extracted text
         """
-        raw_text = self.extract_text_from_pdf(file_path)
-        return self.clean_text(raw_text)
+        return self.parse_document(file_path).text
 
 
 # Singleton instance
@@ -0,0 +1,195 @@
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from app.config import settings
+
+
+# Words are lowercase alphanumerics; dots join parts of a single token (node.js)
+TOKEN_PATTERN = re.compile(r'[a-z0-9+#]+(?:\.[a-z0-9+#]+)*')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split lowercased text into the word tokens used for skill lookup."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class Skill:
+    id: str
+    name: str
+    category: Optional[str]
+    aliases: Tuple[str, ...]
+
+
+class SkillsTaxonomy:
+    """
+    Compiled skills index built from the taxonomy data file.
+
+    Every alias is tokenized and stored in a dict keyed by its token tuple,
+    so matching costs one lookup per (token, n-gram length) pair regardless
+    of how many skills the taxonomy holds. Instances are immutable; reloads
+    build a new instance and swap the reference.
+    """
+
+    def __init__(self, skills: List[Skill], version: Optional[str] = None):
+        self.version = version
+        self.skills: Dict[str, Skill] = {}
+        self._index: Dict[Tuple[str, ...], str] = {}
+        self.max_ngram = 1
+
+        for skill in skills:
+            if skill.id in self.skills:
+                raise ValueError(f"Duplicate skill id in taxonomy: {skill.id}")
+            self.skills[skill.id] = skill
+
+            for alias in skill.aliases:
+                key = tuple(tokenize(alias))
+                if not key:
+                    continue
+                existing = self._index.get(key)
+                if existing and existing != skill.id:
+                    raise ValueError(
+                        f"Alias '{alias}' maps to both '{existing}' and '{skill.id}'"
+                    )
+                self._index[key] = skill.id
+                self.max_ngram = max(self.max_ngram, len(key))
+
+    @classmethod
+    def from_file(cls, path: str) -> "SkillsTaxonomy":
+        """
+        Load and compile a taxonomy from a JSON data file.
+
+        Args:
+            path: Path to the taxonomy JSON file
+
+        Returns:
+            Compiled SkillsTaxonomy
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            raise ValueError(f"Failed to load skills taxonomy: {str(e)}")
+
+        skills = []
+        for entry in data.get("skills", []):
+            if not entry.get("id") or not entry.get("name"):
+                raise ValueError(f"Skill entry missing id or name: {entry}")
+            aliases = tuple(entry.get("aliases") or [entry["name"]])
+            skills.append(Skill(
+                id=entry["id"],
+                name=entry["name"],
+                category=entry.get("category"),
+                aliases=aliases
+            ))
+
+        return cls(skills, version=str(data.get("version", "")))
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def match_ids(self, text: str) -> Set[str]:
+        """
+        Find canonical skill ids mentioned in text.
+
+        Args:
+            text: Resume or job text (any case)
+
+        Returns:
+            Set of matched skill ids
+        """
+        tokens = tokenize(text)
+        found = set()
+
+        for i in range(len(tokens)):
+            for n in range(1, min(self.max_ngram, len(tokens) - i) + 1):
+                skill_id = self._index.get(tuple(tokens[i:i + n]))
+                if skill_id:
+                    found.add(skill_id)
+
+        return found
+
+    def match(self, text: str) -> List[Skill]:
+        """Find skills mentioned in text, one entry per canonical skill."""
+        return [self.skills[skill_id] for skill_id in self.match_ids(text)]
+
+    def categories(self) -> Dict[str, int]:
+        """Count skills per category."""
+        counts: Dict[str, int] = {}
+        for skill in self.skills.values():
+            key = skill.category or "Uncategorized"
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+
+# Shared instance, swapped atomically on reload
+_taxonomy: Optional[SkillsTaxonomy] = None
+_taxonomy_mtime: Optional[float] = None
+_last_check = 0.0
+_lock = threading.Lock()
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def reload_skills_taxonomy(path: str = None) -> SkillsTaxonomy:
+    """
+    Rebuild the taxonomy from disk and swap it in.
+
+    The new index is compiled before the swap, so concurrent extractions
+    keep using the previous taxonomy until the new one is ready. A file
+    that fails to load leaves the current taxonomy in place.
+
+    Args:
+        path: Taxonomy file path (defaults to settings.skills_taxonomy_path)
+
+    Returns:
+        The newly active SkillsTaxonomy
+    """
+    global _taxonomy, _taxonomy_mtime, _last_check
+    path = path or settings.skills_taxonomy_path
+    mtime = _file_mtime(path)
+    taxonomy = SkillsTaxonomy.from_file(path)
+
+    with _lock:
+        _taxonomy = taxonomy
+        _taxonomy_mtime = mtime
+        _last_check = time.monotonic()
+
+    return taxonomy
+
+
+def get_skills_taxonomy() -> SkillsTaxonomy:
+    """
+    Get the active taxonomy, reloading it if the data file changed.
+
+    The file's modification time is checked at most once every
+    settings.skills_taxonomy_check_interval seconds, which lets every
+    worker process pick up edits without a restart.
+    """
+    global _last_check, _taxonomy_mtime
+    if _taxonomy is None:
+        return reload_skills_taxonomy()
+
+    interval = settings.skills_taxonomy_check_interval
+    now = time.monotonic()
+    if interval > 0 and now - _last_check >= interval:
+        _last_check = now
+        mtime = _file_mtime(settings.skills_taxonomy_path)
+        if mtime is not None and mtime != _taxonomy_mtime:
+            try:
+                reload_skills_taxonomy()
+            except ValueError as e:
+                # Don't retry the same broken file on every check
+                _taxonomy_mtime = mtime
+                print(f"Skills taxonomy reload failed, keeping current version: {e}")
+
+    return _taxonomy
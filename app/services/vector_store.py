@@ -1,12 +1,27 @@
 import json
 import os
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import numpy as np
-from typing import List, Dict, Any, Optional
 from app.config import settings
+from app.services.metrics import track_stage
+
+try:
+    import fcntl
+except ImportError:  # Windows: writes are still atomic, just not serialized
+    fcntl = None
 
 
 class VectorStore:
-    """Simple file-based vector store using NumPy for similarity search."""
+    """
+    Simple file-based vector store using NumPy for similarity search.
+
+    Other processes (scripts/import_jobs.py, scripts/reextract.py) may write
+    the same files while the server runs. Each collection is reloaded when
+    its file changed on disk, before reads and inside every write, and
+    writes hold a lock file and replace the file atomically, so no process
+    saves a stale copy over another one's vectors.
+    """
 
     def __init__(self):
         """Initialize vector store with file persistence."""
@@ -16,11 +31,23 @@ class VectorStore:
         self.resumes_file = os.path.join(self.persist_dir, "resumes.json")
         self.jobs_file = os.path.join(self.persist_dir, "jobs.json")
 
+        self._files = {"resumes": self.resumes_file, "jobs": self.jobs_file}
+        self._file_stats: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
         self.resumes: Dict[str, Dict[str, Any]] = self._load_store(self.resumes_file)
         self.jobs: Dict[str, Dict[str, Any]] = self._load_store(self.jobs_file)
 
+    @staticmethod
+    def _file_stat(filepath: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(filepath)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
     def _load_store(self, filepath: str) -> Dict[str, Dict[str, Any]]:
         """Load vector store from file."""
+        self._file_stats[filepath] = self._file_stat(filepath)
         if os.path.exists(filepath):
             try:
                 with open(filepath, 'r') as f:
@@ -30,9 +57,32 @@ class VectorStore:
         return {}
 
     def _save_store(self, data: Dict[str, Dict[str, Any]], filepath: str) -> None:
-        """Save vector store to file."""
-        with open(filepath, 'w') as f:
+        """Save vector store to file (written to a temp file, then renamed)."""
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
             json.dump(data, f)
+        os.replace(tmp_path, filepath)
+        self._file_stats[filepath] = self._file_stat(filepath)
+
+    def _refresh(self, collection: str) -> None:
+        """Reload a collection if another process rewrote its file."""
+        filepath = self._files[collection]
+        if self._file_stat(filepath) != self._file_stats.get(filepath):
+            setattr(self, collection, self._load_store(filepath))
+
+    @contextmanager
+    def _writing(self, collection: str) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """
+        Lock a collection's file and yield its up-to-date dict for changes.
+
+        The caller saves with _save_store before leaving the block.
+        """
+        filepath = self._files[collection]
+        with open(f"{filepath}.lock", "w") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            self._refresh(collection)
+            yield getattr(self, collection)
 
     def _cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -55,13 +105,35 @@ class VectorStore:
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Add a resume embedding to the vector store."""
-        self.resumes[resume_id] = {
-            "embedding": embedding,
-            "metadata": metadata or {}
-        }
-        self._save_store(self.resumes, self.resumes_file)
+        with self._writing("resumes") as resumes:
+            resumes[resume_id] = {
+                "embedding": embedding,
+                "metadata": metadata or {}
+            }
+            self._save_store(resumes, self.resumes_file)
         return resume_id
 
+    def add_resumes(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Add or replace many resume embeddings with a single file write.
+
+        Args:
+            items: Dicts with resume_id, embedding and optional metadata
+
+        Returns:
+            Number of resumes written
+        """
+        if not items:
+            return 0
+        with self._writing("resumes") as resumes:
+            for item in items:
+                resumes[item["resume_id"]] = {
+                    "embedding": item["embedding"],
+                    "metadata": item.get("metadata") or {}
+                }
+            self._save_store(resumes, self.resumes_file)
+        return len(items)
+
     def add_job(
         self,
         job_id: str,
@@ -69,13 +141,35 @@ class VectorStore:
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Add a job posting embedding to the vector store."""
-        self.jobs[job_id] = {
-            "embedding": embedding,
-            "metadata": metadata or {}
-        }
-        self._save_store(self.jobs, self.jobs_file)
+        with self._writing("jobs") as jobs:
+            jobs[job_id] = {
+                "embedding": embedding,
+                "metadata": metadata or {}
+            }
+            self._save_store(jobs, self.jobs_file)
         return job_id
 
+    def add_jobs(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Add or replace many job embeddings with a single file write.
+
+        Args:
+            items: Dicts with job_id, embedding and optional metadata
+
+        Returns:
+            Number of jobs written
+        """
+        if not items:
+            return 0
+        with self._writing("jobs") as jobs:
+            for item in items:
+                jobs[item["job_id"]] = {
+                    "embedding": item["embedding"],
+                    "metadata": item.get("metadata") or {}
+                }
+            self._save_store(jobs, self.jobs_file)
+        return len(items)
+
     def find_matching_jobs(
         self,
         resume_embedding: List[float],
@@ -83,20 +177,22 @@ class VectorStore:
         min_score: float = 0.0
     ) -> List[Dict[str, Any]]:
         """Find jobs that match a resume embedding."""
-        matches = []
+        self._refresh("jobs")
+        with track_stage("vector_search"):
+            matches = []
 
-        for job_id, job_data in self.jobs.items():
-            similarity = self._cosine_similarity(resume_embedding, job_data["embedding"])
+            for job_id, job_data in self.jobs.items():
+                similarity = self._cosine_similarity(resume_embedding, job_data["embedding"])
 
-            if similarity >= min_score:
-                matches.append({
-                    "job_id": job_id,
-                    "score": similarity,
-                    "metadata": job_data.get("metadata", {})
-                })
+                if similarity >= min_score:
+                    matches.append({
+                        "job_id": job_id,
+                        "score": similarity,
+                        "metadata": job_data.get("metadata", {})
+                    })
 
-        # Sort by score descending
-        matches.sort(key=lambda x: x["score"], reverse=True)
+            # Sort by score descending
+            matches.sort(key=lambda x: x["score"], reverse=True)
 
         return matches[:limit]
 
@@ -107,46 +203,63 @@ class VectorStore:
         min_score: float = 0.0
     ) -> List[Dict[str, Any]]:
         """Find resumes that match a job embedding."""
-        matches = []
+        self._refresh("resumes")
+        with track_stage("vector_search"):
+            matches = []
 
-        for resume_id, resume_data in self.resumes.items():
-            similarity = self._cosine_similarity(job_embedding, resume_data["embedding"])
+            for resume_id, resume_data in self.resumes.items():
+                similarity = self._cosine_similarity(job_embedding, resume_data["embedding"])
 
-            if similarity >= min_score:
-                matches.append({
-                    "resume_id": resume_id,
-                    "score": similarity,
-                    "metadata": resume_data.get("metadata", {})
-                })
+                if similarity >= min_score:
+                    matches.append({
+                        "resume_id": resume_id,
+                        "score": similarity,
+                        "metadata": resume_data.get("metadata", {})
+                    })
 
-        # Sort by score descending
-        matches.sort(key=lambda x: x["score"], reverse=True)
+            # Sort by score descending
+            matches.sort(key=lambda x: x["score"], reverse=True)
 
         return matches[:limit]
 
+    @property
+    def version(self) -> str:
+        """
+        Identifier that changes whenever this store's contents change.
+
+        Built from the stat of each store file, so every process reading the
+        same files reports the same version, including after a restart.
+        """
+        self._refresh("resumes")
+        self._refresh("jobs")
+        stats = (self._file_stats.get(filepath) for filepath in self._files.values())
+        return ".".join("-".join(map(str, stat)) if stat else "0" for stat in stats)
+
     def get_resume_embedding(self, resume_id: str) -> Optional[List[float]]:
         """Get embedding for a specific resume."""
+        self._refresh("resumes")
         if resume_id in self.resumes:
             return self.resumes[resume_id]["embedding"]
         return None
 
     def get_job_embedding(self, job_id: str) -> Optional[List[float]]:
         """Get embedding for a specific job."""
+        self._refresh("jobs")
         if job_id in self.jobs:
             return self.jobs[job_id]["embedding"]
         return None
 
     def delete_resume(self, resume_id: str) -> None:
         """Delete a resume embedding."""
-        if resume_id in self.resumes:
-            del self.resumes[resume_id]
-            self._save_store(self.resumes, self.resumes_file)
+        with self._writing("resumes") as resumes:
+            if resumes.pop(resume_id, None) is not None:
+                self._save_store(resumes, self.resumes_file)
 
     def delete_job(self, job_id: str) -> None:
         """Delete a job embedding."""
-        if job_id in self.jobs:
-            del self.jobs[job_id]
-            self._save_store(self.jobs, self.jobs_file)
+        with self._writing("jobs") as jobs:
+            if jobs.pop(job_id, None) is not None:
+                self._save_store(jobs, self.jobs_file)
 
     def update_job(
         self,
@@ -155,11 +268,12 @@ class VectorStore:
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
         """Update a job embedding."""
-        self.jobs[job_id] = {
-            "embedding": embedding,
-            "metadata": metadata or {}
-        }
-        self._save_store(self.jobs, self.jobs_file)
+        with self._writing("jobs") as jobs:
+            jobs[job_id] = {
+                "embedding": embedding,
+                "metadata": metadata or {}
+            }
+            self._save_store(jobs, self.jobs_file)
 
 
 # Singleton instance (lazy loaded)
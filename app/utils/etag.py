@@ -0,0 +1,51 @@
+import hashlib
+from typing import Any
+from fastapi import Request, Response
+from app.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values a response depends on.
+
+    Args:
+        parts: Row ids, updated_at values, query parameters, store versions...
+
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the request's If-None-Match header covers this ETag.
+
+    "*" is not treated as a match: it says nothing about the version the
+    client holds, and caches revalidate with the tags they stored.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # If-None-Match uses weak comparison, so W/"x" matches "x"
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def cache_headers(etag: str) -> dict:
+    """ETag and Cache-Control headers for a cacheable GET response."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"max-age={settings.http_cache_max_age}, must-revalidate",
+    }
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match."""
+    return Response(status_code=304, headers=cache_headers(etag))
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """Attach ETag and Cache-Control headers to a full response."""
+    response.headers.update(cache_headers(etag))
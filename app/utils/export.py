@@ -0,0 +1,75 @@
+import csv
+import io
+from typing import Any, AsyncIterator, Dict, List, Sequence
+from fastapi.responses import StreamingResponse
+from app.utils.serialization import dumps_line
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+# Spreadsheets run cells starting with these as formulas
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        value = "; ".join(str(v) for v in value)
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        # Names, emails and skills come from uploaded PDFs; make them plain text
+        return "'" + value
+    return value
+
+
+async def _encode(
+    batches: AsyncIterator[Sequence[Dict[str, Any]]],
+    columns: List[str],
+    fmt: str
+) -> AsyncIterator[str]:
+    """Encode each batch of rows as one chunk of CSV or NDJSON."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(columns)
+        yield buffer.getvalue()
+
+        async for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_csv_value(row[c]) for c in columns] for row in batch)
+            yield buffer.getvalue()
+    else:
+        async for batch in batches:
+            yield "".join(dumps_line({c: row[c] for c in columns}) for row in batch)
+
+
+def export_response(
+    batches: AsyncIterator[Sequence[Dict[str, Any]]],
+    columns: List[str],
+    fmt: str,
+    filename: str
+) -> StreamingResponse:
+    """
+    Stream rows to the client as CSV or NDJSON.
+
+    Batches are written as they arrive, so memory use depends on the batch
+    size rather than on the size of the export.
+
+    Args:
+        batches: Async iterator of row-mapping batches (e.g. yield_per partitions)
+        columns: Keys to write, in order
+        fmt: "csv" or "ndjson"
+        filename: Download name without extension
+
+    Returns:
+        StreamingResponse with a Content-Disposition attachment header
+    """
+    return StreamingResponse(
+        _encode(batches, columns, fmt),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
@@ -1,9 +1,18 @@
+import asyncio
 import os
+import time
 import uuid
+import hashlib
 import aiofiles
 from fastapi import UploadFile
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from typing import Tuple
 from app.config import settings
+from app.services.metrics import observe_stage
+
+# Multipart boundaries and part headers on top of the file itself
+FORM_OVERHEAD = 64 * 1024
 
 
 class FileHandler:
@@ -44,36 +53,75 @@ class FileHandler:
         return True, ""
 
     @staticmethod
-    async def save_file(file: UploadFile) -> Tuple[str, str]:
+    async def save_file(file: UploadFile) -> Tuple[str, str, str]:
         """
-        Save uploaded file to disk.
+        Stream uploaded file to content-addressed storage.
+
+        The upload is copied in fixed-size chunks to a temporary file in the
+        upload directory, stopping as soon as the size limit is exceeded.
+        The request body as a whole is capped earlier by UploadSizeLimit.
+        The SHA-256 of the content is computed along the way and the file is
+        fsynced and renamed to <sha256><ext>, so identical uploads share one
+        copy on disk and a partial file is never visible under its final
+        name, even after a crash.
 
         Args:
             file: The uploaded file
 
         Returns:
-            Tuple of (saved_filename, file_path)
+            Tuple of (saved_filename, file_path, sha256_hex)
         """
+        start = time.perf_counter()
+        max_size = settings.max_upload_size
+        too_large = f"File too large. Maximum size: {max_size / 1024 / 1024}MB"
+
+        # Reject early when the size is already known
+        known_size = getattr(file, "size", None)
+        if known_size is not None and known_size > max_size:
+            raise ValueError(too_large)
+
         upload_dir = FileHandler.get_upload_dir()
 
-        # Generate unique filename
-        ext = os.path.splitext(file.filename)[1]
-        unique_filename = f"{uuid.uuid4()}{ext}"
-        file_path = os.path.join(upload_dir, unique_filename)
+        ext = os.path.splitext(file.filename)[1].lower()
+        temp_path = os.path.join(upload_dir, f"{uuid.uuid4()}{ext}.part")
+
+        hasher = hashlib.sha256()
+        size = 0
+
+        try:
+            async with aiofiles.open(temp_path, 'wb') as f:
+                while True:
+                    chunk = await file.read(settings.upload_chunk_size)
+                    if not chunk:
+                        break
 
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as f:
-            content = await file.read()
+                    size += len(chunk)
+                    if size > max_size:
+                        raise ValueError(too_large)
 
-            # Check file size
-            if len(content) > settings.max_upload_size:
-                raise ValueError(
-                    f"File too large. Maximum size: {settings.max_upload_size / 1024 / 1024}MB"
-                )
+                    hasher.update(chunk)
+                    await f.write(chunk)
 
-            await f.write(content)
+                # Durable before it gets its final name: 202 promises the
+                # pipeline (or restart recovery) can read the whole file
+                await f.flush()
+                await asyncio.to_thread(os.fsync, f.fileno())
 
-        return unique_filename, file_path
+            content_hash = hasher.hexdigest()
+            saved_filename = f"{content_hash}{ext}"
+            file_path = os.path.join(upload_dir, saved_filename)
+
+            if os.path.exists(file_path):
+                # Same bytes already stored
+                FileHandler.delete_file(temp_path)
+            else:
+                os.replace(temp_path, file_path)
+        except BaseException:
+            FileHandler.delete_file(temp_path)
+            raise
+
+        observe_stage("file_save", time.perf_counter() - start)
+        return saved_filename, file_path, content_hash
 
     @staticmethod
     def delete_file(file_path: str) -> bool:
@@ -96,3 +144,80 @@ class FileHandler:
 
 
 file_handler = FileHandler()
+
+
+class UploadTooLarge(Exception):
+    """Raised from the request body stream once it passes the size limit."""
+
+
+def upload_size_limit(path: str) -> int:
+    """Largest multipart request body accepted for a path."""
+    if path.rstrip("/").endswith("/resumes/bulk"):
+        return settings.max_bulk_upload_size
+    return settings.max_upload_size + FORM_OVERHEAD
+
+
+class UploadSizeLimit:
+    """
+    Reject oversized multipart uploads before the form is parsed.
+
+    Starlette reads and spools the whole multipart body before a handler
+    runs, so checks in the handler come too late to stop the transfer.
+    Requests whose Content-Length is over the limit get 413 without their
+    body being read; chunked or under-declared bodies are cut off with 413
+    as soon as the received bytes pass the limit.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        if not headers.get(b"content-type", b"").startswith(b"multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        limit = upload_size_limit(scope["path"])
+        detail = f"Request too large. Maximum size: {limit / 1024 / 1024:.1f}MB"
+        try:
+            declared = int(headers.get(b"content-length", b""))
+        except ValueError:
+            declared = None
+        if declared is not None and declared > limit:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise UploadTooLarge(detail)
+            return message
+
+        async def guarded_send(message: Message) -> None:
+            nonlocal started
+            # Whatever the app makes of the aborted body (FastAPI reports a
+            # parse error) is replaced by the 413 below
+            if exceeded and not started:
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLarge:
+            pass
+        if exceeded and not started:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
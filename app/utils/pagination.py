@@ -0,0 +1,75 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a (created_at, id) position as an opaque cursor.
+
+    Args:
+        created_at: created_at of the last row on the page
+        row_id: id of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([created_at.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(query: Select, model: Any, cursor: Optional[str], skip: int, limit: int) -> Select:
+    """
+    Order a query newest first and apply cursor or offset pagination.
+
+    With a cursor, rows strictly after the cursor position in
+    (created_at DESC, id DESC) order are returned, so the cost of a page
+    does not depend on how deep it is. Without one, skip/limit is used.
+
+    Args:
+        query: Base select
+        model: Mapped class with created_at and id columns
+        cursor: Cursor from a previous page's X-Next-Cursor header
+        skip: Offset, used only when no cursor is given
+        limit: Page size
+
+    Returns:
+        Paginated select
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit)
+
+
+def set_next_cursor(response: Response, rows: List[Any], limit: int) -> None:
+    """Set the X-Next-Cursor header when the page is full."""
+    if len(rows) == limit and rows:
+        last = rows[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
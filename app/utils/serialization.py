@@ -0,0 +1,12 @@
+from typing import Any
+import orjson
+
+
+def dumps_line(obj: Any) -> str:
+    """
+    Encode one NDJSON line with orjson.
+
+    UUIDs and datetimes are written the same way as in JSON responses
+    (datetimes as ISO 8601); other unknown types fall back to str().
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE).decode()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark NLP extraction CPU time per resume.
+
+Usage:
+    python scripts/benchmark_extractor.py [resume.txt ...] [--iterations N] [--baseline REV]
+
+Without arguments a built-in sample resume is used. Text files are read
+as-is; PDFs are run through the resume parser first.
+
+--baseline REV also times app/services/nlp_extractor.py as it was at git
+revision REV (e.g. the commit before the single-pass ParsedDocument change)
+on the same texts, and prints the CPU delta.
+"""
+
+import subprocess
+import sys
+import os
+import time
+import types
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.services.nlp_extractor import nlp_extractor, ParsedDocument
+
+SAMPLE_RESUME = """JUAN DELA CRUZ
+Phone 09123456789 Email juan.delacruz@example.com
+Summary
+Experienced line cook and barista with strong customer service skills.
+Experience
+Line Cook Jan 2019 - Present
+Naga Grill House Restaurant
+Prepared food, handled inventory management and food safety checks.
+Cashier 2016 - 2018
+SM City Naga Retail
+Operated point of sale and handled cash handling for a busy store.
+Education
+Bachelor of Science in Hospitality Management 2015
+Ateneo de Naga University
+Skills
+Cooking, baking, barista, food safety, teamwork, time management, english, bicol
+"""
+
+
+def load_texts(paths):
+    """Load resume texts from the given files (PDF or plain text)."""
+    texts = []
+    for path in paths:
+        if path.lower().endswith(".pdf"):
+            from app.services.resume_parser import resume_parser
+            texts.append(resume_parser.parse(path))
+        else:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                texts.append(f.read())
+    return texts
+
+
+def load_extractor_at(rev):
+    """The module-level nlp_extractor of app/services/nlp_extractor.py at a git revision."""
+    path = "app/services/nlp_extractor.py"
+    source = subprocess.run(
+        ["git", "show", f"{rev}:{path}"], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    module = types.ModuleType(f"nlp_extractor_baseline_{rev}")
+    # dataclasses look the defining module up in sys.modules
+    sys.modules[module.__name__] = module
+    exec(compile(source, f"{rev}:{path}", "exec"), module.__dict__)
+    return module.nlp_extractor
+
+
+def extract_cpu_time(extractor, texts, iterations):
+    """CPU seconds for extracting every text `iterations` times."""
+    start = time.process_time()
+    for _ in range(iterations):
+        for text in texts:
+            extractor.extract(text)
+    return time.process_time() - start
+
+
+def main():
+    args = sys.argv[1:]
+    iterations = 200
+    if "--iterations" in args:
+        index = args.index("--iterations")
+        iterations = int(args[index + 1])
+        del args[index:index + 2]
+    baseline = None
+    if "--baseline" in args:
+        index = args.index("--baseline")
+        baseline = args[index + 1]
+        del args[index:index + 2]
+
+    texts = load_texts(args) if args else [SAMPLE_RESUME, SAMPLE_RESUME.replace("\n", " ")]
+
+    print("=" * 50)
+    print("NagaMatch NLP Extraction Benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(texts)}  Iterations: {iterations}")
+    print()
+
+    # Tokenization alone
+    start = time.process_time()
+    for _ in range(iterations):
+        for text in texts:
+            ParsedDocument.from_text(text)
+    parse_cpu = time.process_time() - start
+
+    # Full extraction
+    extract_cpu = extract_cpu_time(nlp_extractor, texts, iterations)
+
+    total_docs = iterations * len(texts)
+    print(f"ParsedDocument.from_text: {parse_cpu / total_docs * 1000:.3f} ms CPU/doc")
+    print(f"NLPExtractor.extract:     {extract_cpu / total_docs * 1000:.3f} ms CPU/doc")
+    print(f"Throughput:               {total_docs / extract_cpu:.1f} docs/sec")
+
+    if baseline:
+        baseline_cpu = extract_cpu_time(load_extractor_at(baseline), texts, iterations)
+        print()
+        print(f"Baseline ({baseline}) extract: {baseline_cpu / total_docs * 1000:.3f} ms CPU/doc")
+        print(f"CPU per doc vs baseline:  {(extract_cpu - baseline_cpu) / baseline_cpu * 100:+.1f}%")
+    print()
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
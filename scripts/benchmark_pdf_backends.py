@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Compare PDF text backends over a local corpus of resumes.
+
+For each backend, reports pages/sec, how often its output would trigger
+the pdfplumber fallback (by reason), and how closely the fields extracted
+from its text agree with those extracted from pdfplumber's text: exact
+match rate for name and email, Jaccard similarity for skills, education
+degrees and experience titles/companies.
+
+Usage:
+    python scripts/benchmark_pdf_backends.py <pdf_dir> [--backends pdfplumber,pdfminer,pypdfium2] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Set
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.resume_parser import (
+    PDF_BACKENDS, ResumeParser, backend_available, degraded_reason
+)
+from app.services.nlp_extractor import nlp_extractor
+
+
+FIELDS = ("name", "email", "skills", "education", "experience")
+
+
+def jaccard(a, b) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _normalize(value: Any) -> str:
+    return " ".join(str(value or "").lower().split())
+
+
+def _entries(items: List[Dict[str, Any]], keys: List[str]) -> Set[tuple]:
+    return {tuple(_normalize(item.get(key)) for key in keys) for item in items}
+
+
+def field_values(text: str) -> Dict[str, Any]:
+    """Extracted fields in a comparable form."""
+    extracted = nlp_extractor.extract(ResumeParser.clean_text(text))
+    return {
+        "name": _normalize(extracted.name),
+        "email": _normalize(extracted.email),
+        "skills": set(extracted.skills),
+        "education": _entries(extracted.education, ["degree"]),
+        "experience": _entries(extracted.experience, ["title", "company"]),
+    }
+
+
+def agreement(values: Dict[str, Any], reference: Dict[str, Any]) -> Dict[str, float]:
+    """Per-field agreement of one document with its pdfplumber reference."""
+    return {
+        field: float(values[field] == reference[field]) if field in ("name", "email")
+        else jaccard(values[field], reference[field])
+        for field in FIELDS
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF text backends")
+    parser.add_argument("pdf_dir", help="Directory of PDF files")
+    parser.add_argument("--backends", default=",".join(PDF_BACKENDS), help="Comma-separated backend names")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    files = sorted(
+        os.path.join(args.pdf_dir, name)
+        for name in os.listdir(args.pdf_dir)
+        if name.lower().endswith(".pdf")
+    )
+    if not files:
+        print(f"No PDF files found in {args.pdf_dir}")
+        return
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    if "pdfplumber" not in backends:
+        backends.insert(0, "pdfplumber")  # Reference for skill agreement
+
+    print("=" * 50)
+    print("NagaMatch PDF Backend Benchmark")
+    print("=" * 50)
+    print(f"Documents: {len(files)}")
+    print()
+
+    reference_fields = {}
+    results = {}
+
+    for backend in backends:
+        if not backend_available(backend):
+            print(f"{backend}: not available, skipped")
+            continue
+
+        pages = 0
+        elapsed = 0.0
+        degraded = Counter()
+        failures = 0
+        agreements = {field: [] for field in FIELDS}
+
+        for path in files:
+            start = time.perf_counter()
+            try:
+                parsed = ResumeParser.extract_pages(path, backend=backend, fallback=False)
+            except ValueError:
+                failures += 1
+                continue
+            elapsed += time.perf_counter() - start
+            pages += parsed.pages_parsed
+
+            if backend != "pdfplumber":
+                reason = degraded_reason(parsed.text, parsed.pages_parsed)
+                if reason:
+                    degraded[reason] += 1
+
+            values = field_values(parsed.text)
+            if backend == "pdfplumber":
+                reference_fields[path] = values
+            elif path in reference_fields:
+                for field, score in agreement(values, reference_fields[path]).items():
+                    agreements[field].append(score)
+
+        results[backend] = {
+            "documents": len(files) - failures,
+            "failures": failures,
+            "pages": pages,
+            "seconds": round(elapsed, 3),
+            "pages_per_sec": round(pages / elapsed, 2) if elapsed else None,
+            "degraded": sum(degraded.values()),
+            "degraded_reasons": dict(degraded),
+            "agreement": {
+                field: round(sum(scores) / len(scores), 4)
+                for field, scores in agreements.items() if scores
+            } or None
+        }
+
+        r = results[backend]
+        print(f"{backend}:")
+        print(f"  - {r['pages_per_sec']} pages/sec ({r['pages']} pages in {r['seconds']}s)")
+        print(f"  - failures: {failures}  would fall back: {r['degraded']} {r['degraded_reasons'] or ''}")
+        if r["agreement"]:
+            print("  - agreement with pdfplumber: " + "  ".join(
+                f"{field} {score:.2%}" for field, score in r["agreement"].items()
+            ))
+        print()
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Measure the serialization changes in list_applications and the NDJSON streams.
+
+list_applications is served by two routes of an in-process FastAPI app, both
+with response_model=List[ApplicationWithDetails]:
+
+    before  builds ApplicationWithDetails models from the rows, which
+            response_model then validates a second time
+    after   returns the row mappings, validated once by response_model
+
+Requests go through httpx's ASGI transport, so the numbers include routing
+and response handling but no network or database time.
+
+ndjson_us compares encoding export / bulk upload lines with json.dumps
+against app.utils.serialization.dumps_line (orjson).
+
+Usage:
+    python scripts/benchmark_serialization.py [--rows 20,50,100] [--seconds 3] [--json out.json]
+
+The JSON output can be diffed with:
+    python scripts/benchmark_suite.py --compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import fastapi
+from fastapi import FastAPI
+
+from app.schemas.match import ApplicationWithDetails
+from app.utils.serialization import dumps_line
+from synthetic_data import generate_job
+
+SKILLS = ["Python", "SQL", "Excel", "Customer Service", "Bookkeeping", "Cooking", "Sales", "Networking"]
+
+
+def make_rows(rng: random.Random, rows: int) -> List[Dict[str, Any]]:
+    """Row mappings shaped like list_applications' query results."""
+    now = datetime.now()
+    rows_out = []
+    for i in range(rows):
+        job = generate_job(rng, SKILLS)
+        rows_out.append({
+            "id": uuid.uuid4(), "resume_id": uuid.uuid4(), "job_id": uuid.uuid4(), "job_title": job["title"],
+            "company": job["company"], "match_score": round(rng.random(), 4), "status": "applied",
+            "created_at": now - timedelta(minutes=i), "candidate_name": "Juan Dela Cruz",
+            "candidate_email": f"juan{i}@example.com"
+        })
+    return rows_out
+
+
+def build_app(data: List[Dict[str, Any]]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/before", response_model=List[ApplicationWithDetails])
+    async def before():
+        return [ApplicationWithDetails(**row) for row in data]
+
+    @app.get("/after", response_model=List[ApplicationWithDetails])
+    async def after():
+        return data
+
+    return app
+
+
+async def requests_per_sec(client, path: str, seconds: float) -> Dict[str, float]:
+    for _ in range(20):
+        (await client.get(path)).raise_for_status()
+
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        (await client.get(path)).raise_for_status()
+        count += 1
+    elapsed = time.perf_counter() - start
+    return {"requests": count, "per_sec": round(count / elapsed, 1)}
+
+
+def encode_micros(func: Callable[[], Any], seconds: float) -> float:
+    """Mean microseconds per call of an encode-only function."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        func()
+        count += 1
+    return round((time.perf_counter() - start) / count * 1_000_000, 1)
+
+
+async def run(args) -> Dict[str, Any]:
+    import httpx
+
+    rng = random.Random(args.seed)
+    results: Dict[str, Any] = {}
+
+    for rows in (int(r) for r in args.rows.split(",")):
+        data = make_rows(rng, rows)
+        transport = httpx.ASGITransport(app=build_app(data))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Same JSON either way
+            assert (await client.get("/before")).json() == (await client.get("/after")).json()
+
+            entry = {
+                "before": await requests_per_sec(client, "/before", args.seconds),
+                "after": await requests_per_sec(client, "/after", args.seconds),
+            }
+        entry["speedup"] = round(entry["after"]["per_sec"] / entry["before"]["per_sec"], 2)
+        results.setdefault("list_applications", {})[str(rows)] = entry
+        print(
+            f"  list_applications rows={rows:<4} before {entry['before']['per_sec']:>9} req/s"
+            f"  after {entry['after']['per_sec']:>9} req/s  x{entry['speedup']}"
+        )
+
+        ndjson = {
+            "json": encode_micros(lambda: "".join(json.dumps(row, default=str) + "\n" for row in data), args.seconds / 3),
+            "orjson": encode_micros(lambda: "".join(dumps_line(row) for row in data), args.seconds / 3),
+        }
+        results.setdefault("ndjson_us", {})[str(rows)] = ndjson
+        print(f"  ndjson            rows={rows:<4} json {ndjson['json']:>9} us  orjson {ndjson['orjson']:>9} us")
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "fastapi": fastapi.__version__,
+            "machine": platform.machine(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare response serialization paths")
+    parser.add_argument("--rows", default="20,50,100", help="Rows per response")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Seconds per route")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("NagaMatch Serialization Benchmark")
+    print(f"FastAPI {fastapi.__version__}")
+    print("=" * 50)
+
+    report = asyncio.run(run(args))
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
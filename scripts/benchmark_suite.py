@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Synthetic-scale benchmarks for the ingest and matching hot paths.
+
+Benchmarks:
+    extract        NLPExtractor.extract on synthetic resume texts
+    parse          ResumeParser.parse on synthetic single-page PDFs
+    embedding      EmbeddingService single and batched encode throughput
+    vector_search  VectorStore.find_matching_resumes latency and memory per scale
+    api            End-to-end requests through the ASGI app; creates and deletes
+                   job postings, so it only runs against the database and
+                   vector store given with --database-url and --persist-dir
+
+Results are written as JSON so runs can be compared:
+
+Usage:
+    python scripts/benchmark_suite.py [--scales 1000,10000,100000] [--only extract,vector_search] [--json out.json]
+    python scripts/benchmark_suite.py --only api --database-url postgresql+asyncpg://.../nagamatch_bench --persist-dir /tmp/bench-store
+    python scripts/benchmark_suite.py --compare before.json after.json
+
+Vector search keeps every vector as a Python list, so the 1M scale needs
+tens of GB of RAM; run it only on a large machine.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _api_target_parser(add_help: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(add_help=add_help)
+    parser.add_argument("--database-url", help="Database for the api benchmark (never the production one)")
+    parser.add_argument("--persist-dir", help="Vector store directory for the api benchmark")
+    return parser
+
+
+# The engine and settings are created when app modules are imported, so the
+# api benchmark's targets have to be in the environment before that
+_targets, _ = _api_target_parser(add_help=False).parse_known_args()
+if _targets.database_url and _targets.persist_dir:
+    os.environ["DATABASE_URL"] = _targets.database_url
+    os.environ["DATABASE_READ_URL"] = ""
+    os.environ["CHROMA_PERSIST_DIR"] = _targets.persist_dir
+
+from app.config import settings
+from synthetic_data import generate_job, generate_resume_text, write_text_pdf, skill_names
+
+BENCHMARKS = ("extract", "parse", "embedding", "vector_search", "api")
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """Summarize per-call durations (seconds) as milliseconds."""
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000, 3)
+
+    return {
+        "calls": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+def time_calls(func: Callable, items: List[Any]) -> Dict[str, float]:
+    """Call func once per item and report throughput and latency."""
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        func(item)
+        samples.append(time.perf_counter() - start)
+    total = sum(samples)
+    return {"per_sec": round(len(items) / total, 2) if total else None, **latency_summary(samples)}
+
+
+def bench_extract(texts: List[str]) -> Dict[str, Any]:
+    from app.services.nlp_extractor import nlp_extractor
+    return time_calls(nlp_extractor.extract, texts)
+
+
+def bench_parse(pdf_paths: List[str]) -> Dict[str, Any]:
+    from app.services.resume_parser import resume_parser
+    return time_calls(resume_parser.parse, pdf_paths)
+
+
+def bench_embedding(texts: List[str]) -> Dict[str, Any]:
+    from app.services.embedding_service import get_embedding_service
+    service = get_embedding_service()
+    service.generate_embedding("warm up")
+
+    single = time_calls(service.generate_embedding, texts[:100])
+
+    start = time.perf_counter()
+    service.generate_embeddings(texts)
+    elapsed = time.perf_counter() - start
+    return {
+        "single": single,
+        "batched": {
+            "texts": len(texts),
+            "batch_size": settings.embedding_batch_size,
+            "seconds": round(elapsed, 3),
+            "per_sec": round(len(texts) / elapsed, 2) if elapsed else None,
+        },
+    }
+
+
+def _unit_vectors(rng: random.Random, count: int, dim: int):
+    import numpy as np
+    matrix = np.random.default_rng(rng.randrange(2 ** 32)).standard_normal((count, dim), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix
+
+
+def bench_vector_search(scale: int, dim: int, queries: int, budget: float, rng: random.Random) -> Dict[str, Any]:
+    from app.services.vector_store import VectorStore
+
+    persist_dir = settings.chroma_persist_dir
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.chroma_persist_dir = tmp
+        gc.collect()
+        tracemalloc.start()
+        store = VectorStore()
+        settings.chroma_persist_dir = persist_dir
+
+        # Fill in place; add_resumes would rewrite the JSON file
+        start = time.perf_counter()
+        for offset in range(0, scale, 10_000):
+            block = _unit_vectors(rng, min(10_000, scale - offset), dim)
+            for vector in block:
+                store.resumes[str(uuid.uuid4())] = {
+                    "embedding": vector.tolist(),
+                    "metadata": {"name": "Synthetic", "skills": ""},
+                }
+        build_seconds = time.perf_counter() - start
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        samples = []
+        deadline = time.perf_counter() + budget
+        for query in _unit_vectors(rng, queries, dim):
+            start = time.perf_counter()
+            store.find_matching_resumes(job_embedding=query.tolist(), limit=settings.max_matches, min_score=0.0)
+            samples.append(time.perf_counter() - start)
+            if len(samples) >= 5 and time.perf_counter() > deadline:
+                break
+
+    return {
+        "vectors": scale,
+        "dim": dim,
+        "build_seconds": round(build_seconds, 3),
+        "memory_mb": round(memory / 1024 / 1024, 1),
+        **latency_summary(samples),
+    }
+
+
+async def _bench_api(jobs: List[Dict[str, Any]], requests: int) -> Dict[str, Any]:
+    import httpx
+    from app.main import app, lifespan
+
+    results = {}
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            start = time.perf_counter()
+            response = await client.post("/api/v1/jobs/bulk", json=jobs)
+            response.raise_for_status()
+            elapsed = time.perf_counter() - start
+            job_ids = [str(job_id) for job_id in response.json()["job_ids"]]
+            results["jobs_bulk"] = {
+                "jobs": len(jobs),
+                "seconds": round(elapsed, 3),
+                "jobs_per_sec": round(len(jobs) / elapsed, 2) if elapsed else None,
+            }
+
+            endpoints = {
+                "list_jobs": lambda i: "/api/v1/jobs?limit=20",
+                "get_job": lambda i: f"/api/v1/jobs/{job_ids[i % len(job_ids)]}",
+                "job_candidates": lambda i: f"/api/v1/jobs/{job_ids[i % len(job_ids)]}/candidates",
+            }
+            for name, path_for in endpoints.items():
+                samples = []
+                for i in range(requests):
+                    start = time.perf_counter()
+                    response = await client.get(path_for(i))
+                    samples.append(time.perf_counter() - start)
+                    response.raise_for_status()
+                total = sum(samples)
+                results[name] = {"per_sec": round(len(samples) / total, 2) if total else None, **latency_summary(samples)}
+
+            for job_id in job_ids:
+                await client.delete(f"/api/v1/jobs/{job_id}")
+
+    return results
+
+
+def bench_api(jobs: List[Dict[str, Any]], requests: int) -> Dict[str, Any]:
+    return asyncio.run(_bench_api(jobs, requests))
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    skills = skill_names()
+    texts = [generate_resume_text(rng, skills) for _ in range(args.docs)]
+    selected = set(args.only.split(",")) if args.only else set(BENCHMARKS)
+    results: Dict[str, Any] = {}
+
+    def attempt(name: str, func: Callable[[], Any]) -> None:
+        if name not in selected:
+            return
+        print(f"Running {name}...")
+        try:
+            results[name] = func()
+        except Exception as e:  # Missing model, database down, ...
+            results[name] = {"skipped": f"{type(e).__name__}: {e}"}
+        print(f"  {json.dumps(results[name])}")
+
+    attempt("extract", lambda: bench_extract(texts))
+
+    def parse():
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for i, text in enumerate(texts[:args.pdfs]):
+                path = os.path.join(tmp, f"resume_{i}.pdf")
+                write_text_pdf(text, path)
+                paths.append(path)
+            return bench_parse(paths)
+
+    attempt("parse", parse)
+    attempt("embedding", lambda: bench_embedding(texts))
+    attempt("vector_search", lambda: {
+        str(scale): bench_vector_search(scale, args.dim, args.queries, args.search_budget, rng)
+        for scale in (int(s) for s in args.scales.split(","))
+    })
+    if "api" in selected and not (args.database_url and args.persist_dir):
+        print("Skipping api: it writes job postings, pass --database-url and --persist-dir for a scratch database")
+        results["api"] = {"skipped": "no --database-url/--persist-dir"}
+    else:
+        attempt("api", lambda: bench_api([generate_job(rng, skills) for _ in range(args.api_jobs)], args.api_requests))
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+
+
+def _flatten(data: Any, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    if isinstance(data, dict):
+        for key, value in data.items():
+            flat.update(_flatten(value, f"{prefix}.{key}" if prefix else key))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        flat[prefix] = data
+    return flat
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print every numeric result side by side with the relative change."""
+    with open(before_path) as f:
+        before = _flatten(json.load(f)["results"])
+    with open(after_path) as f:
+        after = _flatten(json.load(f)["results"])
+
+    print(f"{'metric':60} {'before':>12} {'after':>12} {'change':>9}")
+    for key in sorted(set(before) | set(after)):
+        old, new = before.get(key), after.get(key)
+        change = f"{(new - old) / old:+.1%}" if old and new is not None else ""
+        print(f"{key:60} {str(old if old is not None else '-'):>12} {str(new if new is not None else '-'):>12} {change:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic-scale benchmark suite", parents=[_api_target_parser(add_help=False)])
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two result files")
+    parser.add_argument("--only", help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--scales", default="1000,10000", help="Vector counts for vector_search (e.g. 1000,10000,100000,1000000)")
+    parser.add_argument("--docs", type=int, default=1000, help="Synthetic resumes for extract/embedding")
+    parser.add_argument("--pdfs", type=int, default=100, help="Synthetic PDFs for parse")
+    parser.add_argument("--dim", type=int, default=384, help="Embedding dimension for vector_search")
+    parser.add_argument("--queries", type=int, default=50, help="Searches per scale")
+    parser.add_argument("--search-budget", type=float, default=30.0, help="Seconds of searching per scale (at least 5 queries)")
+    parser.add_argument("--api-jobs", type=int, default=200, help="Jobs created through /jobs/bulk")
+    parser.add_argument("--api-requests", type=int, default=200, help="Requests per API endpoint")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    print("=" * 50)
+    print("NagaMatch Benchmark Suite")
+    print("=" * 50)
+
+    report = run(args)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json_path}")
+
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,73 +1,225 @@
 #!/usr/bin/env python3
 """
-Debug script to check vector store contents and test matching.
+Inspect the vector store and benchmark its search.
+
+Usage:
+    python scripts/debug_vectors.py stats [--db]
+    python scripts/debug_vectors.py query [--collection resumes|jobs] [--queries 100] [--k 10]
+    python scripts/debug_vectors.py list [--collection resumes|jobs] [--limit 20]
+
+stats    Collection sizes, memory and disk footprint, dimension/dtype
+         consistency and norm statistics. With --db, also ids that exist
+         only in the vector store or only in the database.
+query    Runs a query workload (stored vectors as queries) and reports
+         p50/p95/p99 latency and recall@k of VectorStore search against an
+         exact NumPy search.
+list     Prints the first stored ids and their metadata.
 """
 
-import sys
+import argparse
+import asyncio
+import math
 import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
+
 from app.services.vector_store import get_vector_store
-from app.services.embedding_service import get_embedding_service
 
-def main():
-    print("=" * 50)
-    print("NagaMatch Vector Store Debug")
-    print("=" * 50)
+COLLECTIONS = ("resumes", "jobs")
+
+
+def _entry_bytes(entry: Dict[str, Any]) -> int:
+    """Approximate in-memory size of one stored entry (list of floats plus metadata)."""
+    embedding = entry.get("embedding") or []
+    size = sys.getsizeof(entry) + sys.getsizeof(embedding) + sum(sys.getsizeof(v) for v in embedding)
+    metadata = entry.get("metadata") or {}
+    size += sys.getsizeof(metadata) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in metadata.items())
+    return size
+
+
+def collection_stats(name: str, items: Dict[str, Dict[str, Any]], file_path: str) -> Dict[str, Any]:
+    """Sizes, consistency and norm statistics for one collection."""
+    dimensions = Counter()
+    non_numeric = 0
+    non_finite = 0
+    norms = []
+
+    for entry in items.values():
+        embedding = entry.get("embedding") or []
+        dimensions[len(embedding)] += 1
+        if not all(isinstance(v, (int, float)) for v in embedding):
+            non_numeric += 1
+            continue
+        norm = math.sqrt(sum(v * v for v in embedding))
+        if not math.isfinite(norm):
+            non_finite += 1
+            continue
+        norms.append(norm)
+
+    sample = list(items.values())[:200]
+    memory = (sum(_entry_bytes(e) for e in sample) / len(sample) * len(items)) if sample else 0
+    dim = dimensions.most_common(1)[0][0] if dimensions else 0
+
+    return {
+        "count": len(items),
+        "disk_mb": round(os.path.getsize(file_path) / 1024 / 1024, 2) if os.path.exists(file_path) else 0.0,
+        "memory_mb": round(memory / 1024 / 1024, 2),
+        "float32_mb": round(len(items) * dim * 4 / 1024 / 1024, 2),
+        "dimensions": dict(dimensions),
+        "non_numeric": non_numeric,
+        "non_finite": non_finite,
+        "zero_norm": sum(1 for n in norms if n == 0),
+        "norm_min": round(min(norms), 4) if norms else None,
+        "norm_mean": round(statistics.fmean(norms), 4) if norms else None,
+        "norm_max": round(max(norms), 4) if norms else None,
+    }
+
+
+async def orphaned_ids(store) -> Dict[str, Dict[str, int]]:
+    """Compare stored ids with the embedding_id columns in the database."""
+    from sqlalchemy import select
+    from app.database import async_session
+    from app.models import Resume, Job
+
+    report = {}
+    async with async_session() as session:
+        for name, model in (("resumes", Resume), ("jobs", Job)):
+            result = await session.execute(select(model.embedding_id).where(model.embedding_id.is_not(None)))
+            db_ids = set(result.scalars().all())
+            store_ids = set(getattr(store, name))
+            report[name] = {
+                "only_in_store": len(store_ids - db_ids),
+                "only_in_db": len(db_ids - store_ids),
+            }
+    return report
+
+
+def cmd_stats(args) -> None:
+    store = get_vector_store()
+    print(f"Persist dir: {store.persist_dir}")
     print()
 
-    vector_store = get_vector_store()
+    for name, file_path in (("resumes", store.resumes_file), ("jobs", store.jobs_file)):
+        stats = collection_stats(name, getattr(store, name), file_path)
+        print(f"{name}:")
+        print(f"  - count: {stats['count']}")
+        print(f"  - disk: {stats['disk_mb']} MB  memory: ~{stats['memory_mb']} MB (float32 matrix: {stats['float32_mb']} MB)")
+        print(f"  - dimensions: {stats['dimensions']}")
+        if stats["non_numeric"] or stats["non_finite"] or stats["zero_norm"]:
+            print(f"  - bad vectors: non_numeric={stats['non_numeric']} non_finite={stats['non_finite']} zero_norm={stats['zero_norm']}")
+        print(f"  - norm min/mean/max: {stats['norm_min']} / {stats['norm_mean']} / {stats['norm_max']}")
+        if len(stats["dimensions"]) > 1:
+            print("  ! mixed dimensions: embeddings from different models are stored together")
+        print()
+
+    if args.db:
+        try:
+            report = asyncio.run(orphaned_ids(store))
+        except Exception as e:
+            print(f"Orphan check skipped: {e}")
+        else:
+            for name, counts in report.items():
+                print(f"{name}: {counts['only_in_store']} only in vector store, {counts['only_in_db']} only in database")
 
-    # Check resumes
-    print(f"Resumes in vector store: {len(vector_store.resumes)}")
-    for resume_id, data in vector_store.resumes.items():
-        print(f"  - {resume_id}: {data.get('metadata', {})}")
 
-    print()
+def exact_top_k(matrix: np.ndarray, ids: List[str], query: np.ndarray, k: int) -> List[str]:
+    """Reference top-k by cosine similarity over a normalized matrix."""
+    norm = np.linalg.norm(query)
+    scores = matrix @ (query / norm if norm else query)
+    top = np.argpartition(-scores, min(k, len(ids) - 1))[:k]
+    return [ids[i] for i in top[np.argsort(-scores[top])]]
 
-    # Check jobs
-    print(f"Jobs in vector store: {len(vector_store.jobs)}")
-    for job_id, data in vector_store.jobs.items():
-        print(f"  - {job_id}: {data.get('metadata', {})}")
 
-    print()
+def cmd_query(args) -> None:
+    store = get_vector_store()
+    items = getattr(store, args.collection)
+    if not items:
+        print(f"No {args.collection} in vector store")
+        return
 
-    # Test matching if we have both
-    if vector_store.resumes and vector_store.jobs:
-        print("Testing matching...")
-        print()
+    ids = list(items)
+    matrix = np.asarray([items[i]["embedding"] for i in ids], dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
 
-        # Get first resume embedding
-        first_resume_id = list(vector_store.resumes.keys())[0]
-        resume_embedding = vector_store.resumes[first_resume_id]["embedding"]
+    search = store.find_matching_resumes if args.collection == "resumes" else store.find_matching_jobs
+    id_key = "resume_id" if args.collection == "resumes" else "job_id"
 
-        print(f"Finding matches for resume: {first_resume_id}")
-        print()
+    rng = random.Random(args.seed)
+    query_ids = [rng.choice(ids) for _ in range(args.queries)]
+    samples = []
+    recalls = []
 
-        # Find matches with no threshold
-        matches = vector_store.find_matching_jobs(
-            resume_embedding=resume_embedding,
-            limit=10,
-            min_score=0.0
-        )
+    for query_id in query_ids:
+        query = items[query_id]["embedding"]
+        start = time.perf_counter()
+        matches = search(query, limit=args.k, min_score=-1.0)
+        samples.append(time.perf_counter() - start)
 
-        print(f"Found {len(matches)} matches:")
-        for match in matches:
-            print(f"  - Job {match['job_id']}: score={match['score']:.4f}")
-            print(f"    Metadata: {match.get('metadata', {})}")
+        expected = set(exact_top_k(matrix, ids, np.asarray(query, dtype=np.float32), args.k))
+        found = {m[id_key] for m in matches}
+        recalls.append(len(found & expected) / len(expected) if expected else 1.0)
 
-        print()
-        print("Score interpretation:")
-        print("  0.9+ = Excellent match")
-        print("  0.8+ = Good match")
-        print("  0.7+ = Decent match")
-        print("  0.6+ = Possible match")
-        print("  <0.6 = Weak match")
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    print(f"{args.collection}: {len(ids)} vectors, {len(samples)} queries, k={args.k}")
+    print(f"  - latency p50/p95/p99: {pct(0.50):.2f} / {pct(0.95):.2f} / {pct(0.99):.2f} ms")
+    print(f"  - throughput: {len(samples) / sum(samples):.1f} queries/sec")
+    print(f"  - recall@{args.k} vs exact search: {statistics.fmean(recalls):.4f} (min {min(recalls):.4f})")
+
+
+def cmd_list(args) -> None:
+    store = get_vector_store()
+    items = getattr(store, args.collection)
+    print(f"{args.collection} in vector store: {len(items)}")
+    for item_id, data in list(items.items())[:args.limit]:
+        print(f"  - {item_id}: {data.get('metadata', {})}")
+    if len(items) > args.limit:
+        print(f"  ... {len(items) - args.limit} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and benchmark the vector store")
+    commands = parser.add_subparsers(dest="command")
+
+    stats = commands.add_parser("stats", help="Collection sizes, footprint and consistency")
+    stats.add_argument("--db", action="store_true", help="Also check ids against the database")
+
+    query = commands.add_parser("query", help="Latency and recall@k for a query workload")
+    query.add_argument("--collection", choices=COLLECTIONS, default="resumes")
+    query.add_argument("--queries", type=int, default=100)
+    query.add_argument("--k", type=int, default=10)
+    query.add_argument("--seed", type=int, default=42)
+
+    listing = commands.add_parser("list", help="Show stored ids and metadata")
+    listing.add_argument("--collection", choices=COLLECTIONS, default="resumes")
+    listing.add_argument("--limit", type=int, default=20)
+
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("NagaMatch Vector Store Debug")
+    print("=" * 50)
+    print()
+
+    if args.command == "query":
+        cmd_query(args)
+    elif args.command == "list":
+        cmd_list(args)
     else:
-        if not vector_store.resumes:
-            print("No resumes in vector store! Upload resumes first.")
-        if not vector_store.jobs:
-            print("No jobs in vector store! Create jobs first.")
+        if args.command is None:
+            args.db = False
+        cmd_stats(args)
 
     print()
     print("=" * 50)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Import job postings from a CSV file.
+
+Columns: title, company, description, requirements, location, salary_min,
+salary_max, job_type. Requirements are separated by ";".
+
+Safe to run while the server is up: the server reloads jobs.json when this
+script rewrites it, so new vectors are matched right away and are not
+overwritten by the server's next job write.
+
+Usage:
+    python scripts/import_jobs.py jobs.csv [--batch-size N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import async_session, init_db
+from app.services.job_import import parse_jobs_csv, import_jobs
+
+
+async def run(path: str, batch_size: int, dry_run: bool):
+    print("=" * 50)
+    print("NagaMatch Job Import")
+    print("=" * 50)
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        jobs, errors = parse_jobs_csv(f)
+
+    print(f"Valid rows: {len(jobs)}  Invalid rows: {len(errors)}")
+    for error in errors:
+        print(f"  - Row {error['row']}: {error['error']}")
+    print()
+
+    if dry_run or not jobs:
+        print("Nothing imported.")
+        return
+
+    await init_db()
+
+    start = time.perf_counter()
+    created = 0
+    for i in range(0, len(jobs), batch_size):
+        async with async_session() as session:
+            result = await import_jobs(session, jobs[i:i + batch_size])
+        created += result["created"]
+        print(f"  - {created}/{len(jobs)} jobs ({result['jobs_per_sec']} jobs/sec for this batch)")
+
+    elapsed = time.perf_counter() - start
+    print()
+    print(f"Imported {created} jobs in {elapsed:.1f}s ({created / elapsed:.1f} jobs/sec)")
+    print("=" * 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import job postings from CSV")
+    parser.add_argument("csv_path", help="CSV file with job postings")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Jobs per insert/vector write")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.csv_path, args.batch_size, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
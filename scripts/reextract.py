@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Re-run NLP extraction over stored resumes.
+
+Resumes whose extractor_version differs from the current NLPExtractor.version
+are streamed from Postgres with a server-side cursor, extracted in a process
+pool, and written back with bulk UPDATEs. Only resumes whose embedding text
+actually changed are re-embedded.
+
+Safe to run while the server is up: the server reloads resumes.json when
+this script rewrites it, instead of saving its older copy over it.
+
+Usage:
+    python scripts/reextract.py [--all] [--batch-size N] [--workers N] [--dry-run]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, update, or_
+from app.database import async_session
+from app.models import Resume
+from app.services.nlp_extractor import nlp_extractor
+from app.services.embedding_service import EmbeddingService, get_embedding_service
+from app.services.vector_store import get_vector_store
+
+
+def extract_batch(rows: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+    """
+    Extract fields for a batch of resumes (runs in a worker process).
+
+    Args:
+        rows: (resume_id, raw_text, old_embedding_text) tuples
+
+    Returns:
+        Update dicts with the new fields and the new embedding text
+    """
+    results = []
+    for resume_id, raw_text, old_embedding_text in rows:
+        extracted = nlp_extractor.extract(raw_text or "")
+        embedding_text = EmbeddingService.create_resume_embedding_text(
+            skills=extracted.skills,
+            experience=extracted.experience,
+            education=extracted.education
+        )
+        results.append({
+            "id": resume_id,
+            "name": extracted.name,
+            "email": extracted.email,
+            "phone": extracted.phone,
+            "skills": extracted.skills,
+            "education": extracted.education,
+            "experience": extracted.experience,
+            "embedding_text": embedding_text,
+            "embedding_changed": embedding_text != old_embedding_text
+        })
+    return results
+
+
+async def write_batch(results: List[Dict[str, Any]], version: str, dry_run: bool) -> int:
+    """Bulk-update resume rows and re-embed the ones whose text changed."""
+    changed = [r for r in results if r["embedding_changed"]]
+
+    if dry_run:
+        return len(changed)
+
+    async with async_session() as session:
+        await session.execute(
+            update(Resume),
+            [
+                {
+                    "id": r["id"],
+                    "name": r["name"],
+                    "email": r["email"],
+                    "phone": r["phone"],
+                    "skills": r["skills"],
+                    "education": r["education"],
+                    "experience": r["experience"],
+                    "extractor_version": version
+                }
+                for r in results
+            ]
+        )
+        await session.commit()
+
+    if changed:
+        embedding_service = get_embedding_service()
+        embeddings = embedding_service.generate_embeddings([r["embedding_text"] for r in changed])
+        get_vector_store().add_resumes([
+            {
+                "resume_id": str(r["id"]),
+                "embedding": embedding,
+                "metadata": {
+                    "name": r["name"],
+                    "skills": ", ".join(r["skills"]) if r["skills"] else ""
+                }
+            }
+            for r, embedding in zip(changed, embeddings)
+        ])
+
+    return len(changed)
+
+
+async def reextract(batch_size: int, workers: int, include_all: bool, dry_run: bool):
+    version = nlp_extractor.version
+
+    print("=" * 50)
+    print("NagaMatch Resume Re-extraction")
+    print("=" * 50)
+    print(f"Extractor version: {version}")
+    print(f"Batch size: {batch_size}  Workers: {workers}  Dry run: {dry_run}")
+    print()
+
+    query = select(
+        Resume.id, Resume.raw_text, Resume.skills, Resume.education, Resume.experience
+    )
+    if not include_all:
+        query = query.where(or_(
+            Resume.extractor_version.is_(None),
+            Resume.extractor_version != version
+        ))
+
+    loop = asyncio.get_running_loop()
+    processed = 0
+    reembedded = 0
+    pending = []
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        async with async_session() as session:
+            result = await session.stream(query.execution_options(yield_per=batch_size))
+
+            async for partition in result.partitions(batch_size):
+                rows = [
+                    (
+                        row.id,
+                        row.raw_text,
+                        EmbeddingService.create_resume_embedding_text(
+                            skills=row.skills or [],
+                            experience=row.experience or [],
+                            education=row.education or []
+                        )
+                    )
+                    for row in partition
+                ]
+                pending.append(loop.run_in_executor(pool, extract_batch, rows))
+
+                # Keep every worker busy while writing back finished batches
+                while len(pending) >= workers * 2:
+                    results = await pending.pop(0)
+                    reembedded += await write_batch(results, version, dry_run)
+                    processed += len(results)
+                    elapsed = time.perf_counter() - start
+                    print(f"  - {processed} resumes ({processed / elapsed:.1f} docs/sec)")
+
+        for future in pending:
+            results = await future
+            reembedded += await write_batch(results, version, dry_run)
+            processed += len(results)
+
+    elapsed = time.perf_counter() - start
+    print()
+    print(f"Processed: {processed} resumes in {elapsed:.1f}s")
+    print(f"Throughput: {processed / elapsed if elapsed else 0:.1f} docs/sec")
+    print(f"Re-embedded: {reembedded} (embedding text changed)")
+    print("=" * 50)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract stored resumes")
+    parser.add_argument("--all", action="store_true", help="Re-extract every resume, not only stale ones")
+    parser.add_argument("--batch-size", type=int, default=200, help="Rows per cursor fetch and per worker task")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="Extraction worker processes")
+    parser.add_argument("--dry-run", action="store_true", help="Extract and report without writing")
+    args = parser.parse_args()
+
+    asyncio.run(reextract(args.batch_size, args.workers, args.all, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic resumes and job postings for benchmarks.
+
+Resumes follow the section layout the extractor expects and draw their
+skills from the active skills taxonomy. Jobs are written in the CSV format
+read by scripts/import_jobs.py. PDFs are minimal single-page text PDFs, so
+no PDF library is needed to create them.
+
+Usage:
+    python scripts/synthetic_data.py <out_dir> [--resumes 1000] [--jobs 1000] [--pdfs 100] [--seed 42]
+
+Writes resumes.jsonl, jobs.csv and pdfs/*.pdf under out_dir.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+from typing import Dict, List, Optional
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.skills_taxonomy import get_skills_taxonomy
+
+FIRST_NAMES = [
+    "Juan", "Maria", "Jose", "Ana", "Mark", "Kristine", "John Paul", "Angelica",
+    "Rafael", "Patricia", "Miguel", "Camille", "Carlo", "Joy", "Ramon", "Liza"
+]
+LAST_NAMES = [
+    "Dela Cruz", "Santos", "Reyes", "Garcia", "Bautista", "Mendoza", "Villanueva",
+    "Ramos", "Aquino", "Castillo", "Navarro", "Torres", "Abad", "Bichara", "Ocampo"
+]
+TITLES = [
+    "Software Developer", "Cashier", "Line Cook", "Customer Service Representative",
+    "Accounting Clerk", "Barista", "Sales Associate", "IT Support Specialist",
+    "Data Analyst", "Graphic Designer", "Call Center Agent", "Electrician"
+]
+COMPANIES = [
+    "Naga Grill House", "SM City Naga", "Bicol Tech Solutions", "Concentrix Naga",
+    "LCC Mall", "Ateneo de Naga University", "Metro Naga Water District", "Avenue Plaza Hotel"
+]
+SCHOOLS = [
+    "Ateneo de Naga University", "University of Nueva Caceres", "Bicol University",
+    "Naga College Foundation", "Camarines Sur Polytechnic Colleges"
+]
+DEGREES = [
+    "Bachelor of Science in Information Technology", "Bachelor of Science in Accountancy",
+    "Bachelor of Science in Hospitality Management", "Bachelor of Arts in Communication",
+    "Bachelor of Science in Computer Science", "Bachelor of Science in Electrical Engineering"
+]
+LOCATIONS = ["Naga City", "Pili", "Legazpi City", "Iriga City", "Remote"]
+JOB_TYPES = ["full-time", "part-time", "contract"]
+
+
+def skill_names() -> List[str]:
+    return [skill.name for skill in get_skills_taxonomy().skills.values()]
+
+
+def generate_resume_text(rng: random.Random, skills: Optional[List[str]] = None) -> str:
+    """
+    Build one resume as plain text.
+
+    Args:
+        rng: Random generator (seeded for reproducible corpora)
+        skills: Skill names to sample from (default: the skills taxonomy)
+
+    Returns:
+        Resume text with contact, experience, education and skills sections
+    """
+    skills = skills or skill_names()
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    email = f"{first.lower().replace(' ', '')}.{last.lower().replace(' ', '')}{rng.randint(1, 999)}@example.com"
+    phone = f"09{rng.randint(100000000, 999999999)}"
+
+    lines = [f"{first.upper()} {last.upper()}", f"Phone {phone} Email {email}", "Summary"]
+    lines.append(f"{rng.choice(TITLES)} with {rng.randint(1, 15)} years of experience.")
+
+    lines.append("Experience")
+    year = 2024
+    for _ in range(rng.randint(1, 4)):
+        start = year - rng.randint(1, 4)
+        end = "Present" if year == 2024 else str(year)
+        lines.append(f"{rng.choice(TITLES)} {start} - {end}")
+        lines.append(rng.choice(COMPANIES))
+        lines.append(f"Worked with {', '.join(rng.sample(skills, 3))} on daily operations.")
+        year = start - 1
+
+    lines.append("Education")
+    lines.append(f"{rng.choice(DEGREES)} {year - rng.randint(0, 3)}")
+    lines.append(rng.choice(SCHOOLS))
+
+    lines.append("Skills")
+    lines.append(", ".join(rng.sample(skills, rng.randint(4, 12))))
+    return "\n".join(lines) + "\n"
+
+
+def generate_job(rng: random.Random, skills: Optional[List[str]] = None) -> Dict[str, object]:
+    """
+    Build one job posting with the fields of JobCreate.
+
+    Args:
+        rng: Random generator
+        skills: Skill names to sample requirements from
+
+    Returns:
+        Job posting dict
+    """
+    skills = skills or skill_names()
+    requirements = rng.sample(skills, rng.randint(3, 8))
+    salary_min = rng.randrange(12000, 60000, 1000)
+    title = rng.choice(TITLES)
+    return {
+        "title": title,
+        "company": rng.choice(COMPANIES),
+        "description": f"We are hiring a {title}. Must be comfortable with {', '.join(requirements[:3])}.",
+        "requirements": requirements,
+        "location": rng.choice(LOCATIONS),
+        "salary_min": salary_min,
+        "salary_max": salary_min + rng.randrange(2000, 30000, 1000),
+        "job_type": rng.choice(JOB_TYPES),
+    }
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_text_pdf(text: str, path: str) -> None:
+    """
+    Write text as a single-page PDF using the built-in Helvetica font.
+
+    Args:
+        text: Text to render, one PDF line per text line
+        path: Output file path
+    """
+    content = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+    content += [f"({_pdf_escape(line)}) Tj T*" for line in text.splitlines()]
+    content.append("ET")
+    stream = "\n".join(content).encode("latin-1", "replace")
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic resumes and jobs")
+    parser.add_argument("out_dir", help="Output directory")
+    parser.add_argument("--resumes", type=int, default=1000, help="Resume texts to write")
+    parser.add_argument("--jobs", type=int, default=1000, help="Job postings to write")
+    parser.add_argument("--pdfs", type=int, default=100, help="Resume PDFs to write")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    skills = skill_names()
+    os.makedirs(os.path.join(args.out_dir, "pdfs"), exist_ok=True)
+
+    with open(os.path.join(args.out_dir, "resumes.jsonl"), "w") as f:
+        for _ in range(args.resumes):
+            f.write(json.dumps({"text": generate_resume_text(rng, skills)}) + "\n")
+
+    with open(os.path.join(args.out_dir, "jobs.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[
+            "title", "company", "description", "requirements",
+            "location", "salary_min", "salary_max", "job_type"
+        ])
+        writer.writeheader()
+        for _ in range(args.jobs):
+            job = generate_job(rng, skills)
+            writer.writerow({**job, "requirements": "; ".join(job["requirements"])})
+
+    for i in range(args.pdfs):
+        write_text_pdf(generate_resume_text(rng, skills), os.path.join(args.out_dir, "pdfs", f"resume_{i:06d}.pdf"))
+
+    print(f"Wrote {args.resumes} resumes, {args.jobs} jobs and {args.pdfs} PDFs to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+import os
+import tempfile
+
+# Point the app at a throwaway SQLite database and store before app.config is imported
+_tmp_dir = tempfile.mkdtemp(prefix="nagamatch-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_tmp_dir}/test.db")
+os.environ.setdefault("CHROMA_PERSIST_DIR", os.path.join(_tmp_dir, "chroma"))
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_tmp_dir, "uploads"))
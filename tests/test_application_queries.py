@@ -0,0 +1,112 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app.api.v1.applications import get_application, list_applications
+from app.database import Base, async_session, engine, start_query_stats
+from app.models import Application, Job, Resume
+from app.schemas.match import ApplicationWithDetails
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+async def _seed():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    now = datetime.utcnow()
+    async with async_session() as session:
+        resumes = [
+            Resume(filename=f"r{i}.pdf", file_path=f"/tmp/r{i}.pdf", name=f"Candidate {i}", email=f"c{i}@example.com")
+            for i in range(3)
+        ]
+        jobs = [Job(title=f"Job {i}", company="Naga Grill House", description="...") for i in range(2)]
+        session.add_all(resumes + jobs)
+        await session.flush()
+
+        applications = [
+            Application(
+                resume_id=resume.id,
+                job_id=job.id,
+                status="applied",
+                match_score=0.5,
+                created_at=now - timedelta(minutes=i * len(jobs) + j)
+            )
+            for i, resume in enumerate(resumes)
+            for j, job in enumerate(jobs)
+        ]
+        session.add_all(applications)
+        await session.commit()
+        return [application.id for application in applications], jobs[0].id
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    return asyncio.run(_seed())
+
+
+async def _list_page(include_candidate, cursor=None, job_id=None):
+    response = Response()
+    async with async_session() as session:
+        stats = start_query_stats()
+        result = await list_applications(
+            response=response,
+            resume_id=None,
+            job_id=job_id,
+            status=None,
+            skip=0,
+            limit=2,
+            cursor=cursor,
+            include_candidate=include_candidate,
+            db=session
+        )
+    # Validated the way the route's response_model does it
+    rows = TypeAdapter(List[ApplicationWithDetails]).validate_python(result, from_attributes=True)
+    return rows, response.headers.get(NEXT_CURSOR_HEADER), stats["queries"]
+
+
+@pytest.mark.parametrize("include_candidate", [False, True])
+def test_list_applications_uses_one_query_per_page(seeded, include_candidate):
+    rows, cursor, queries = asyncio.run(_list_page(include_candidate))
+    assert len(rows) == 2
+    assert queries == 1
+    assert all(row.job_title.startswith("Job ") for row in rows)
+    assert all((row.candidate_name is not None) == include_candidate for row in rows)
+
+    # Following the cursor is still one statement per page
+    next_rows, _, queries = asyncio.run(_list_page(include_candidate, cursor=cursor))
+    assert len(next_rows) == 2
+    assert queries == 1
+    assert {row.id for row in rows}.isdisjoint(row.id for row in next_rows)
+
+
+def test_list_applications_by_job_uses_one_query(seeded):
+    _, job_id = seeded
+    rows, _, queries = asyncio.run(_list_page(True, job_id=job_id))
+    assert queries == 1
+    assert {row.job_id for row in rows} == {job_id}
+
+
+@pytest.mark.parametrize("include_candidate", [False, True])
+def test_get_application_uses_one_query(seeded, include_candidate):
+    application_ids, _ = seeded
+
+    async def fetch():
+        async with async_session() as session:
+            stats = start_query_stats()
+            result = await get_application(
+                application_id=application_ids[0],
+                include_candidate=include_candidate,
+                db=session
+            )
+        return result, stats["queries"]
+
+    application, queries = asyncio.run(fetch())
+    assert queries == 1
+    assert application.id == application_ids[0]
+    assert application.company == "Naga Grill House"
+    assert (application.candidate_email is not None) == include_candidate
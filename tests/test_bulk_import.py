@@ -0,0 +1,33 @@
+import asyncio
+import io
+import zipfile
+
+from fastapi import UploadFile
+
+from app.services.bulk_import import _save_sources
+
+PDF_BYTES = b"%PDF-1.4\n" + b"Juan Dela Cruz, Line Cook\n" * 50 + b"%%EOF\n"
+
+
+def _zip_with_corrupt_member() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("good.pdf", PDF_BYTES)
+        archive.writestr("bad.pdf", PDF_BYTES)
+    data = bytearray(buffer.getvalue())
+    # Flip a byte of bad.pdf's stored content so its CRC-32 no longer matches
+    second = data.index(PDF_BYTES, data.index(PDF_BYTES) + 1)
+    data[second + 20] ^= 0xFF
+    return bytes(data)
+
+
+def test_corrupt_zip_member_fails_without_aborting_the_import():
+    upload = UploadFile(file=io.BytesIO(_zip_with_corrupt_member()), filename="resumes.zip")
+
+    async def collect():
+        return [item async for item in _save_sources([upload])]
+
+    items = {item["filename"]: item for item in asyncio.run(collect())}
+    assert items["good.pdf"].get("content_hash")
+    assert items["bad.pdf"]["status"] == "failed"
+    assert "CRC" in items["bad.pdf"]["error"]
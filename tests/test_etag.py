@@ -0,0 +1,92 @@
+import asyncio
+
+from fastapi import Request, Response
+
+from app.api.v1.jobs import list_jobs
+from app.config import settings
+from app.database import Base, async_session, engine
+from app.models import Job
+from app.services.vector_store import VectorStore
+from app.utils.etag import etag_matches, make_etag
+
+
+def _request(if_none_match=None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": b""})
+
+
+def test_etag_matches():
+    etag = make_etag("jobs", 1)
+    assert etag == make_etag("jobs", 1)
+    assert etag != make_etag("jobs", 2)
+
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(f'W/{etag}'), etag)
+    assert etag_matches(_request(f'"other", {etag}'), etag)
+    assert not etag_matches(_request('"other"'), etag)
+    assert not etag_matches(_request(), etag)
+    # Says nothing about the client's version
+    assert not etag_matches(_request("*"), etag)
+
+
+async def _seed_job():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        job = Job(title="Line Cook", company="Naga Grill House", description="...")
+        session.add(job)
+        await session.commit()
+        return job.id
+
+
+async def _list_jobs(if_none_match=None):
+    response = Response()
+    async with async_session() as session:
+        result = await list_jobs(
+            request=_request(if_none_match),
+            response=response,
+            skip=0,
+            limit=20,
+            cursor=None,
+            location=None,
+            is_active=True,
+            db=session
+        )
+    if isinstance(result, Response):
+        return result.status_code, result.headers.get("etag")
+    return 200, response.headers.get("etag")
+
+
+def test_list_jobs_etag():
+    job_id = asyncio.run(_seed_job())
+
+    status, etag = asyncio.run(_list_jobs())
+    assert status == 200 and etag
+
+    assert asyncio.run(_list_jobs(etag)) == (304, etag)
+    assert asyncio.run(_list_jobs("*"))[0] == 200
+
+    async def update_job():
+        async with async_session() as session:
+            job = await session.get(Job, job_id)
+            job.title = "Head Cook"
+            await session.commit()
+
+    asyncio.run(update_job())
+    status, new_etag = asyncio.run(_list_jobs(etag))
+    assert status == 200
+    assert new_etag != etag
+
+
+def test_vector_store_version_is_shared_between_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "chroma_persist_dir", str(tmp_path))
+    # Two instances stand in for two workers, or one worker before and after a restart
+    first, second = VectorStore(), VectorStore()
+    assert first.version == second.version
+
+    before = first.version
+    first.add_resume("r1", [0.1, 0.2, 0.3])
+    assert first.version != before
+    assert second.version == first.version
+    assert VectorStore().version == first.version
@@ -0,0 +1,26 @@
+import asyncio
+import csv
+import io
+
+from app.utils.export import _encode
+
+
+async def _batches():
+    yield [
+        {"candidate_name": "=HYPERLINK(\"http://evil\",\"Juan\")", "email": "@SUM(A1)", "skills": ["-2+3", "Cooking"], "match_score": -0.5},
+        {"candidate_name": "Maria Santos", "email": "maria@example.com", "skills": ["Python"], "match_score": 0.8},
+        {"candidate_name": "\tTab", "email": "\rcr", "skills": ["+cmd"], "match_score": None},
+    ]
+
+
+def test_csv_export_neutralizes_formulas():
+    columns = ["candidate_name", "email", "skills", "match_score"]
+
+    async def collect():
+        return "".join([chunk async for chunk in _encode(_batches(), columns, "csv")])
+
+    header, *rows = list(csv.reader(io.StringIO(asyncio.run(collect()))))
+    assert header == columns
+    assert rows[0] == ["'=HYPERLINK(\"http://evil\",\"Juan\")", "'@SUM(A1)", "'-2+3; Cooking", "-0.5"]
+    assert rows[1] == ["Maria Santos", "maria@example.com", "Python", "0.8"]
+    assert rows[2] == ["'\tTab", "'\rcr", "'+cmd", ""]
@@ -0,0 +1,59 @@
+import pytest
+
+from app.config import settings
+from app.services.resume_parser import ParseResult, ResumeParser
+
+# Unmapped glyph ids: degraded_reason reports garbled_glyphs
+GARBLED_TEXT = "Juan Dela Cruz (cid:12)(cid:7) Cook\n" * 20
+PDFPLUMBER_TEXT = "Juan Dela Cruz\nLine Cook\n" * 20
+
+
+@pytest.fixture
+def extract_calls(monkeypatch):
+    """Fake _extract_with_backend: pypdfium2 gives garbled text, pdfplumber behaves per fallback_error."""
+    calls = []
+    state = {"fallback_error": None}
+
+    def fake_extract(file_path, backend, deadline):
+        calls.append(backend)
+        if backend == "pdfplumber":
+            if state["fallback_error"]:
+                raise state["fallback_error"]
+            return ParseResult(text=PDFPLUMBER_TEXT, page_count=1, pages_parsed=1, backend=backend)
+        return ParseResult(text=GARBLED_TEXT, page_count=1, pages_parsed=1, backend=backend)
+
+    monkeypatch.setattr(ResumeParser, "_extract_with_backend", staticmethod(fake_extract))
+    monkeypatch.setattr("app.services.resume_parser.backend_available", lambda backend: True)
+    return calls, state
+
+
+def test_degraded_text_is_replaced_by_pdfplumber(extract_calls, monkeypatch):
+    calls, _ = extract_calls
+    monkeypatch.setattr(settings, "pdf_time_budget", 30.0)
+
+    result = ResumeParser.extract_pages("resume.pdf", backend="pypdfium2")
+    assert calls == ["pypdfium2", "pdfplumber"]
+    assert result.text == PDFPLUMBER_TEXT
+    assert result.fallback_reason == "garbled_glyphs"
+
+
+def test_fallback_skipped_when_budget_is_spent(extract_calls, monkeypatch):
+    calls, _ = extract_calls
+    monkeypatch.setattr(settings, "pdf_time_budget", -1.0)
+
+    result = ResumeParser.extract_pages("resume.pdf", backend="pypdfium2")
+    assert calls == ["pypdfium2"]
+    assert result.text == GARBLED_TEXT
+    assert result.truncated and result.truncated_reason == "time_budget"
+    assert result.fallback_reason is None
+
+
+def test_failed_fallback_keeps_fast_text(extract_calls, monkeypatch):
+    calls, state = extract_calls
+    monkeypatch.setattr(settings, "pdf_time_budget", 30.0)
+    state["fallback_error"] = ValueError("opening the document exceeded the time budget")
+
+    result = ResumeParser.extract_pages("resume.pdf", backend="pypdfium2")
+    assert calls == ["pypdfium2", "pdfplumber"]
+    assert result.text == GARBLED_TEXT
+    assert result.truncated_reason == "time_budget"
@@ -0,0 +1,73 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import Response, UploadFile
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from starlette.datastructures import Headers
+
+from app.api.v1 import resumes
+from app.config import Settings
+from app.database import Base, async_session, engine
+from app.models import IngestJob
+from app.models.ingest_job import FINISHED_STATUSES
+
+PDF_BYTES = b"%PDF-1.4\n" + b"Maria Santos, Bookkeeper\n" * 50 + b"%%EOF\n"
+
+
+async def _seed_in_flight_job() -> IngestJob:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        job = IngestJob(
+            filename="first.pdf",
+            file_path="/tmp/first.pdf",
+            content_hash=hashlib.sha256(PDF_BYTES).hexdigest(),
+            status="parsing"
+        )
+        session.add(job)
+        await session.commit()
+        return job.id
+
+
+def test_concurrent_identical_upload_returns_the_queued_job(monkeypatch):
+    in_flight_id = asyncio.run(_seed_in_flight_job())
+
+    # The other upload's job lands between this request's check and its insert
+    real_in_flight_job = resumes._in_flight_job
+    checks = []
+
+    async def racing_in_flight_job(db, content_hash):
+        checks.append(content_hash)
+        if len(checks) == 1:
+            return None
+        return await real_in_flight_job(db, content_hash)
+
+    monkeypatch.setattr(resumes, "_in_flight_job", racing_in_flight_job)
+
+    async def upload():
+        file = UploadFile(
+            file=io.BytesIO(PDF_BYTES),
+            filename="second.pdf",
+            headers=Headers({"content-type": "application/pdf"})
+        )
+        async with async_session() as session:
+            result = await resumes.upload_resume(response=Response(), file=file, db=session)
+            unfinished = await session.scalar(
+                select(func.count()).select_from(IngestJob).where(IngestJob.status.notin_(FINISHED_STATUSES))
+            )
+            return result.id, unfinished
+
+    result_id, unfinished = asyncio.run(upload())
+    assert len(checks) == 2
+    assert result_id == in_flight_id
+    assert unfinished == 1
+
+
+def test_duplicate_upload_policy_rejects_unknown_values():
+    assert Settings(duplicate_upload_policy="link").duplicate_upload_policy == "link"
+    with pytest.raises(ValidationError):
+        Settings(duplicate_upload_policy="lnk")